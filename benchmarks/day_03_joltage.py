@@ -0,0 +1,56 @@
+"""Benchmark day 3's single-pass selection engine against the per-bank stack.
+
+Usage:
+    uv run python benchmarks/day_03_joltage.py [--banks N] [--length L]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "solutions"))
+
+from day_03.solution import Solution, largest_subsequence_sums  # noqa: E402
+
+
+def generate_input(banks: int, length: int, seed: int = 2025) -> str:
+    """Generate random banks of non-zero digits."""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join(rng.choice("123456789") for _ in range(length)) for _ in range(banks)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--banks", type=int, default=20_000)
+    parser.add_argument("--length", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    solution = Solution(raw_input=generate_input(args.banks, args.length))
+    banks = solution.input_lines
+
+    def reference() -> dict[int, int]:
+        return {k: sum(solution.joltage_of(bank, k) for bank in banks) for k in (2, 12)}
+
+    data = solution.raw_input.encode()
+
+    def batched() -> dict[int, int]:
+        return largest_subsequence_sums(data, (2, 12))
+
+    expected = reference()
+    assert batched() == expected, "Batched engine disagrees with reference"
+
+    print(f"{args.banks} banks of {args.length} digits, best of {args.repeat}")
+    timings = {}
+    for name, func in (("reference", reference), ("batched", batched)):
+        timings[name] = min(repeat(func, number=1, repeat=args.repeat))
+        print(f"  {name:<10} {timings[name] * 1000:10.2f} ms")
+    print(f"  speedup    {timings['reference'] / timings['batched']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
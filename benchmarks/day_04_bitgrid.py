@@ -0,0 +1,55 @@
+"""Benchmark BitGrid neighbour counting on large random grids.
+
+Runs the day 4 rule (rolls with fewer than four neighbouring rolls) once
+and then peels the grid until nothing more can be removed.
+
+Usage:
+    uv run python benchmarks/day_04_bitgrid.py [--size N] [--density D]
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from aoc2025.lib import BitGrid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--density", type=float, default=0.7)
+    args = parser.parse_args()
+
+    rng = random.Random(2025)
+    lines = [
+        "".join("@" if rng.random() < args.density else "." for _ in range(args.size))
+        for _ in range(args.size)
+    ]
+
+    start = perf_counter()
+    grid = BitGrid.from_lines(lines, on="@")
+    parsed = perf_counter()
+    storage = grid.bits.bit_length() / 8 / 1024 / 1024
+    first = grid.with_neighbours_fewer_than(4)
+    counted = perf_counter()
+
+    rounds = removed = 0
+    while removable := grid.with_neighbours_fewer_than(4):
+        grid -= removable
+        removed += len(removable)
+        rounds += 1
+    peeled = perf_counter()
+
+    print(f"{args.size}x{args.size} grid, {args.density:.0%} rolls")
+    print(f"  storage       {storage:10.2f} MB")
+    print(f"  parse         {(parsed - start) * 1000:10.2f} ms")
+    print(
+        f"  one round     {(counted - parsed) * 1000:10.2f} ms ({len(first)} accessible)"
+    )
+    print(
+        f"  peel          {(peeled - counted) * 1000:10.2f} ms ({rounds} rounds, {removed} removed)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark aoc2025.lib primitives against the ad-hoc code they replace.
+
+Usage:
+    uv run python benchmarks/lib_primitives.py
+"""
+
+import random
+from collections.abc import Callable
+from timeit import repeat
+
+from aoc2025.lib import BitSet, Grid, IntervalSet
+
+
+def best_of(func: Callable[[], object], runs: int = 5) -> float:
+    """Get the fastest of several runs in milliseconds."""
+    return min(repeat(func, number=1, repeat=runs)) * 1000
+
+
+def report(name: str, baseline: float, optimized: float) -> None:
+    print(
+        f"{name:<28} {baseline:10.2f} ms {optimized:10.2f} ms "
+        f"{baseline / optimized:8.1f}x"
+    )
+
+
+def bench_intervals(rng: random.Random) -> None:
+    ranges = []
+    for _ in range(1_000):
+        start = rng.randrange(10**12)
+        ranges.append((start, start + rng.randrange(10**9)))
+    values = [rng.randrange(10**12) for _ in range(5_000)]
+    interval_set = IntervalSet(ranges)
+
+    def linear() -> int:
+        return sum(any(a <= v <= b for a, b in ranges) for v in values)
+
+    def bisected() -> int:
+        return sum(v in interval_set for v in values)
+
+    assert linear() == bisected()
+    report("interval membership", best_of(linear), best_of(bisected))
+
+
+def bench_grid(rng: random.Random) -> None:
+    lines = ["".join(rng.choice("@.") for _ in range(300)) for _ in range(300)]
+    nested = [list(line) for line in lines]
+    grid = Grid.from_lines(lines)
+    dirs = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+    def list_of_lists() -> int:
+        total = 0
+        for y in range(300):
+            for x in range(300):
+                if nested[y][x] == "@":
+                    for dy, dx in dirs:
+                        ny, nx = y + dy, x + dx
+                        if 0 <= ny < 300 and 0 <= nx < 300 and nested[ny][nx] == "@":
+                            total += 1
+        return total
+
+    def dense_grid() -> int:
+        return sum(grid.count_neighbours(x, y, "@") for x, y in grid.find_all("@"))
+
+    def dense_grid_bulk() -> int:
+        counts = grid.neighbour_counts("@")
+        return sum(counts[y * 300 + x] for x, y in grid.find_all("@"))
+
+    assert list_of_lists() == dense_grid() == dense_grid_bulk()
+    baseline = best_of(list_of_lists)
+    report("grid neighbour counts", baseline, best_of(dense_grid))
+    report("grid neighbour counts (bulk)", baseline, best_of(dense_grid_bulk))
+
+
+def bench_bitset(rng: random.Random) -> None:
+    sets = [{rng.randrange(100_000) for _ in range(20_000)} for _ in range(20)]
+    bitsets = [BitSet(s) for s in sets]
+
+    def python_sets() -> int:
+        result: set[int] = set()
+        for s in sets:
+            result |= s
+        return len(result)
+
+    def packed() -> int:
+        result = BitSet()
+        for b in bitsets:
+            result = result | b
+        return len(result)
+
+    assert python_sets() == packed()
+    report("set union + count", best_of(python_sets), best_of(packed))
+
+
+def main() -> None:
+    rng = random.Random(2025)
+    print(f"{'':<28} {'baseline':>13} {'aoc2025.lib':>13} {'speedup':>9}")
+    bench_intervals(rng)
+    bench_grid(rng)
+    bench_bitset(rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark bulk integer parsing against per-line split/int parsing.
+
+Usage:
+    uv run python benchmarks/parsing.py [--lines N]
+"""
+
+import argparse
+import random
+from collections.abc import Callable
+from timeit import repeat
+
+from aoc2025.lib import int_array, int_rows, ints
+
+
+def best_of(func: Callable[[], object], runs: int = 5) -> float:
+    """Get the fastest of several runs in milliseconds."""
+    return min(repeat(func, number=1, repeat=runs)) * 1000
+
+
+def report(
+    name: str, per_line: Callable[[], object], bulk: Callable[[], object]
+) -> None:
+    assert list(per_line()) == list(bulk()), f"{name}: parsers disagree"  # type: ignore[call-overload]
+    baseline, optimized = best_of(per_line), best_of(bulk)
+    print(
+        f"{name:<24} {baseline:10.2f} ms {optimized:10.2f} ms "
+        f"{baseline / optimized:8.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(2025)
+
+    # Day 1: rotations like "L68"
+    rotations = "\n".join(
+        f"{rng.choice('LR')}{rng.randrange(1, 1000)}" for _ in range(args.lines)
+    )
+    lines = rotations.strip().split("\n")
+
+    def day_1_per_line() -> list[int]:
+        return [(-1 if line[0] == "L" else 1) * int(line[1:]) for line in lines]
+
+    def day_1_bulk() -> list[int]:
+        return ints(rotations.replace("L", "-").replace("R", ""))
+
+    def day_1_array() -> list[int]:
+        return int_array(rotations.replace("L", "-").replace("R", "")).tolist()
+
+    # Day 2: comma separated "a-b" ranges
+    ranges = ",".join(
+        f"{start}-{start + rng.randrange(10**6)}"
+        for start in (rng.randrange(10**10) for _ in range(args.lines))
+    )
+
+    def day_2_per_line() -> list[tuple[int, int]]:
+        result = []
+        for r in ranges.strip().split(","):
+            start_s, end_s = r.split("-")
+            result.append((int(start_s), int(end_s)))
+        return result
+
+    def day_2_bulk() -> list[tuple[int, int]]:
+        return int_rows(ranges, 2, signed=False)
+
+    # Day 5: one "a-b" range per line
+    range_lines = ranges.replace(",", "\n")
+
+    def day_5_per_line() -> list[tuple[int, ...]]:
+        return [tuple(map(int, s.split("-"))) for s in range_lines.splitlines()]
+
+    def day_5_bulk() -> list[tuple[int, ...]]:
+        return int_rows(range_lines, 2, signed=False)
+
+    print(f"{args.lines} lines, best of 5")
+    print(f"{'':<24} {'per line':>13} {'bulk':>13} {'speedup':>9}")
+    report("day 1 rotations", day_1_per_line, day_1_bulk)
+    report("day 1 rotations (array)", day_1_per_line, day_1_array)
+    report("day 2 ranges", day_2_per_line, day_2_bulk)
+    report("day 5 ranges", day_5_per_line, day_5_bulk)
+
+
+if __name__ == "__main__":
+    main()
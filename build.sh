@@ -11,5 +11,8 @@ uv sync
 # Collect static files
 uv run python src/aoc2025/web/manage.py collectstatic --no-input
 
+# Highlight solutions and render READMEs ahead of the first request
+uv run python src/aoc2025/web/manage.py build_fragments
+
 # Run migrations
 uv run python src/aoc2025/web/manage.py migrate
@@ -0,0 +1,26 @@
+"""Gunicorn configuration for the showcase.
+
+Prepares the directory that ``prometheus_client`` uses to combine metrics
+from all worker processes when ``PROMETHEUS_MULTIPROC_DIR`` is set.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+
+def on_starting(server: Any) -> None:
+    """Start from an empty metrics directory so old samples are not reported."""
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        Path(multiproc_dir).mkdir(parents=True, exist_ok=True)
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """Drop the live samples of a worker that exited."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,5 +1,6 @@
 """Solution for Advent of Code 2025 - Day 1."""
 
+from aoc2025.lib import ints
 from aoc2025.models import SolutionBase
 
 
@@ -9,15 +10,18 @@ class Solution(SolutionBase):
     day = 1
     year = 2025
 
+    def moves(self) -> list[int]:
+        """Parse the rotations into signed click counts (left is negative)."""
+        # Left turns become negative numbers so the whole input parses in one pass
+        return ints(self.raw_input.replace("L", "-").replace("R", ""))
+
     def part_1(self) -> int | str:
         """Solve part 1."""
         current_pos = 50
         zero_count = 0
 
-        for line in self.input_lines:
-            direction = -1 if line[0] == "L" else 1
-            click_count = int(line[1:])
-            current_pos = (current_pos + click_count * direction) % 100
+        for delta in self.moves():
+            current_pos = (current_pos + delta) % 100
             if current_pos == 0:
                 zero_count += 1
 
@@ -28,10 +32,7 @@ class Solution(SolutionBase):
         current_pos = 50
         pass_zero_count = 0
 
-        for line in self.input_lines:
-            direction = -1 if line[0] == "L" else 1
-            click_count = int(line[1:])
-            delta = click_count * direction
+        for delta in self.moves():
             start = current_pos
             end = start + delta
 
@@ -1,6 +1,14 @@
 """Solution for Advent of Code 2025 - Day 2."""
 
+from aoc2025.memo import memoize
 from aoc2025.models import SolutionBase
+from aoc2025.parallel import split_ranges
+
+
+@memoize(maxsize=64)
+def pattern_lengths(digits: int) -> tuple[int, ...]:
+    """Get the lengths of patterns that fill a number by repeating 2+ times."""
+    return tuple(k for k in range(1, digits // 2 + 1) if digits % k == 0)
 
 
 class Solution(SolutionBase):
@@ -11,26 +19,31 @@ class Solution(SolutionBase):
 
     def parse_ranges(self) -> list[tuple[int, int]]:
         """Parse 'a-b,c-d,...' into a list of ranges."""
-        ranges = []
-        for r in self.raw_input.strip().split(","):
-            start_s, end_s = r.split("-")
-            ranges.append((int(start_s), int(end_s)))
-        return ranges
+        return self.int_rows(2, signed=False)
 
     def part_1(self) -> int | str:
         """Solve part 1."""
+        # Ranges are independent, so balanced pieces of them run on all cores
+        chunks = split_ranges(self.parse_ranges())
         total = 0
-        for start, end in self.parse_ranges():
-            for num in range(start, end + 1):
-                if self.has_identical_halves(num):
-                    print(f"Invalid ID: {num}")
-                    total += num
+        for invalid_ids in self.parallel_map(Solution.identical_halves_in, chunks):
+            for num in invalid_ids:
+                self.debug("Invalid ID: %d", num, level=2)
+                total += num
 
         return total
 
-    def has_identical_halves(self, num: int) -> bool:
-        """Check if the given ID number consists of two identical halves."""
-        s = str(num)
+    def identical_halves_in(self, ranges: list[tuple[int, int]]) -> list[int]:
+        """Get the IDs in the ranges that consist of two identical halves."""
+        return [
+            num
+            for start, end in ranges
+            for num in range(start, end + 1)
+            if self.has_identical_halves(str(num))
+        ]
+
+    def has_identical_halves(self, s: str) -> bool:
+        """Check if an ID consists of two identical halves."""
         n = len(s)
         # Check if length is even
         if n % 2 != 0:
@@ -42,28 +55,36 @@ class Solution(SolutionBase):
 
     def part_2(self) -> int | str:
         """Solve part 2."""
+        chunks = split_ranges(self.parse_ranges())
         total = 0
-        for start, end in self.parse_ranges():
-            for num in range(start, end + 1):
-                if self.has_repeating_patterns(num, start, end):
-                    print(f"Invalid ID: {num}")
-                    total += num
+        for invalid_ids in self.parallel_map(Solution.repeating_patterns_in, chunks):
+            for num in invalid_ids:
+                self.debug("Invalid ID: %d", num, level=2)
+                total += num
 
         return total
 
-    def has_repeating_patterns(self, num: int, start: int, end: int) -> bool:
-        """Check if the given ID number consists of two or more repeating patterns."""
-        s = str(num)
+    def repeating_patterns_in(self, ranges: list[tuple[int, int]]) -> list[int]:
+        """Get the IDs in the ranges that consist of repeating patterns."""
+        invalid_ids: list[int] = []
+        for start, end in ranges:
+            for digits in range(len(str(start)), len(str(end)) + 1):
+                # Only lengths dividing the digit count can tile an ID, so they
+                # are looked up once for all IDs with that many digits
+                lengths = pattern_lengths(digits)
+                low = max(start, 10 ** (digits - 1))
+                high = min(end, 10**digits - 1)
+                invalid_ids.extend(
+                    num
+                    for num in range(low, high + 1)
+                    if self.has_repeating_patterns(str(num), lengths)
+                )
+        return invalid_ids
+
+    def has_repeating_patterns(self, s: str, lengths: tuple[int, ...]) -> bool:
+        """Check if an ID consists of a pattern of one of the lengths repeated."""
         n = len(s)
-        patterns = []
-        for k in range(1, n + 1):
-            p = s[:k]
-            number_of_repeats = n // k
-            if p * number_of_repeats == s:
-                if number_of_repeats > 1 and num in range(start, end + 1):
-                    patterns.append(p)
-
-        return len(patterns) > 0
+        return any(s[:k] * (n // k) == s for k in lengths)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,64 @@
 """Solution for Advent of Code 2025 - Day 3."""
 
+from collections.abc import Iterable
+
 from aoc2025.models import SolutionBase
 
+# Longest digit string int() converts in one go (sys.get_int_max_str_digits)
+_MAX_STR_DIGITS = 4000
+
+
+def digits_to_int(digits: bytes | bytearray) -> int:
+    """Convert ASCII digits to an int, also beyond int()'s length limit."""
+    value = 0
+    for i in range(0, len(digits), _MAX_STR_DIGITS):
+        chunk = digits[i : i + _MAX_STR_DIGITS]
+        value = value * 10 ** len(chunk) + int(chunk)
+    return value
+
+
+def largest_subsequence_sums(data: bytes, ks: Iterable[int]) -> dict[int, int]:
+    """Sum the largest k-digit subsequences of all banks, for every k at once.
+
+    The banks are read straight from the raw input bytes, one bank per line,
+    and every k is computed while a bank is at hand, so the input is walked
+    once however many k there are. The largest subsequence is picked with a
+    monotonic stack over the digit bytes, which compare like the digits they
+    stand for: a digit drops every smaller one before it while digits may
+    still be dropped, and the first k left over are the answer. Each digit is
+    pushed and popped at most once, so a bank costs O(n) for each k.
+
+    Args:
+        data: Banks of digits, separated by newlines
+        ks: Subsequence lengths to sum
+
+    Returns:
+        The sum for each k
+
+    Raises:
+        ValueError: If a bank has fewer than k digits or holds anything
+            other than digits
+    """
+    sums = dict.fromkeys(ks, 0)
+    for bank in data.split(b"\n"):
+        n = len(bank)
+        if not n:
+            continue
+        if not bank.isdigit():
+            raise ValueError(f"Bank is not all digits: {bank!r}")
+        for k in sums:
+            if k > n:
+                raise ValueError(f"Cannot pick {k} digits from a bank of {n}")
+            drops = n - k
+            stack = bytearray()
+            for digit in bank:
+                while drops and stack and stack[-1] < digit:
+                    stack.pop()
+                    drops -= 1
+                stack.append(digit)
+            sums[k] += digits_to_int(stack[:k])
+    return sums
+
 
 class Solution(SolutionBase):
     """Solution for day 3."""
@@ -11,16 +68,13 @@ class Solution(SolutionBase):
 
     def part_1(self) -> int | str:
         """Solve part 1."""
-        total = 0
-        for bank in self.input_lines:
-            # Parse each line
-            bank_joltage = self.joltage_of(bank, 2)
-            total += bank_joltage
-
-        return total
+        return largest_subsequence_sums(self.raw_input.strip().encode(), (2,))[2]
 
     def joltage_of(self, bank: str, num_batteries_to_combine: int) -> int:
-        """Get the joltage of a battery given its string representation."""
+        """Get the joltage of a battery given its string representation.
+
+        Reference implementation using a monotonic stack, one bank at a time.
+        """
         batteries = [int(joltage) for joltage in bank]
         selected_batteries: list[int] = []
         num_batteries = len(batteries)
@@ -51,13 +105,7 @@ class Solution(SolutionBase):
 
     def part_2(self) -> int | str:
         """Solve part 2."""
-        total = 0
-        for bank in self.input_lines:
-            # Parse each line
-            bank_joltage = self.joltage_of(bank, 12)
-            total += bank_joltage
-
-        return total
+        return largest_subsequence_sums(self.raw_input.strip().encode(), (12,))[12]
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Solution for Advent of Code 2025 - Day 4."""
 
+from aoc2025.lib import BitGrid
 from aoc2025.models import SolutionBase
 
 
@@ -11,69 +12,38 @@ class Solution(SolutionBase):
 
     def part_1(self) -> int | str:
         """Solve part 1."""
-        grid = [list(line) for line in self.input_lines]
-        coords = self.coordinates_with_less_than_four_neighbors(grid)
-        return len(coords)
+        grid = BitGrid.from_lines(self.input_lines, on="@")
+        return len(self.accessible_rolls(grid))
 
     def part_2(self) -> int | str:
         """Solve part 2."""
-        grid = [list(line) for line in self.input_lines]
+        grid = BitGrid.from_lines(self.input_lines, on="@")
 
         total_remove_count = 0
         remove_count = -1
         while remove_count != 0:
-            print("-------------------------------------")
-            self.print_grid(grid)
-            coords_to_remove = self.coordinates_with_less_than_four_neighbors(grid)
-            remove_count = len(coords_to_remove)
-            print(f"Removing {remove_count} rolls of paper...")
-            grid = self.remove_rolls_from_grid(grid, coords_to_remove)
+            self.debug_grid(grid)
+            rolls_to_remove = self.accessible_rolls(grid)
+            remove_count = len(rolls_to_remove)
+            self.debug("Removing %d rolls of paper...", remove_count)
+            grid -= rolls_to_remove
             total_remove_count += remove_count
 
         return total_remove_count
 
-    def coordinates_with_less_than_four_neighbors(
-        self, grid: list[list[str]]
-    ) -> list[tuple[int, int]]:
-        """Find coordinates with less than four neighboring '@' characters."""
-        # grid[row][col]
-        height, width = len(grid), len(grid[0])
+    def accessible_rolls(self, grid: BitGrid) -> BitGrid:
+        """Find rolls of paper with less than four neighboring rolls.
 
-        # Possible directions to check neighbors
-        dirs = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+        All cells are checked at once by counting neighbours on the packed
+        bits of the whole grid.
+        """
+        return grid.with_neighbours_fewer_than(4)
 
-        coordinates_with_less_than_four_neighbors = []
-        for y in range(height):
-            for x in range(width):
-                # Only consider coordinates with a roll of paper ('@')
-                if grid[y][x] == "@":
-                    neighbor_count = 0
-                    for dy, dx in dirs:
-                        ny = y + dy
-                        nx = x + dx
-                        # Check bounds and if neighbor is "@"
-                        if 0 <= ny < height and 0 <= nx < width and grid[ny][nx] == "@":
-                            neighbor_count += 1
-
-                    if neighbor_count < 4:
-                        coordinates_with_less_than_four_neighbors.append((x, y))
-
-        return coordinates_with_less_than_four_neighbors
-
-    def remove_rolls_from_grid(
-        self, grid: list[list[str]], coords_of_rolls_to_remove: list[tuple[int, int]]
-    ) -> list[list[str]]:
-        """Remove rolls of paper from the grid at specified coordinates."""
-        for x, y in coords_of_rolls_to_remove:
-            grid[y][x] = "."
-        return grid
-
-    def print_grid(self, grid: list[list[str]]) -> None:
-        """Print the grid to the console."""
-        height, width = len(grid), len(grid[0])
-        print(f"Grid size {width}x{height}")
-        for row in grid:
-            print("".join(row))
+    def debug_grid(self, grid: BitGrid) -> None:
+        """Show the grid in the debug output (with -vv)."""
+        self.debug("-------------------------------------", level=2)
+        self.debug("Grid size %dx%d", grid.width, grid.height, level=2)
+        self.debug(lambda: grid.render(on="@"), level=2)
 
 
 if __name__ == "__main__":
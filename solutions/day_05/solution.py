@@ -1,5 +1,9 @@
 """Solution for Advent of Code 2025 - Day 5."""
 
+import random
+
+from aoc2025.implementations import implementation
+from aoc2025.lib import IntervalSet, int_rows, positive_ints
 from aoc2025.models import SolutionBase
 
 
@@ -11,6 +15,15 @@ class Solution(SolutionBase):
 
     def part_1(self) -> int | str:
         """Solve part 1."""
+        # Merged ranges make every lookup a binary search
+        fresh = IntervalSet(self.ingredient_ranges())
+        return sum(
+            1 for ingredient in self.available_ingredients() if ingredient in fresh
+        )
+
+    @implementation(1, "scan", reference=True)
+    def part_1_scan(self) -> int | str:
+        """Solve part 1 by checking every range for every ingredient."""
         ingredient_ranges = self.ingredient_ranges()
         available_ingredients = self.available_ingredients()
 
@@ -26,28 +39,38 @@ class Solution(SolutionBase):
         """Solve part 2."""
         ingredient_ranges = self.ingredient_ranges()
         merged_ranges = self.merge_overlapping_ranges(ingredient_ranges)
-        print(f"Merged ranges: {merged_ranges}")
+        self.debug("Merged ranges: %s", merged_ranges)
         count = 0
         for start, end in merged_ranges:
             count += end - start + 1
 
         return count
 
+    @implementation(2, "interval_set")
+    def part_2_interval_set(self) -> int | str:
+        """Solve part 2 with IntervalSet (slower here than merging by hand)."""
+        return IntervalSet(self.ingredient_ranges()).size
+
+    @classmethod
+    def generate_input(cls, rng: random.Random, size: int) -> str:
+        """Generate ``size`` overlapping ranges and ``size`` ingredient IDs."""
+        span = 10**12
+        # Long enough ranges that many of them overlap or touch
+        max_length = span // max(size, 1) * 4
+        ranges = []
+        for _ in range(size):
+            start = rng.randrange(span)
+            ranges.append(f"{start}-{start + rng.randrange(max_length)}")
+        ingredients = [str(rng.randrange(span)) for _ in range(size)]
+        return "\n".join(ranges) + "\n\n" + "\n".join(ingredients) + "\n"
+
     def ingredient_ranges(self) -> list[tuple[int, int]]:
         groups = self.raw_input.strip().split("\n\n")
-        ingredient_ranges_input = groups[0].splitlines()
-        ingredient_ranges: list[tuple[int, int]] = [
-            tuple(map(int, s.split("-"))) for s in ingredient_ranges_input
-        ]
-        return ingredient_ranges
+        return int_rows(groups[0], 2, signed=False)
 
     def available_ingredients(self) -> list[int]:
         groups = self.raw_input.strip().split("\n\n")
-        available_ingredients_input = groups[1].splitlines()
-        available_ingredients = [
-            int(ingredient) for ingredient in available_ingredients_input
-        ]
-        return available_ingredients
+        return positive_ints(groups[1])
 
     def in_any_range(self, n: int, ranges: list[tuple[int, int]]) -> bool:
         """Check if number is in any of the given ranges."""
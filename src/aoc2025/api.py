@@ -1,8 +1,9 @@
 """AOC API client for downloading inputs and submitting answers."""
 
-from datetime import UTC, datetime
+import re
+import time
+from collections.abc import Callable
 from pathlib import Path
-from time import sleep
 from typing import Literal
 
 import requests
@@ -10,27 +11,71 @@ from bs4 import BeautifulSoup
 from rich.console import Console
 
 from .config import settings
+from .leaderboard import CachedLeaderboard, Leaderboard, LeaderboardCache
+from .ledger import AnswerLedger
 from .models import SubmissionResponse
+from .puzzles import PuzzleCache, PuzzlePage, parse_puzzle_page
+from .unlock import sleep_until, unlock_time
 
 console = Console()
 
+# "You have 1m 5s left to wait" after submitting too soon
+WAIT_LEFT_PATTERN = re.compile(r"(?:(\d+)m\s*)?(\d+)s\s+left to wait")
+# "please wait one minute" / "please wait 5 minutes" after a wrong answer
+WAIT_MINUTES_PATTERN = re.compile(r"wait (one|\d+) minutes?")
+
+# "your answer is too high" / "your answer is too low"
+HINT_PATTERN = re.compile(r"your answer is too (high|low)")
+
+# Network retries wait 1, 2, 4, ... seconds between attempts
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+
 
 class AOCClient:
     """Client for interacting with Advent of Code website."""
 
-    BASE_URL = "https://adventofcode.com"
+    def __init__(
+        self,
+        session_cookie: str | None = None,
+        year: int = 2025,
+        base_url: str | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        ledger: AnswerLedger | None = None,
+    ):
+        """Initialize AOC client.
 
-    def __init__(self, session_cookie: str | None = None, year: int = 2025):
-        """Initialize AOC client."""
+        Args:
+            session_cookie: AOC session cookie (defaults to settings)
+            year: Puzzle year
+            base_url: Server to talk to, e.g. a local stand-in for testing
+                (defaults to ``settings.base_url``)
+            clock: Function returning the current Unix time
+            sleep: Function used for all waiting, so tests can skip it
+            ledger: Earlier verdicts; answers it can judge are not submitted,
+                and new verdicts are added to it
+        """
         self.session_cookie = session_cookie or settings.session_cookie
         self.year = year
-        self.cookies = {"session": self.session_cookie}
+        self.base_url = (base_url or settings.base_url).rstrip("/")
+        self.clock = clock
+        self.sleep = sleep
+        self.ledger = ledger
+        # One pooled session keeps the connection alive between requests
+        self.session = requests.Session()
+        if self.session_cookie:
+            self.session.cookies.set("session", self.session_cookie)
 
     def _get_url(self, day: int, endpoint: str = "") -> str:
         """Get URL for a specific day and endpoint."""
-        base = f"{self.BASE_URL}/{self.year}/day/{day}"
+        base = f"{self.base_url}/{self.year}/day/{day}"
         return f"{base}/{endpoint}" if endpoint else base
 
+    def _retry_delay(self, attempt: int) -> float:
+        """Get the backoff before retrying after a failed attempt (0-based)."""
+        return RETRY_BASE_DELAY * 2**attempt
+
     def download_input(
         self, day: int, output_path: Path | None = None, wait_for_unlock: bool = False
     ) -> str:
@@ -55,9 +100,9 @@ class AOCClient:
 
         url = self._get_url(day, "input")
 
-        for attempt in range(3):
+        for attempt in range(RETRY_ATTEMPTS):
             try:
-                response = requests.get(url, cookies=self.cookies, timeout=10)
+                response = self.session.get(url, timeout=10)
                 response.raise_for_status()
 
                 input_text = response.text
@@ -72,15 +117,160 @@ class AOCClient:
                 return input_text
 
             except requests.RequestException as e:
-                if attempt < 2:
+                if attempt < RETRY_ATTEMPTS - 1:
                     console.print(
-                        f"[yellow]Download failed (attempt {attempt + 1}/3), retrying...[/yellow]"
+                        f"[yellow]Download failed (attempt {attempt + 1}/{RETRY_ATTEMPTS}), retrying...[/yellow]"
                     )
-                    sleep(2)
+                    self.sleep(self._retry_delay(attempt))
                 else:
                     raise ConnectionError(f"Failed to download input: {e}") from e
 
-        raise ConnectionError("Failed to download input after 3 attempts")
+        raise ConnectionError(
+            f"Failed to download input after {RETRY_ATTEMPTS} attempts"
+        )
+
+    def fetch_puzzle(
+        self, day: int, cache: PuzzleCache | None = None, refresh: bool = False
+    ) -> PuzzlePage:
+        """Get a day's puzzle description, fetching it only when needed.
+
+        A cached page is returned as is unless ``refresh`` is set. Refreshing
+        sends the cached ``ETag``/``Last-Modified`` validators, so an
+        unchanged page costs a ``304 Not Modified`` instead of a download.
+        Part 2 only appears once part 1 is solved, which is when a refresh
+        is worth it. Fetching works without a session cookie, but then
+        only shows part 1.
+
+        Args:
+            day: Day number (1-25)
+            cache: Where pages are kept (defaults to ``PuzzleCache()``)
+            refresh: Revalidate a cached page with the server
+
+        Returns:
+            The cached or freshly fetched page
+        """
+        if not 1 <= day <= 25:
+            raise ValueError(f"Day must be between 1 and 25, got {day}")
+
+        cache = cache or PuzzleCache()
+        cached = cache.get(day, self.year)
+        if cached is not None and not refresh:
+            return cached
+
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                response = self.session.get(
+                    self._get_url(day), headers=headers, timeout=10
+                )
+                if response.status_code == 304 and cached is not None:
+                    page = cached.model_copy(update={"fetched_at": self.clock()})
+                else:
+                    response.raise_for_status()
+                    page = parse_puzzle_page(
+                        response.text, day, self.year, self.base_url
+                    )
+                    page.etag = response.headers.get("ETag")
+                    page.last_modified = response.headers.get("Last-Modified")
+                    page.fetched_at = self.clock()
+                cache.save(page)
+                return page
+
+            except requests.RequestException as e:
+                if attempt < RETRY_ATTEMPTS - 1:
+                    console.print(
+                        f"[yellow]Fetching puzzle failed (attempt {attempt + 1}/{RETRY_ATTEMPTS}), retrying...[/yellow]"
+                    )
+                    self.sleep(self._retry_delay(attempt))
+                else:
+                    raise ConnectionError(f"Failed to fetch puzzle: {e}") from e
+
+        raise ConnectionError(f"Failed to fetch puzzle after {RETRY_ATTEMPTS} attempts")
+
+    def fetch_leaderboard(
+        self,
+        leaderboard_id: str | None = None,
+        cache: LeaderboardCache | None = None,
+    ) -> CachedLeaderboard:
+        """Get a private leaderboard, fetching it at most every 15 minutes.
+
+        A cached copy younger than ``REFRESH_INTERVAL`` is returned without a
+        request. Older copies are revalidated with ``If-None-Match`` /
+        ``If-Modified-Since``, so an unchanged leaderboard costs a 304.
+
+        Args:
+            leaderboard_id: Leaderboard to fetch (defaults to
+                ``settings.leaderboard_id``; the owner's user ID)
+            cache: Where leaderboards are kept (defaults to
+                ``LeaderboardCache()``)
+
+        Returns:
+            The cached or freshly fetched leaderboard
+        """
+        leaderboard_id = leaderboard_id or settings.leaderboard_id
+        if not leaderboard_id:
+            raise ValueError("Leaderboard ID not set. Set AOC_LEADERBOARD_ID.")
+
+        cache = cache or LeaderboardCache()
+        cached = cache.get(leaderboard_id, self.year)
+        if cached is not None and not cached.is_stale(self.clock()):
+            return cached
+
+        if not self.session_cookie:
+            raise ValueError("Session cookie not set. Run 'aoc login' first.")
+
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        url = f"{self.base_url}/{self.year}/leaderboard/private/view/{leaderboard_id}.json"
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                # Without a valid session AOC redirects to a login page
+                response = self.session.get(
+                    url, headers=headers, timeout=10, allow_redirects=False
+                )
+                if response.status_code == 304 and cached is not None:
+                    result = cached.model_copy(update={"fetched_at": self.clock()})
+                elif response.status_code == 200:
+                    result = CachedLeaderboard(
+                        leaderboard=Leaderboard.model_validate_json(response.text),
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        fetched_at=self.clock(),
+                    )
+                elif response.is_redirect:
+                    raise ValueError(
+                        "Leaderboard not accessible; check the session cookie "
+                        "and the leaderboard ID"
+                    )
+                else:
+                    response.raise_for_status()
+                    raise ConnectionError(
+                        f"Unexpected status {response.status_code} from AOC"
+                    )
+                cache.save(leaderboard_id, result, self.year)
+                return result
+
+            except requests.RequestException as e:
+                if attempt < RETRY_ATTEMPTS - 1:
+                    console.print(
+                        f"[yellow]Fetching leaderboard failed (attempt {attempt + 1}/{RETRY_ATTEMPTS}), retrying...[/yellow]"
+                    )
+                    self.sleep(self._retry_delay(attempt))
+                else:
+                    raise ConnectionError(f"Failed to fetch leaderboard: {e}") from e
+
+        raise ConnectionError(
+            f"Failed to fetch leaderboard after {RETRY_ATTEMPTS} attempts"
+        )
 
     def submit_answer(
         self, day: int, part: Literal[1, 2], answer: int | str
@@ -93,7 +283,8 @@ class AOCClient:
             answer: Answer to submit
 
         Returns:
-            SubmissionResponse with success status and message
+            SubmissionResponse with success status and message; taken from
+            the ledger without a request if the verdict is already known
         """
         if not 1 <= day <= 25:
             raise ValueError(f"Day must be between 1 and 25, got {day}")
@@ -101,31 +292,39 @@ class AOCClient:
         if part not in (1, 2):
             raise ValueError(f"Part must be 1 or 2, got {part}")
 
+        if self.ledger is not None:
+            known = self.ledger.check(day, part, answer)
+            if known is not None:
+                return known
+
         if not self.session_cookie:
             raise ValueError("Session cookie not set. Run 'aoc login' first.")
 
         url = self._get_url(day, "answer")
         data = {"level": part, "answer": str(answer)}
 
-        for attempt in range(3):
+        for attempt in range(RETRY_ATTEMPTS):
             try:
-                response = requests.post(
-                    url, data=data, cookies=self.cookies, timeout=10
-                )
+                response = self.session.post(url, data=data, timeout=10)
                 response.raise_for_status()
 
-                return self._parse_submission_response(response.text)
+                result = self._parse_submission_response(response.text)
+                if self.ledger is not None:
+                    self.ledger.record(day, part, answer, result)
+                return result
 
             except requests.RequestException as e:
-                if attempt < 2:
+                if attempt < RETRY_ATTEMPTS - 1:
                     console.print(
-                        f"[yellow]Submission failed (attempt {attempt + 1}/3), retrying...[/yellow]"
+                        f"[yellow]Submission failed (attempt {attempt + 1}/{RETRY_ATTEMPTS}), retrying...[/yellow]"
                     )
-                    sleep(2)
+                    self.sleep(self._retry_delay(attempt))
                 else:
                     raise ConnectionError(f"Failed to submit answer: {e}") from e
 
-        raise ConnectionError("Failed to submit answer after 3 attempts")
+        raise ConnectionError(
+            f"Failed to submit answer after {RETRY_ATTEMPTS} attempts"
+        )
 
     def _parse_submission_response(self, html: str) -> SubmissionResponse:
         """Parse the HTML response from submitting an answer."""
@@ -143,45 +342,59 @@ class AOCClient:
         if "That's the right answer" in message:
             return SubmissionResponse(success=True, message=message)
         elif "That's not the right answer" in message:
-            return SubmissionResponse(success=False, message=message)
+            # Wrong answers start a cooldown too, even if it is not stated
+            minutes_match = WAIT_MINUTES_PATTERN.search(message)
+            minutes = minutes_match.group(1) if minutes_match else "one"
+            hint_match = HINT_PATTERN.search(message)
+            return SubmissionResponse(
+                success=False,
+                message=message,
+                cooldown=60 * (1 if minutes == "one" else int(minutes)),
+                hint=(
+                    ("too_high" if hint_match.group(1) == "high" else "too_low")
+                    if hint_match
+                    else None
+                ),
+            )
         elif "You gave an answer too recently" in message:
-            # Try to extract wait time
-            import re
-
-            wait_match = re.search(r"(\d+)s", message)
-            wait_time = int(wait_match.group(1)) if wait_match else None
+            # Assume a minute if the message format ever changes
+            wait_match = WAIT_LEFT_PATTERN.search(message)
+            wait_time = (
+                int(wait_match.group(1) or 0) * 60 + int(wait_match.group(2))
+                if wait_match
+                else 60
+            )
             return SubmissionResponse(
                 success=False, message=message, wait_time=wait_time
             )
         elif "Did you already complete it" in message:
-            return SubmissionResponse(success=False, message=message)
+            return SubmissionResponse(
+                success=False, message=message, already_completed=True
+            )
         else:
             return SubmissionResponse(success=False, message=message)
 
     def _wait_for_unlock(self, day: int) -> None:
         """Wait until the puzzle unlocks (midnight EST on the given day)."""
-        # AOC puzzles unlock at midnight EST (UTC-5)
-        unlock_time = datetime(self.year, 12, day, 5, 0, 0, tzinfo=UTC)
-        now = datetime.now(UTC)
-
-        if now >= unlock_time:
+        unlock = unlock_time(self.year, day)
+        wait_seconds = unlock - self.clock()
+        if wait_seconds <= 0:
             return
 
-        wait_seconds = (unlock_time - now).total_seconds()
         console.print(
             f"[yellow]Waiting {int(wait_seconds)} seconds for day {day} to unlock...[/yellow]"
         )
+        sleep_until(unlock, self.clock, self.sleep)
+        console.print("[green]Puzzle unlocked![/green]")
 
-        while datetime.now(UTC) < unlock_time:
-            remaining = (unlock_time - datetime.now(UTC)).total_seconds()
-            if remaining <= 0:
-                break
-            console.print(
-                f"\r[yellow]{int(remaining)} seconds remaining...[/yellow]", end=""
-            )
-            sleep(1)
+    def connect(self, day: int) -> None:
+        """Open the pooled connection ahead of time.
 
-        console.print("\n[green]Puzzle unlocked![/green]")
+        Sends a ``HEAD`` for the day's page, so the TCP and TLS handshakes
+        are done and the connection is kept alive for the next request. The
+        response itself (a 404 before the unlock) is irrelevant.
+        """
+        self.session.head(self._get_url(day), timeout=10)
 
     def verify_session(self) -> bool:
         """Verify that the session cookie is valid."""
@@ -190,8 +403,8 @@ class AOCClient:
 
         try:
             # Try to access the settings page which requires auth
-            url = f"{self.BASE_URL}/{self.year}/settings"
-            response = requests.get(url, cookies=self.cookies, timeout=10)
+            url = f"{self.base_url}/{self.year}/settings"
+            response = self.session.get(url, timeout=10)
             return response.status_code == 200
         except requests.RequestException:
             return False
@@ -0,0 +1,156 @@
+"""Solve one day against many input files at once.
+
+Inputs are spread over a pool of worker processes. Each worker imports the
+day's solution once when it starts and then solves one input file after
+another, so only the first file a worker gets pays for the import. With a
+single core, everything runs in this process.
+"""
+
+import glob
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple
+
+from .models import SolutionBase
+from .parallel import default_workers, mark_worker_process
+from .runner import load_solution_class
+
+# Solution class imported once by each worker process in _init_worker
+_worker_class: type[SolutionBase] | None = None
+
+
+class InputResult(NamedTuple):
+    """Answers and timing for one input file."""
+
+    path: Path
+    size: int
+    answers: dict[int, str]
+    duration: float
+    error: str | None = None
+
+
+class BatchReport(NamedTuple):
+    """Results for all inputs plus aggregate throughput."""
+
+    results: list[InputResult]
+    wall_time: float
+
+    @property
+    def total_bytes(self) -> int:
+        """Combined size of all inputs."""
+        return sum(r.size for r in self.results)
+
+    @property
+    def inputs_per_second(self) -> float:
+        """Inputs solved per second of wall-clock time."""
+        return len(self.results) / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Input megabytes (10^6 bytes) solved per second of wall-clock time."""
+        return self.total_bytes / 1e6 / self.wall_time if self.wall_time else 0.0
+
+
+def resolve_inputs(spec: str) -> list[Path]:
+    """Expand ``--inputs``: every file in a directory, or a glob pattern.
+
+    Returns:
+        Matching files in sorted order
+    """
+    path = Path(spec).expanduser()
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.is_file())
+    return sorted(
+        Path(p) for p in glob.glob(str(path), recursive=True) if Path(p).is_file()
+    )
+
+
+def _solve(
+    Solution: type[SolutionBase], path: Path, parts: Sequence[int]
+) -> InputResult:
+    size = path.stat().st_size
+    start = perf_counter()
+    try:
+        # Stray prints from many inputs (and workers) would only interleave
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            solution = Solution.from_file(path)
+            answers = {
+                part: str(solution.part_1() if part == 1 else solution.part_2())
+                for part in parts
+            }
+    except Exception as e:
+        return InputResult(path, size, {}, perf_counter() - start, repr(e))
+    return InputResult(path, size, answers, perf_counter() - start)
+
+
+def _init_worker(day: int, solution_path: str) -> None:
+    """Import the solution once per worker process."""
+    global _worker_class
+
+    mark_worker_process()
+    _worker_class = load_solution_class(day, Path(solution_path))
+
+
+def _solve_in_worker(path: Path, parts: Sequence[int]) -> InputResult:
+    if _worker_class is None:
+        raise RuntimeError("Worker process was not initialized")
+    return _solve(_worker_class, path, parts)
+
+
+def solve_inputs(
+    day: int,
+    solution_path: Path,
+    paths: Sequence[Path],
+    parts: Sequence[int] = (1, 2),
+    workers: int | None = None,
+    on_result: Callable[[InputResult], None] | None = None,
+) -> BatchReport:
+    """Solve a day for every input file, spreading files across cores.
+
+    A failing input is reported in its result's ``error`` and does not
+    stop the others.
+
+    Args:
+        day: Day number (1-25)
+        solution_path: The day's solution.py
+        paths: Input files
+        parts: Parts to solve for each input
+        workers: Number of processes (defaults to the usable CPU cores)
+        on_result: Called with each result as soon as it is ready
+
+    Returns:
+        Results in the order of ``paths`` and the total wall-clock time
+    """
+    workers = min(workers or default_workers(), len(paths))
+    start = perf_counter()
+
+    if workers <= 1:
+        Solution = load_solution_class(day, solution_path)
+        results: list[InputResult] = []
+        for path in paths:
+            result = _solve(Solution, path, parts)
+            if on_result:
+                on_result(result)
+            results.append(result)
+        return BatchReport(results, perf_counter() - start)
+
+    by_path: dict[Path, InputResult] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(day, str(solution_path)),
+    ) as pool:
+        futures = [pool.submit(_solve_in_worker, path, parts) for path in paths]
+        for future in as_completed(futures):
+            result = future.result()
+            by_path[result.path] = result
+            if on_result:
+                on_result(result)
+
+    return BatchReport([by_path[p] for p in paths], perf_counter() - start)
@@ -1,25 +1,47 @@
 """CLI for Advent of Code 2025 using Typer."""
 
-import importlib.util
+import json
+import random
+import subprocess
 import sys
+from contextlib import redirect_stdout
+from datetime import datetime
+from enum import StrEnum
 from pathlib import Path
-from typing import Annotated, Literal
+from time import perf_counter
+from typing import Annotated, Literal, NamedTuple
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from .api import AOCClient
+from .batch import InputResult, resolve_inputs, solve_inputs
 from .config import settings
+from .debug import debug_output
+from .implementations import Comparison, compare
+from .leaderboard import REFRESH_INTERVAL
+from .ledger import AnswerLedger
+from .memo import cache_stats, clear_all
+from .models import PartResult, SolutionBase, SubmissionResponse
+from .race import Stage, race
+from .runner import file_hash, load_solution_class, run_part
 from .scaffold import DayScaffold
+from .submissions import AlreadyDrainingError, QueuedSubmission, SubmissionQueue
+from .unlock import unlock_time
+from .verify import DEFAULT_TIMEOUT, DayVerdict, verify_days
 
 app = typer.Typer(
     name="aoc",
     help="Advent of Code 2025 CLI - Manage solutions, download inputs, and submit answers",
     add_completion=False,
 )
+queue_app = typer.Typer(help="Inspect and drain the submission queue")
+app.add_typer(queue_app, name="queue")
 
 console = Console()
+# Warnings and diagnostics, kept off stdout so machine-readable output stays clean
+err_console = Console(stderr=True)
 
 
 @app.command()
@@ -75,13 +97,23 @@ def new(
     """Create a new day's solution scaffold.
 
     Creates directory structure with solution template, input files, and README.
+    When downloading, the puzzle description is fetched and cached too, and
+    its title goes into the README.
     """
     scaffold = DayScaffold(day)
-    scaffold.create(force=force)
+    client = AOCClient()
+
+    title = None
+    if download:
+        try:
+            title = client.fetch_puzzle(day).title
+        except Exception as e:
+            console.print(f"[yellow]Could not fetch puzzle description: {e}[/yellow]")
+
+    scaffold.create(force=force, title=title)
 
     if download:
         try:
-            client = AOCClient()
             input_path = scaffold.get_input_path()
             client.download_input(day, output_path=input_path)
         except Exception as e:
@@ -118,17 +150,102 @@ def download(
 
 
 @app.command()
-def run(
+def puzzle(
     day: Annotated[int, typer.Argument(help="Day number (1-25)")],
-    part: Annotated[
-        int | None, typer.Option("--part", "-p", help="Part to run (1 or 2)")
-    ] = None,
-    test: Annotated[
+    refresh: Annotated[
         bool,
-        typer.Option("--test", "-t", help="Use test_input.txt instead of input.txt"),
+        typer.Option(
+            "--refresh", "-r", help="Revalidate the cached copy, e.g. for part 2"
+        ),
     ] = False,
 ) -> None:
-    """Run solution for a specific day and part."""
+    """Fetch and cache a day's puzzle description.
+
+    The showcase shows descriptions from this cache only. Pages are fetched
+    once; --refresh asks the server whether the page changed since.
+    """
+    try:
+        page = AOCClient().fetch_puzzle(day, refresh=refresh)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    console.print(
+        f"[green]Day {day}: {page.title or '(untitled)'} "
+        f"({len(page.articles)} part(s) cached)[/green]"
+    )
+
+
+@app.command()
+def leaderboard(
+    leaderboard_id: Annotated[
+        str | None,
+        typer.Option(
+            "--id", help="Leaderboard owner's user ID (defaults to AOC_LEADERBOARD_ID)"
+        ),
+    ] = None,
+) -> None:
+    """Show a private leaderboard.
+
+    The leaderboard is cached and fetched again at most every 15 minutes, as
+    AOC asks; a refetch is a conditional request that costs a 304 when
+    nothing changed.
+    """
+    client = AOCClient()
+    try:
+        cached = client.fetch_leaderboard(leaderboard_id)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    board = cached.leaderboard
+    days = board.days()
+    table = Table(title=f"Private Leaderboard {board.event or settings.year}")
+    table.add_column("#", justify="right")
+    table.add_column("Name", style="cyan")
+    table.add_column("Score", justify="right", style="green")
+    table.add_column("Stars", justify="right")
+    for day in days:
+        table.add_column(str(day), justify="center")
+
+    marks = {0: "[dim]·[/dim]", 1: "[blue]☆[/blue]", 2: "[yellow]★[/yellow]"}
+    for rank, member in enumerate(board.ranked(), start=1):
+        table.add_row(
+            str(rank),
+            member.display_name,
+            str(member.local_score),
+            str(member.stars),
+            *(marks[member.stars_on(day)] for day in days),
+        )
+    console.print(table)
+
+    age = cached.age(client.clock())
+    next_fetch = max(REFRESH_INTERVAL - age, 0)
+    console.print(
+        f"[dim]Fetched {age / 60:.0f} min ago; "
+        f"next fetch allowed in {next_fetch / 60:.0f} min[/dim]"
+    )
+
+
+class LoadedSolution(NamedTuple):
+    """Solution instance with the hashes and load time of its files."""
+
+    solution: SolutionBase
+    solution_hash: str
+    input_hash: str
+    parse_duration: float
+
+
+class OutputFormat(StrEnum):
+    """Output formats of ``aoc run``."""
+
+    TEXT = "text"
+    JSON = "json"
+    NDJSON = "ndjson"
+
+
+def _load_solution(day: int, test: bool = False) -> LoadedSolution:
+    """Load a day's solution with its input, exiting on missing files."""
     scaffold = DayScaffold(day)
     solution_path = scaffold.get_solution_path()
 
@@ -138,18 +255,11 @@ def run(
         raise typer.Exit(code=1)
 
     # Load the solution module dynamically
-    spec = importlib.util.spec_from_file_location(
-        f"day_{day:02d}.solution", solution_path
-    )
-    if spec is None or spec.loader is None:
-        console.print("[red]Could not load solution module[/red]")
-        raise typer.Exit(code=1)
-
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[f"day_{day:02d}.solution"] = module
-    spec.loader.exec_module(module)
-
-    Solution = module.Solution
+    try:
+        Solution = load_solution_class(day, solution_path)
+    except ImportError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from e
 
     # Get input file
     input_path = scaffold.get_test_input_path() if test else scaffold.get_input_path()
@@ -158,18 +268,500 @@ def run(
         console.print(f"[red]Input file not found: {input_path}[/red]")
         raise typer.Exit(code=1)
 
-    # Run solution
+    start = perf_counter()
     solution = Solution.from_file(input_path)
+    parse_duration = perf_counter() - start
+    return LoadedSolution(
+        solution, file_hash(solution_path), file_hash(input_path), parse_duration
+    )
+
 
-    if part is None or part == 1:
-        console.print(f"[cyan]Day {day} - Part 1:[/cyan]")
-        result = solution.part_1()
-        console.print(f"[green]Answer: {result}[/green]")
+def _record(results: list[PartResult], source: str) -> None:
+    """Store results in the showcase database, warning if that fails."""
+    if not results:
+        return
 
-    if part is None or part == 2:
-        console.print(f"[cyan]Day {day} - Part 2:[/cyan]")
-        result = solution.part_2()
-        console.print(f"[green]Answer: {result}[/green]")
+    try:
+        from .web.showcase.history import record_results
+
+        record_results(results, source=source)
+    except Exception as e:
+        err_console.print(
+            f"[yellow]Could not record results: {e}. "
+            "Run 'python src/aoc2025/web/manage.py migrate' to create the database.[/yellow]"
+        )
+
+
+@app.command()
+def run(
+    day: Annotated[int, typer.Argument(help="Day number (1-25)")],
+    part: Annotated[
+        int | None, typer.Option("--part", "-p", help="Part to run (1 or 2)")
+    ] = None,
+    test: Annotated[
+        bool,
+        typer.Option("--test", "-t", help="Use test_input.txt instead of input.txt"),
+    ] = False,
+    record: Annotated[
+        bool,
+        typer.Option(
+            "--record/--no-record",
+            help="Record answers and timings in the showcase database",
+        ),
+    ] = False,
+    stats: Annotated[
+        bool,
+        typer.Option("--stats", help="Show hit rates of memoized helpers"),
+    ] = False,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--format",
+            "-f",
+            help="text for people, json for one document at the end, "
+            "ndjson for one record per part as soon as it finishes",
+        ),
+    ] = OutputFormat.TEXT,
+    memory: Annotated[
+        bool,
+        typer.Option("--memory", help="Measure peak memory (slows the run down)"),
+    ] = False,
+    verbose: Annotated[
+        int,
+        typer.Option(
+            "--verbose",
+            "-v",
+            count=True,
+            help="Show the solution's debug output on stderr (-vv for more)",
+        ),
+    ] = 0,
+    inputs: Annotated[
+        str | None,
+        typer.Option(
+            "--inputs",
+            "-i",
+            help="Solve every file in a directory or matching a glob instead",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers", "-w", help="Processes for --inputs (default: CPU cores)"
+        ),
+    ] = None,
+) -> None:
+    """Run solution for a specific day and part.
+
+    With --inputs, the day is solved for many input files across all cores
+    and answers per file are reported together with the throughput.
+    """
+    if inputs is not None:
+        _run_batch(day, part, inputs, workers, output_format)
+        return
+
+    solution, solution_hash, input_hash, parse_duration = _load_solution(day, test)
+    machine = output_format is not OutputFormat.TEXT
+
+    results: list[PartResult] = []
+    for p in (1, 2):
+        if part is not None and part != p:
+            continue
+
+        if machine:
+            # Anything the solution prints would corrupt the records
+            with redirect_stdout(sys.stderr), debug_output(verbose):
+                result = run_part(
+                    solution,
+                    p,
+                    trace_memory=memory,
+                    solution_hash=solution_hash,
+                    input_hash=input_hash,
+                    parse_duration=parse_duration,
+                )
+        else:
+            console.print(f"[cyan]Day {day} - Part {p}:[/cyan]")
+            with debug_output(verbose):
+                result = run_part(
+                    solution,
+                    p,
+                    trace_memory=memory,
+                    solution_hash=solution_hash,
+                    input_hash=input_hash,
+                    parse_duration=parse_duration,
+                )
+            peak = (
+                f", {result.peak_memory / 1024:.1f} KiB peak"
+                if result.peak_memory is not None
+                else ""
+            )
+            console.print(
+                f"[green]Answer: {result.answer}[/green] "
+                f"[dim]({result.duration * 1000:.2f} ms{peak})[/dim]"
+            )
+
+        if output_format is OutputFormat.NDJSON:
+            print(json.dumps(_run_record(result, test)), flush=True)
+        results.append(result)
+
+    if output_format is OutputFormat.JSON:
+        print(json.dumps([_run_record(r, test) for r in results], indent=2))
+
+    if stats:
+        _print_cache_stats(err_console if machine else console)
+
+    # Test input runs are not interesting for the performance history
+    if record and not test:
+        _record(results, source="cli")
+
+
+def _run_batch(
+    day: int,
+    part: int | None,
+    spec: str,
+    workers: int | None,
+    output_format: OutputFormat,
+) -> None:
+    """Solve a day for many input files and report answers and throughput."""
+    paths = resolve_inputs(spec)
+    if not paths:
+        err_console.print(f"[red]No input files match {spec}[/red]")
+        raise typer.Exit(code=1)
+
+    solution_path = DayScaffold(day).get_solution_path()
+    if not solution_path.exists():
+        err_console.print(f"[red]Solution file not found: {solution_path}[/red]")
+        raise typer.Exit(code=1)
+
+    parts = [p for p in (1, 2) if part is None or part == p]
+
+    def record(result: InputResult) -> dict[str, object]:
+        return {
+            "day": day,
+            "path": str(result.path),
+            "size": result.size,
+            "answers": {str(p): a for p, a in result.answers.items()},
+            "duration": result.duration,
+            "error": result.error,
+        }
+
+    def on_result(result: InputResult) -> None:
+        if output_format is OutputFormat.NDJSON:
+            print(json.dumps(record(result)), flush=True)
+
+    report = solve_inputs(
+        day, solution_path, paths, parts, workers=workers, on_result=on_result
+    )
+
+    if output_format is OutputFormat.JSON:
+        print(json.dumps([record(r) for r in report.results], indent=2))
+    elif output_format is OutputFormat.TEXT:
+        table = Table(title=f"Day {day} on {len(paths)} inputs")
+        table.add_column("Input", style="cyan", overflow="fold")
+        table.add_column("Size", justify="right")
+        for p in parts:
+            table.add_column(f"Part {p}", style="green")
+        table.add_column("Time (ms)", justify="right")
+        for result in report.results:
+            answers = [
+                result.answers.get(p, f"[red]{result.error}[/red]") for p in parts
+            ]
+            table.add_row(
+                str(result.path),
+                f"{result.size / 1024:.1f} KiB",
+                *answers,
+                f"{result.duration * 1000:.2f}",
+            )
+        console.print(table)
+
+    failed = sum(1 for r in report.results if r.error)
+    err_console.print(
+        f"[bold]{len(report.results)} inputs in {report.wall_time:.2f}s: "
+        f"{report.inputs_per_second:.1f} inputs/s, "
+        f"{report.megabytes_per_second:.2f} MB/s[/bold]"
+        + (f" [red]({failed} failed)[/red]" if failed else "")
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _run_record(result: PartResult, test: bool) -> dict[str, object]:
+    """Get the machine-readable record of one part of ``aoc run``."""
+    record = result.model_dump(mode="json")
+    record["test"] = test
+    return record
+
+
+def _print_cache_stats(out: Console) -> None:
+    """Print the counters of every ``@memoize`` cache used so far."""
+    infos = cache_stats()
+    if not infos:
+        out.print("[dim]No memoized helpers[/dim]")
+        return
+
+    table = Table(title="Memoized helpers")
+    table.add_column("Function", style="cyan", overflow="fold")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Hit rate", justify="right", style="green")
+    table.add_column("Evictions", justify="right")
+    table.add_column("Size", justify="right")
+
+    for info in infos:
+        limit = "∞" if info.maxsize is None else str(info.maxsize)
+        table.add_row(
+            info.name + (" [dim](persisted)[/dim]" if info.persisted else ""),
+            str(info.hits),
+            str(info.misses),
+            f"{info.hit_rate:.1%}",
+            str(info.evictions),
+            f"{info.currsize}/{limit}",
+        )
+
+    out.print(table)
+
+
+@app.command()
+def bench(
+    day: Annotated[int, typer.Argument(help="Day number (1-25)")],
+    part: Annotated[
+        int | None, typer.Option("--part", "-p", help="Part to run (1 or 2)")
+    ] = None,
+    repeat: Annotated[
+        int, typer.Option("--repeat", "-r", help="Number of timed runs", min=1)
+    ] = 5,
+    record: Annotated[
+        bool,
+        typer.Option(
+            "--record/--no-record",
+            help="Record timings in the showcase database",
+        ),
+    ] = True,
+) -> None:
+    """Benchmark a day's solution over repeated runs.
+
+    Timings are taken without memory tracing; one extra traced run per part
+    measures peak memory. Every run starts with empty ``@memoize`` caches, so
+    a part that shares work with the other is timed doing that work.
+    """
+    solution, solution_hash, input_hash, _ = _load_solution(day)
+
+    table = Table(title=f"Day {day} benchmark ({repeat} runs)")
+    table.add_column("Part", style="cyan")
+    table.add_column("Answer", style="green")
+    table.add_column("Min (ms)", justify="right")
+    table.add_column("Mean (ms)", justify="right")
+    table.add_column("Max (ms)", justify="right")
+    table.add_column("Peak memory", justify="right")
+
+    results = []
+    for p in (1, 2):
+        if part is not None and part != p:
+            continue
+
+        runs: list[PartResult] = []
+        for _ in range(repeat):
+            clear_all()
+            runs.append(
+                run_part(
+                    solution, p, solution_hash=solution_hash, input_hash=input_hash
+                )
+            )
+        clear_all()
+        traced = run_part(solution, p, trace_memory=True)
+        durations = [r.duration * 1000 for r in runs]
+        table.add_row(
+            str(p),
+            runs[0].answer,
+            f"{min(durations):.2f}",
+            f"{sum(durations) / len(durations):.2f}",
+            f"{max(durations):.2f}",
+            f"{(traced.peak_memory or 0) / 1024:.1f} KiB",
+        )
+
+        fastest = min(runs, key=lambda r: r.duration)
+        results.append(fastest.model_copy(update={"peak_memory": traced.peak_memory}))
+
+    console.print(table)
+
+    if record:
+        _record(results, source="bench")
+
+
+@app.command(name="compare")
+def compare_command(
+    day: Annotated[int, typer.Argument(help="Day number (1-25)")],
+    part: Annotated[
+        int | None, typer.Option("--part", "-p", help="Part to compare (1 or 2)")
+    ] = None,
+    random_inputs: Annotated[
+        int,
+        typer.Option("--random", "-n", help="Random inputs to generate", min=0),
+    ] = 3,
+    size: Annotated[
+        int,
+        typer.Option("--size", "-s", help="Rough item count of random inputs", min=1),
+    ] = 1000,
+    seed: Annotated[
+        int | None,
+        typer.Option("--seed", help="Seed for random inputs (printed if not given)"),
+    ] = None,
+    repeat: Annotated[
+        int, typer.Option("--repeat", "-r", help="Timed runs, best is kept", min=1)
+    ] = 3,
+) -> None:
+    """Check a day's alternative implementations against each other.
+
+    Runs every @implementation of each part, plus part_1/part_2 themselves,
+    on the test input, the real input and random inputs (if the solution
+    can generate them). Prints answers and speedups relative to the
+    reference and exits with code 1 if any implementation disagrees.
+    """
+    scaffold = DayScaffold(day)
+    try:
+        Solution = load_solution_class(day, scaffold.get_solution_path())
+    except (FileNotFoundError, ImportError) as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    inputs: list[tuple[str, str]] = []
+    for label, path in (
+        ("test", scaffold.get_test_input_path()),
+        ("input", scaffold.get_input_path()),
+    ):
+        if path.exists() and path.read_text().strip():
+            inputs.append((label, path.read_text()))
+
+    if random_inputs:
+        seed = seed if seed is not None else random.randrange(2**32)
+        rng = random.Random(seed)
+        for i in range(random_inputs):
+            generated = Solution.generate_input(rng, size)
+            if generated is None:
+                console.print(
+                    f"[yellow]Day {day} cannot generate inputs; "
+                    "skipping random inputs[/yellow]"
+                )
+                break
+            inputs.append((f"random {i + 1}", generated))
+        else:
+            console.print(f"[dim]Random inputs use --seed {seed}[/dim]")
+
+    if not inputs:
+        console.print("[red]No inputs to compare on[/red]")
+        raise typer.Exit(code=1)
+
+    table = Table(title=f"Day {day} implementations")
+    table.add_column("Input", style="cyan")
+    table.add_column("Part", justify="right")
+    table.add_column("Implementation")
+    table.add_column("Answer", overflow="fold")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Speedup", justify="right")
+
+    def on_result(comparison: Comparison) -> None:
+        expected = comparison.expected
+        for run in comparison.runs:
+            name = run.name + (
+                " [dim](ref)[/dim]" if run.name == comparison.reference else ""
+            )
+            if run.error is not None:
+                answer = f"[red]{run.error}[/red]"
+            elif run.answer != expected.answer:
+                answer = f"[red]{run.answer} (expected {expected.answer})[/red]"
+            else:
+                answer = f"[green]{run.answer}[/green]"
+            speedup = comparison.speedup(run)
+            table.add_row(
+                comparison.input,
+                str(comparison.part),
+                name,
+                answer,
+                f"{run.duration * 1000:.3f}" if run.error is None else "-",
+                f"{speedup:.1f}x" if speedup is not None else "-",
+            )
+        table.add_section()
+
+    parts = [p for p in (1, 2) if part is None or part == p]
+    comparisons = compare(Solution, inputs, parts, repeat=repeat, on_result=on_result)
+    console.print(table)
+
+    disagreeing = [c for c in comparisons if not c.agree]
+    if disagreeing:
+        console.print(
+            f"[red]{len(disagreeing)} of {len(comparisons)} comparisons disagree[/red]"
+        )
+        raise typer.Exit(code=1)
+    console.print(f"[green]All {len(comparisons)} comparisons agree[/green]")
+
+
+@app.command()
+def verify(
+    days: Annotated[
+        list[int] | None,
+        typer.Argument(help="Days to verify (default: every day with a solution)"),
+    ] = None,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", "-t", help="Seconds each day may take", min=0.1),
+    ] = DEFAULT_TIMEOUT,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-w", help="Days to solve at once", min=1),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option("--force", "-f", help="Re-run days unchanged since they passed"),
+    ] = False,
+) -> None:
+    """Check solutions against the known answers in each day's answers.yml.
+
+    Days run in parallel worker processes. Exits with code 1 if any answer
+    is wrong or a day fails, crashes or times out.
+    """
+    if days is None:
+        days = sorted(
+            int(d.name.split("_")[1])
+            for d in settings.solutions_dir.glob("day_*")
+            if (d / "solution.py").exists()
+        )
+
+    styles = {
+        "pass": "green",
+        "skipped": "dim",
+        "missing": "yellow",
+        "fail": "red",
+        "error": "red",
+        "timeout": "red",
+    }
+
+    def on_result(verdict: DayVerdict) -> None:
+        style = styles[verdict.status]
+        line = f"[{style}]Day {verdict.day}: {verdict.status}"
+        if verdict.duration:
+            line += f" ({verdict.duration:.2f}s)"
+        if verdict.message:
+            line += f" - {verdict.message}"
+        console.print(line + f"[/{style}]", highlight=False)
+        for check in verdict.checks:
+            if not check.passed:
+                console.print(
+                    f"  [red]{check.input} part {check.part}: expected "
+                    f"{check.expected}, got {check.actual or '(nothing)'}[/red]",
+                    highlight=False,
+                )
+
+    verdicts = verify_days(
+        days, timeout=timeout, workers=workers, force=force, on_result=on_result
+    )
+
+    failed = [v for v in verdicts if v.status in ("fail", "error", "timeout")]
+    checked = sum(len(v.checks) for v in verdicts)
+    console.print(
+        f"\n{len(verdicts)} day(s), {checked} answer(s) checked, "
+        f"{len(failed)} failing"
+    )
+    if failed:
+        raise typer.Exit(code=1)
 
 
 @app.command()
@@ -182,10 +774,23 @@ def submit(
             "--answer", "-a", help="Answer to submit (or use solution output)"
         ),
     ] = None,
+    background: Annotated[
+        bool,
+        typer.Option(
+            "--background",
+            "-b",
+            help="Return right away and submit from a background process",
+        ),
+    ] = False,
 ) -> None:
     """Submit an answer for a specific day and part.
 
     If no answer is provided, runs the solution and submits the result.
+    Answers go through the submission queue, which waits out server
+    cooldowns and never resubmits an answer that was already judged.
+    Answers the local ledger can judge (known wrong, outside the bounds
+    from earlier too high/too low verdicts, or for a solved part) are
+    answered right away without contacting the server.
     """
     # Validate and narrow type for part
     if part not in (1, 2):
@@ -197,54 +802,272 @@ def submit(
 
     if answer is None:
         # Run the solution to get the answer
-        scaffold = DayScaffold(day)
-        solution_path = scaffold.get_solution_path()
+        solution = _load_solution(day).solution
+        answer = str(solution.part_1() if part == 1 else solution.part_2())
+        console.print(f"[cyan]Submitting answer: {answer}[/cyan]")
 
-        if not solution_path.exists():
-            console.print(f"[red]Solution file not found: {solution_path}[/red]")
-            raise typer.Exit(code=1)
+    known = AnswerLedger().check(day, part_literal, answer)
+    if known is not None:
+        if known.success:
+            console.print(f"[green]Day {day} part {part}: {known.message}[/green]")
+            return
+        console.print(f"[red]Day {day} part {part}: {known.message}[/red]")
+        raise typer.Exit(code=1)
 
-        spec = importlib.util.spec_from_file_location(
-            f"day_{day:02d}.solution", solution_path
+    queue = SubmissionQueue()
+    entry = queue.enqueue(day, part_literal, answer)
+    if entry.status == "correct":
+        console.print(
+            f"[green]Day {day} part {part} is already solved "
+            f"(answer {entry.answer}).[/green]"
+        )
+        return
+    if entry.status != "pending":
+        console.print(
+            f"[red]Answer {entry.answer} was already submitted: {entry.message}[/red]"
         )
-        if spec is None or spec.loader is None:
-            console.print("[red]Could not load solution module[/red]")
-            raise typer.Exit(code=1)
+        raise typer.Exit(code=1)
 
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[f"day_{day:02d}.solution"] = module
-        spec.loader.exec_module(module)
+    if background:
+        _start_background_drain()
+        console.print("[cyan]Queued; submitting in the background.[/cyan]")
+        console.print("[dim]Run 'aoc queue list' to see the verdict.[/dim]")
+        return
 
-        Solution = module.Solution
-        input_path = scaffold.get_input_path()
+    finished = _drain_queue(queue)
+    verdict = next(
+        (f for f in finished if (f.day, f.part, f.answer) == (day, part, entry.answer)),
+        None,
+    )
+    if verdict is not None and verdict.status != "correct":
+        raise typer.Exit(code=1)
 
-        if not input_path.exists():
-            console.print(f"[red]Input file not found: {input_path}[/red]")
-            raise typer.Exit(code=1)
 
-        solution = Solution.from_file(input_path)
-        answer = str(solution.part_1() if part == 1 else solution.part_2())
-        console.print(f"[cyan]Submitting answer: {answer}[/cyan]")
+@app.command(name="race")
+def race_command(
+    day: Annotated[int, typer.Argument(help="Day number (1-25)")],
+    submit: Annotated[
+        bool, typer.Option("--submit", "-s", help="Submit the part 1 answer")
+    ] = False,
+    rehearse: Annotated[
+        float | None,
+        typer.Option(
+            "--in",
+            help="Pretend the day unlocks in this many seconds, e.g. to "
+            "rehearse against a stand-in server set with AOC_BASE_URL",
+        ),
+    ] = None,
+) -> None:
+    """Wait for a day to unlock, then download, solve and submit part 1 fast.
 
-    client = AOCClient()
+    The solution is imported up front and the connection to AOC is opened
+    shortly before the unlock. At the unlock the input is downloaded and
+    handed to the solution in memory; it is written to input.txt only
+    after the answer is in. Prints how long each stage took.
+    """
+    scaffold = DayScaffold(day)
+    solution_path = scaffold.get_solution_path()
+    if not solution_path.exists():
+        console.print(f"[red]Solution file not found: {solution_path}[/red]")
+        console.print(f"[yellow]Run 'aoc new {day}' to create it[/yellow]")
+        raise typer.Exit(code=1)
+    if not settings.session_cookie:
+        console.print("[red]Session cookie not set. Run 'aoc login' first.[/red]")
+        raise typer.Exit(code=1)
 
     try:
-        response = client.submit_answer(day, part_literal, answer)
+        Solution = load_solution_class(day, solution_path)
+    except ImportError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    client = AOCClient(ledger=AnswerLedger())
+    unlock_at = (
+        client.clock() + rehearse
+        if rehearse is not None
+        else unlock_time(client.year, day)
+    )
+    wait = unlock_at - client.clock()
+    if wait > 0:
+        console.print(f"[yellow]Day {day} unlocks in {wait:.1f}s; waiting...[/yellow]")
 
+    def on_stage(stage: Stage) -> None:
+        err_console.print(
+            f"[dim]{stage.name}: {stage.duration * 1000:.1f} ms[/dim]", highlight=False
+        )
+
+    try:
+        report = race(client, day, Solution, unlock_at, submit, on_stage=on_stage)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    input_path = scaffold.get_input_path()
+    input_path.write_text(report.input_text)
+
+    table = Table(title=f"Day {day} Race")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Done at T+ (ms)", justify="right", style="green")
+    for stage in report.stages:
+        table.add_row(
+            stage.name,
+            f"{stage.duration * 1000:.1f}",
+            f"{stage.finished * 1000:.1f}",
+        )
+    console.print(table)
+    console.print(f"[bold]Part 1 answer:[/bold] {report.answer}")
+    console.print(f"[dim]Input saved to {input_path}[/dim]")
+
+    submission = report.submission
+    if submission is None:
+        return
+    if submission.status == "correct":
+        console.print(f"[green]{submission.message}[/green]")
+        return
+    console.print(f"[red]{submission.message or submission.status}[/red]")
+    raise typer.Exit(code=1)
+
+
+def _drain_queue(queue: SubmissionQueue) -> list[QueuedSubmission]:
+    """Submit everything pending, reporting progress on the console."""
+
+    def on_wait(entry: QueuedSubmission, seconds: float) -> None:
+        console.print(
+            f"[yellow]Waiting {seconds:.0f}s before submitting "
+            f"day {entry.day} part {entry.part}...[/yellow]"
+        )
+
+    def on_result(entry: QueuedSubmission, response: SubmissionResponse) -> None:
+        label = f"Day {entry.day} part {entry.part} ({entry.answer})"
         if response.success:
-            console.print(f"[green]{response.message}[/green]")
+            console.print(f"[green]{label}: {response.message}[/green]")
+        elif entry.status == "pending":
+            console.print(f"[yellow]{label}: {response.message}[/yellow]")
         else:
-            console.print(f"[red]{response.message}[/red]")
-            if response.wait_time:
-                console.print(
-                    f"[yellow]Please wait {response.wait_time} seconds before submitting again[/yellow]"
-                )
+            console.print(f"[red]{label}: {response.message}[/red]")
 
+    try:
+        client = AOCClient(ledger=AnswerLedger())
+        return queue.drain(client, on_wait=on_wait, on_result=on_result)
+    except AlreadyDrainingError:
+        console.print(
+            "[cyan]Another process is submitting queued answers; "
+            "it will pick this one up too.[/cyan]"
+        )
+        return []
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
+        console.print(
+            "[yellow]The answer stays queued; run 'aoc queue drain'.[/yellow]"
+        )
         raise typer.Exit(code=1) from e
 
 
+def _start_background_drain() -> None:
+    """Drain the queue from a detached process that outlives this command."""
+    log_path = settings.queue_file.with_suffix(".log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("a") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "aoc2025.cli", "queue", "drain"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+
+@queue_app.command("list")
+def queue_list(
+    all_entries: Annotated[
+        bool, typer.Option("--all", "-a", help="Include answers with a verdict")
+    ] = False,
+) -> None:
+    """Show queued answers and when the next one may be submitted."""
+    state = SubmissionQueue().state()
+    entries = [e for e in state.submissions if all_entries or e.status == "pending"]
+
+    table = Table(title="Submission queue")
+    table.add_column("Day", justify="right", style="cyan")
+    table.add_column("Part", justify="right", style="cyan")
+    table.add_column("Answer", style="green")
+    table.add_column("Status")
+    table.add_column("Queued")
+    table.add_column("Message", overflow="fold")
+
+    styles = {"pending": "yellow", "correct": "green", "wrong": "red"}
+    for e in entries:
+        style = styles.get(e.status, "dim")
+        table.add_row(
+            str(e.day),
+            str(e.part),
+            e.answer,
+            f"[{style}]{e.status}[/{style}]",
+            datetime.fromtimestamp(e.queued_at).strftime("%Y-%m-%d %H:%M:%S"),
+            e.message,
+        )
+    console.print(table)
+
+    wait = state.not_before - datetime.now().timestamp()
+    if wait > 0:
+        console.print(f"[yellow]Next submission allowed in {wait:.0f}s[/yellow]")
+
+
+@queue_app.command("drain")
+def queue_drain(
+    background: Annotated[
+        bool,
+        typer.Option("--background", "-b", help="Drain from a background process"),
+    ] = False,
+) -> None:
+    """Submit all queued answers, waiting out cooldowns between them."""
+    if background:
+        _start_background_drain()
+        console.print("[cyan]Draining the queue in the background.[/cyan]")
+        return
+
+    _drain_queue(SubmissionQueue())
+
+
+@queue_app.command("remove")
+def queue_remove(
+    day: Annotated[int, typer.Argument(help="Day number (1-25)")],
+    part: Annotated[
+        int | None, typer.Option("--part", "-p", help="Only this part (1 or 2)")
+    ] = None,
+) -> None:
+    """Drop pending answers for a day without submitting them."""
+    removed = SubmissionQueue().remove(day, part)
+    console.print(f"[cyan]Removed {removed} pending answer(s).[/cyan]")
+
+
+@app.command(name="export-site")
+def export_site(
+    out_dir: Annotated[Path, typer.Argument(help="Directory to write the site to")],
+) -> None:
+    """Export the showcase as static files.
+
+    Renders the index and every day's pages with answers solved up front,
+    moves inline styles into content-hashed stylesheets and writes a .gz
+    next to every file. Serve the directory at the root of any static host.
+    """
+    from .web.showcase.export import export_site as export
+
+    start = perf_counter()
+    try:
+        report = export(out_dir)
+    except Exception as e:
+        console.print(f"[red]Export failed: {e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    console.print(
+        f"[green]Exported {report.pages} pages and {report.assets} stylesheet(s) "
+        f"to {out_dir} ({report.files} files, {report.bytes_written / 1024:.1f} KiB) "
+        f"in {perf_counter() - start:.1f}s[/green]"
+    )
+
+
 @app.command()
 def status() -> None:
     """Show status of solutions and configuration."""
@@ -258,6 +1081,8 @@ def status() -> None:
     table.add_row("Year", str(settings.year))
     table.add_row("Solutions Directory", str(settings.solutions_dir))
     table.add_row("Config File", str(settings.config_file))
+    table.add_row("Cache Directory", str(settings.cache_dir))
+    table.add_row("Leaderboard", settings.leaderboard_id or "✗ Not set")
 
     console.print(table)
 
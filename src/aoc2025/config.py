@@ -20,6 +20,11 @@ class Settings(BaseSettings):
     year: int = 2025
     solutions_dir: Path = Path(__file__).parent.parent.parent / "solutions"
     config_file: Path = Path.home() / ".config" / "aoc2025" / "config.yml"
+    cache_dir: Path = Path.home() / ".cache" / "aoc2025"
+    base_url: str = "https://adventofcode.com"
+    queue_file: Path = Path.home() / ".config" / "aoc2025" / "submissions.json"
+    ledger_file: Path = Path.home() / ".config" / "aoc2025" / "answers.json"
+    leaderboard_id: str = ""
 
     def model_post_init(self, __context: Any) -> None:
         """Load config file after initialization if env vars not set."""
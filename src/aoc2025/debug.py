@@ -0,0 +1,93 @@
+"""Debug output for solutions that costs nothing unless switched on.
+
+Solutions call :meth:`SolutionBase.debug <aoc2025.models.SolutionBase.debug>`
+instead of ``print``. Messages are dropped before they are formatted unless
+a :func:`debug_output` block with a high enough level is active in the
+current context, which ``aoc run -v`` sets up. Enabled output is collected
+in a buffer and written in large batches, so even chatty hot loops do not
+pay for a write per line.
+
+Contexts that never enable it stay silent: benchmarks, ``aoc verify``,
+other threads (such as the showcase's solve jobs) and worker processes.
+"""
+
+import sys
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TextIO
+
+# Buffered lines are written out once this many have piled up
+FLUSH_LINES = 4096
+
+Message = str | Callable[[], object]
+
+
+class DebugChannel:
+    """Buffered sink for debug messages up to a verbosity level."""
+
+    def __init__(self, level: int, stream: TextIO):
+        """Initialize the channel.
+
+        Args:
+            level: Highest message level to keep (1 for ``-v``, 2 for ``-vv``)
+            stream: Where buffered lines are written
+        """
+        self.level = level
+        self.stream = stream
+        self._lines: list[str] = []
+
+    def emit(self, message: Message, args: tuple[object, ...]) -> None:
+        """Format a message and add it to the buffer."""
+        if callable(message):
+            text = str(message())
+        elif args:
+            text = message % args
+        else:
+            text = message
+        self._lines.append(text)
+        if len(self._lines) >= FLUSH_LINES:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out everything buffered so far."""
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self.stream.flush()
+            self._lines.clear()
+
+
+_channel: ContextVar[DebugChannel | None] = ContextVar("aoc_debug", default=None)
+
+
+def debug_level() -> int:
+    """Get the verbosity enabled in the current context (0 when off)."""
+    channel = _channel.get()
+    return channel.level if channel is not None else 0
+
+
+def emit(level: int, message: Message, args: tuple[object, ...]) -> None:
+    """Send a message to the active channel if its level is enabled."""
+    channel = _channel.get()
+    if channel is not None and level <= channel.level:
+        channel.emit(message, args)
+
+
+@contextmanager
+def debug_output(level: int = 1, stream: TextIO | None = None) -> Generator[None]:
+    """Enable debug messages up to ``level`` for the block.
+
+    Output goes to ``stream`` (standard error by default) in batches and is
+    flushed when the block exits. A level of 0 keeps everything silent.
+    """
+    if level <= 0:
+        yield
+        return
+
+    channel = DebugChannel(level, stream or sys.stderr)
+    token = _channel.set(channel)
+    try:
+        yield
+    finally:
+        _channel.reset(token)
+        channel.flush()
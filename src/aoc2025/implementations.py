@@ -0,0 +1,179 @@
+"""Alternative implementations of a part, checked against each other.
+
+Optimising a part is safer with the slow, obviously correct version kept
+around as an oracle. Mark such methods with :func:`implementation`::
+
+    class Solution(SolutionBase):
+        def part_1(self) -> int | str:
+            ...  # Fast version, used by 'aoc run'
+
+        @implementation(1, "scan", reference=True)
+        def part_1_scan(self) -> int | str:
+            ...  # Straightforward version
+
+:func:`compare` runs every implementation of a part (``part_1`` itself is
+called "main") on the same inputs, reports whether they agree and how fast
+each is relative to the reference. Solutions can provide random inputs by
+overriding :meth:`SolutionBase.generate_input
+<aoc2025.models.SolutionBase.generate_input>`.
+"""
+
+from collections.abc import Callable
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from .memo import clear_all
+
+if TYPE_CHECKING:
+    from .models import SolutionBase
+
+# Name under which part_1/part_2 themselves are compared
+MAIN = "main"
+
+_MARKER = "_aoc_implementation"
+
+Implementation = Callable[["SolutionBase"], int | str]
+
+
+class ImplementationInfo(NamedTuple):
+    """What :func:`implementation` records on a method."""
+
+    part: int
+    name: str
+    reference: bool
+
+
+def implementation[F: Callable[..., int | str]](
+    part: int, name: str | None = None, reference: bool = False
+) -> Callable[[F], F]:
+    """Register a method as another implementation of a part.
+
+    Args:
+        part: Part number (1 or 2)
+        name: Name shown by ``aoc compare`` (defaults to the method name)
+        reference: Use this one as the oracle and speed baseline instead of
+            the main ``part_N`` method
+    """
+    if part not in (1, 2):
+        raise ValueError(f"Part must be 1 or 2, got {part}")
+
+    def decorate(func: F) -> F:
+        info = ImplementationInfo(part, name or func.__name__, reference)
+        setattr(func, _MARKER, info)
+        return func
+
+    return decorate
+
+
+def implementations(
+    solution_class: type["SolutionBase"], part: int
+) -> tuple[dict[str, Implementation], str]:
+    """Get all implementations of a part and the name of the reference.
+
+    Returns:
+        Implementations by name, the main ``part_N`` method first, and the
+        name of the reference (``"main"`` unless one is marked)
+    """
+    found: dict[str, Implementation] = {MAIN: getattr(solution_class, f"part_{part}")}
+    reference = MAIN
+    for attr in dir(solution_class):
+        info: ImplementationInfo | None = getattr(
+            getattr(solution_class, attr, None), _MARKER, None
+        )
+        if info is None or info.part != part:
+            continue
+        if info.name in found:
+            raise ValueError(f"Duplicate implementation name {info.name!r}")
+        found[info.name] = getattr(solution_class, attr)
+        if info.reference:
+            reference = info.name
+    return found, reference
+
+
+class Run(NamedTuple):
+    """One implementation on one input."""
+
+    name: str
+    answer: str
+    duration: float
+    error: str | None = None
+
+
+class Comparison(NamedTuple):
+    """All implementations of a part on one input."""
+
+    input: str
+    part: int
+    reference: str
+    runs: list[Run]
+
+    @property
+    def expected(self) -> Run:
+        """The reference implementation's run."""
+        return next(r for r in self.runs if r.name == self.reference)
+
+    @property
+    def agree(self) -> bool:
+        """Whether every implementation gave the reference's answer."""
+        expected = self.expected
+        return expected.error is None and all(
+            r.error is None and r.answer == expected.answer for r in self.runs
+        )
+
+    def speedup(self, run: Run) -> float | None:
+        """How many times faster a run was than the reference."""
+        if run.error is not None or not run.duration:
+            return None
+        return self.expected.duration / run.duration
+
+
+def compare(
+    solution_class: type["SolutionBase"],
+    inputs: list[tuple[str, str]],
+    parts: list[int],
+    repeat: int = 1,
+    on_result: Callable[[Comparison], None] | None = None,
+) -> list[Comparison]:
+    """Run all implementations of the parts on each input.
+
+    Every timed run gets a fresh solution instance and starts with all
+    ``@memoize`` caches emptied (persisted copies stay on disk), so caches
+    filled by one run cannot speed up another. Durations are the best of
+    ``repeat`` runs.
+
+    Args:
+        solution_class: The day's ``Solution``
+        inputs: (label, input text) pairs
+        parts: Parts to compare
+        repeat: Timed runs per implementation and input
+        on_result: Called with each comparison as soon as it is done
+
+    Returns:
+        One comparison per input and part
+    """
+    comparisons: list[Comparison] = []
+    for label, text in inputs:
+        for part in parts:
+            found, reference = implementations(solution_class, part)
+            runs: list[Run] = []
+            for name, func in found.items():
+                try:
+                    best = float("inf")
+                    answer: int | str = ""
+                    for _ in range(repeat):
+                        # Start cold every time, or the best run would only
+                        # time what an earlier run left in a cache
+                        solution = solution_class(raw_input=text)
+                        clear_all()
+                        start = perf_counter()
+                        answer = func(solution)
+                        best = min(best, perf_counter() - start)
+                    runs.append(Run(name, str(answer), best))
+                except Exception as e:
+                    runs.append(Run(name, "", 0.0, repr(e)))
+
+            comparison = Comparison(label, part, reference, runs)
+            if on_result:
+                on_result(comparison)
+            comparisons.append(comparison)
+    return comparisons
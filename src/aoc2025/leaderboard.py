@@ -0,0 +1,114 @@
+"""Private leaderboard data and its local cache.
+
+Advent of Code asks that the leaderboard JSON is fetched at most once every
+15 minutes. :meth:`AOCClient.fetch_leaderboard
+<aoc2025.api.AOCClient.fetch_leaderboard>` therefore keeps the last copy
+here and only goes back to the server once it is older than
+:data:`REFRESH_INTERVAL`, and then with the cached validators, so an
+unchanged leaderboard costs a ``304 Not Modified``.
+"""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from .config import settings
+from .store import JsonStore
+
+# Seconds a fetched leaderboard is used before asking the server again
+REFRESH_INTERVAL = 15 * 60
+
+
+class Star(BaseModel):
+    """When a member got one star."""
+
+    get_star_ts: int
+    star_index: int = 0
+
+
+class Member(BaseModel):
+    """One member of a private leaderboard."""
+
+    id: int
+    name: str | None = None
+    stars: int = 0
+    local_score: int = 0
+    last_star_ts: int = 0
+    completion_day_level: dict[str, dict[str, Star]] = Field(default_factory=dict)
+
+    @property
+    def display_name(self) -> str:
+        """Get the member's name, as AOC shows anonymous users."""
+        return self.name or f"(anonymous user #{self.id})"
+
+    def stars_on(self, day: int) -> int:
+        """Get the number of stars (0-2) the member has for a day."""
+        return len(self.completion_day_level.get(str(day), {}))
+
+
+class Leaderboard(BaseModel):
+    """A private leaderboard as returned by AOC's JSON API."""
+
+    event: str = ""
+    owner_id: int = 0
+    members: dict[str, Member] = Field(default_factory=dict)
+
+    def ranked(self) -> list[Member]:
+        """Get members by local score, then stars, then earliest last star."""
+        return sorted(
+            self.members.values(),
+            key=lambda m: (-m.local_score, -m.stars, m.last_star_ts or float("inf")),
+        )
+
+    def days(self) -> list[int]:
+        """Get the days anyone has a star for, in order."""
+        return sorted(
+            {int(day) for m in self.members.values() for day in m.completion_day_level}
+        )
+
+
+class CachedLeaderboard(BaseModel):
+    """A leaderboard as last fetched, with what is needed to refetch it."""
+
+    leaderboard: Leaderboard = Field(default_factory=Leaderboard)
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+    def age(self, now: float) -> float:
+        """Get the seconds since the leaderboard was fetched or revalidated."""
+        return now - self.fetched_at
+
+    def is_stale(self, now: float) -> bool:
+        """Check whether AOC may be asked for a fresh copy."""
+        return self.age(now) >= REFRESH_INTERVAL
+
+
+class LeaderboardCache:
+    """Fetched leaderboards, one JSON file per year and leaderboard."""
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the files (defaults to
+                ``settings.cache_dir / "leaderboards"``)
+        """
+        self.cache_dir = cache_dir or settings.cache_dir / "leaderboards"
+
+    def path(self, leaderboard_id: str, year: int = 2025) -> Path:
+        """Get the file holding a leaderboard."""
+        return self.cache_dir / f"{year}-{leaderboard_id}.json"
+
+    def get(self, leaderboard_id: str, year: int = 2025) -> CachedLeaderboard | None:
+        """Get a cached leaderboard, or None if it was never fetched."""
+        path = self.path(leaderboard_id, year)
+        if not path.exists():
+            return None
+        return JsonStore(path, CachedLeaderboard).read()
+
+    def save(
+        self, leaderboard_id: str, cached: CachedLeaderboard, year: int = 2025
+    ) -> None:
+        """Store a fetched leaderboard, replacing any older copy."""
+        JsonStore(self.path(leaderboard_id, year), CachedLeaderboard).write(cached)
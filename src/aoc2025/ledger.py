@@ -0,0 +1,152 @@
+"""Local record of submitted answers and what AOC said about them.
+
+Wrong answers often come with a hint that the answer is too high or too
+low. The ledger keeps every verdict per day and part and turns those hints
+into bounds, so a guess that is already known to be wrong, falls outside
+the bounds, or is for a part that is already solved can be answered
+locally, without a request and without starting another cooldown.
+"""
+
+import re
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .config import settings
+from .models import SubmissionResponse
+from .store import JsonStore
+
+INTEGER_PATTERN = re.compile(r"-?\d+")
+
+
+class PartRecord(BaseModel):
+    """Everything known about the answer to one part."""
+
+    correct: str | None = None
+    wrong: list[str] = Field(default_factory=list)
+    above: int | None = Field(
+        default=None, description="Largest answer known to be too low"
+    )
+    below: int | None = Field(
+        default=None, description="Smallest answer known to be too high"
+    )
+
+
+class LedgerState(BaseModel):
+    """Contents of the ledger file."""
+
+    parts: dict[str, PartRecord] = Field(default_factory=dict)
+
+
+def _key(day: int, part: int) -> str:
+    return f"{day}-{part}"
+
+
+def _as_int(answer: str) -> int | None:
+    return int(answer) if INTEGER_PATTERN.fullmatch(answer) else None
+
+
+class AnswerLedger:
+    """Submitted answers and verdicts per day and part, kept in a JSON file."""
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the ledger.
+
+        Args:
+            path: Ledger file (defaults to ``settings.ledger_file``)
+        """
+        self.path = path or settings.ledger_file
+        self._store = JsonStore(self.path, LedgerState)
+
+    def get(self, day: int, part: int) -> PartRecord:
+        """Get what is known about one part."""
+        return self._store.read().parts.get(_key(day, part), PartRecord())
+
+    def check(
+        self, day: int, part: Literal[1, 2], answer: int | str
+    ) -> SubmissionResponse | None:
+        """Judge an answer from the ledger alone, if possible.
+
+        Returns:
+            A response marked ``from_ledger`` if the verdict is already
+            known, or None if the answer has to be submitted to find out
+        """
+        answer = str(answer).strip()
+        record = self.get(day, part)
+
+        if record.correct is not None:
+            if answer == record.correct:
+                return SubmissionResponse(
+                    success=True,
+                    message=f"{answer} is the right answer (already solved).",
+                    from_ledger=True,
+                )
+            return SubmissionResponse(
+                success=False,
+                message=f"Part already solved with {record.correct}.",
+                already_completed=True,
+                from_ledger=True,
+            )
+
+        if answer in record.wrong:
+            return SubmissionResponse(
+                success=False,
+                message=f"{answer} was already submitted and is wrong.",
+                from_ledger=True,
+            )
+
+        value = _as_int(answer)
+        if value is not None and record.above is not None and value <= record.above:
+            return SubmissionResponse(
+                success=False,
+                message=f"{answer} is too low: {record.above} already was.",
+                hint="too_low",
+                from_ledger=True,
+            )
+        if value is not None and record.below is not None and value >= record.below:
+            return SubmissionResponse(
+                success=False,
+                message=f"{answer} is too high: {record.below} already was.",
+                hint="too_high",
+                from_ledger=True,
+            )
+        return None
+
+    def record(
+        self,
+        day: int,
+        part: Literal[1, 2],
+        answer: int | str,
+        response: SubmissionResponse,
+    ) -> None:
+        """Store the verdict for a submitted answer.
+
+        Responses without a verdict (answering too soon, unknown pages) and
+        responses that came from the ledger itself are ignored.
+        """
+        if response.from_ledger:
+            return
+        if not response.success and response.cooldown is None:
+            return
+
+        answer = str(answer).strip()
+        with self._store.update() as state:
+            record = state.parts.setdefault(_key(day, part), PartRecord())
+            if response.success:
+                record.correct = answer
+                return
+
+            if answer not in record.wrong:
+                record.wrong.append(answer)
+            value = _as_int(answer)
+            if value is None:
+                return
+            if response.hint == "too_low":
+                record.above = (
+                    value if record.above is None else max(record.above, value)
+                )
+            elif response.hint == "too_high":
+                record.below = (
+                    value if record.below is None else min(record.below, value)
+                )
@@ -0,0 +1,26 @@
+"""Reusable building blocks for Advent of Code solutions."""
+
+from .bitgrid import BitGrid
+from .bitset import BitSet
+from .graph import bfs, dijkstra
+from .grid import ALL_DIRECTIONS, DIAGONAL, ORTHOGONAL, Grid
+from .intervals import IntervalSet
+from .parsing import int_array, int_rows, ints, positive_ints
+from .unionfind import UnionFind
+
+__all__ = [
+    "ALL_DIRECTIONS",
+    "DIAGONAL",
+    "ORTHOGONAL",
+    "BitGrid",
+    "BitSet",
+    "Grid",
+    "IntervalSet",
+    "UnionFind",
+    "bfs",
+    "dijkstra",
+    "int_array",
+    "int_rows",
+    "ints",
+    "positive_ints",
+]
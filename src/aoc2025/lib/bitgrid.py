@@ -0,0 +1,175 @@
+"""Boolean grids packed one bit per cell into a single Python int."""
+
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+from .grid import ALL_DIRECTIONS
+
+
+@lru_cache(maxsize=8)
+def _full_mask(width: int, height: int) -> int:
+    """Get a mask with every cell set and every padding bit clear."""
+    # Parsing a base-2 string is linear time, unlike big-integer division
+    return int(("0" + "1" * width) * height or "0", 2)
+
+
+class BitGrid:
+    """Rectangular boolean grid stored as the bits of one arbitrary-size int.
+
+    Cell ``(x, y)`` is bit ``y * (width + 1) + x``. Each row has one extra,
+    always-clear padding bit, so shifting the whole grid left or right by one
+    never carries a cell into the neighbouring row. Whole-grid operations
+    like neighbour counting therefore cost a handful of big-integer shifts
+    and bitwise operations instead of a Python loop per cell, and storage is
+    one bit per cell (a 10k x 10k grid takes about 12 MB).
+    """
+
+    __slots__ = ("width", "height", "bits")
+
+    def __init__(self, width: int, height: int, bits: int = 0):
+        """Create a grid from its dimensions and packed bits.
+
+        ``bits`` must only use cell bits; padding bits have to stay clear.
+        """
+        self.width = width
+        self.height = height
+        self.bits = bits
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], on: str = "#") -> "BitGrid":
+        """Create a grid from lines of text, setting cells equal to ``on``."""
+        rows = list(lines)
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All grid lines must have the same length")
+
+        # Build the bit string most significant first: last row, last column
+        table = {ord(c): "0" for c in set("".join(rows))}
+        table[ord(on)] = "1"
+        binary = "".join("0" + row.translate(table)[::-1] for row in reversed(rows))
+        return cls(width, len(rows), int(binary, 2) if binary else 0)
+
+    @property
+    def stride(self) -> int:
+        """Get the number of bits per row, including the padding bit."""
+        return self.width + 1
+
+    def __contains__(self, pos: tuple[int, int]) -> bool:
+        """Check if the cell at (x, y) is set."""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return (self.bits >> (y * self.stride + x)) & 1 == 1
+
+    def __len__(self) -> int:
+        """Get the number of set cells."""
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return (self.width, self.height, self.bits) == (
+            other.width,
+            other.height,
+            other.bits,
+        )
+
+    # set() changes the grid in place, so grids are unhashable like lists
+    __hash__ = None
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self.width, self.height, self.bits & other.bits)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self.width, self.height, self.bits | other.bits)
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self.width, self.height, self.bits & ~other.bits)
+
+    def render(self, on: str = "#", off: str = ".") -> str:
+        """Render the grid as lines of text."""
+        stride = self.stride
+        binary = format(self.bits, f"0{stride * self.height}b")
+        lines = []
+        for y in range(self.height):
+            # Bits are stored least significant first, so rows read backwards
+            start = len(binary) - (y + 1) * stride
+            row = binary[start + 1 : start + stride][::-1]
+            lines.append(row.replace("1", on).replace("0", off))
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def set(self, x: int, y: int, value: bool = True) -> None:
+        """Set or clear the cell at (x, y)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position {(x, y)} is outside the grid")
+        bit = 1 << (y * self.stride + x)
+        self.bits = self.bits | bit if value else self.bits & ~bit
+
+    def positions(self) -> Iterator[tuple[int, int]]:
+        """Iterate over set cells as (x, y), row by row."""
+        stride = self.stride
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            index = low.bit_length() - 1
+            yield index % stride, index // stride
+            bits ^= low
+
+    def shifted(self, dx: int, dy: int) -> "BitGrid":
+        """Get a grid where each cell holds the value of its (dx, dy) neighbour.
+
+        Neighbours outside the grid read as clear.
+        """
+        offset = dy * self.stride + dx
+        bits = self.bits >> offset if offset > 0 else self.bits << -offset
+        return BitGrid(
+            self.width, self.height, bits & _full_mask(self.width, self.height)
+        )
+
+    def neighbour_count_planes(
+        self, directions: Iterable[tuple[int, int]] = ALL_DIRECTIONS
+    ) -> list[int]:
+        """Count set neighbours of every cell at once, as bit planes.
+
+        Each direction contributes one shifted copy of the grid, and the
+        copies are summed with bitwise ripple-carry adders across all cells
+        in parallel.
+
+        Returns:
+            Bit planes ``[ones, twos, fours, ...]``; the count for a cell is
+            the sum of its bit in plane ``i`` times ``2**i``
+        """
+        directions = list(directions)
+        planes = [0] * max(len(directions).bit_length(), 1)
+        for dx, dy in directions:
+            carry = self.shifted(dx, dy).bits
+            for i, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[i], carry = plane ^ carry, plane & carry
+        return planes
+
+    def with_neighbours_fewer_than(
+        self, n: int, directions: Iterable[tuple[int, int]] = ALL_DIRECTIONS
+    ) -> "BitGrid":
+        """Get the set cells that have fewer than ``n`` set neighbours."""
+        planes = self.neighbour_count_planes(directions)
+        if n >= 1 << len(planes):
+            return BitGrid(self.width, self.height, self.bits)
+
+        # Compare each cell's count with n bit by bit, most significant first
+        equal, greater = _full_mask(self.width, self.height), 0
+        for i in reversed(range(len(planes))):
+            if (n >> i) & 1:
+                equal &= planes[i]
+            else:
+                greater |= equal & planes[i]
+                equal &= ~planes[i]
+        at_least_n = greater | equal
+        return BitGrid(self.width, self.height, self.bits & ~at_least_n)
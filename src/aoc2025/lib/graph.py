@@ -0,0 +1,77 @@
+"""Shortest paths over implicit graphs.
+
+Graphs are described by a neighbour function instead of an adjacency
+structure, so states can be generated on the fly (positions, tuples of
+positions and keys, ...). Nodes only need to be hashable.
+"""
+
+import heapq
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from itertools import count
+
+
+def bfs[N: Hashable](
+    start: N,
+    neighbours: Callable[[N], Iterable[N]],
+    goal: Callable[[N], bool] | None = None,
+) -> dict[N, int]:
+    """Breadth-first search from start over unit-cost edges.
+
+    Args:
+        start: Start node
+        neighbours: Function returning the nodes reachable in one step
+        goal: Optional predicate; search stops once a goal node is reached
+
+    Returns:
+        Distance in steps to every node visited
+    """
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        if goal is not None and goal(node):
+            break
+        next_distance = distances[node] + 1
+        for neighbour in neighbours(node):
+            if neighbour not in distances:
+                distances[neighbour] = next_distance
+                queue.append(neighbour)
+    return distances
+
+
+def dijkstra[N: Hashable](
+    start: N,
+    neighbours: Callable[[N], Iterable[tuple[N, int]]],
+    goal: Callable[[N], bool] | None = None,
+) -> dict[N, int]:
+    """Dijkstra's shortest paths from start over non-negative edge costs.
+
+    Args:
+        start: Start node
+        neighbours: Function returning (node, cost) pairs for outgoing edges
+        goal: Optional predicate; search stops once a goal node is settled
+
+    Returns:
+        Shortest distance to every settled node
+    """
+    settled: dict[N, int] = {}
+    best = {start: 0}
+    # The counter breaks ties so nodes themselves never need to be comparable
+    tie = count()
+    heap = [(0, next(tie), start)]
+    while heap:
+        distance, _, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled[node] = distance
+        if goal is not None and goal(node):
+            break
+        for neighbour, cost in neighbours(node):
+            new_distance = distance + cost
+            if neighbour not in settled and new_distance < best.get(
+                neighbour, new_distance + 1
+            ):
+                best[neighbour] = new_distance
+                heapq.heappush(heap, (new_distance, next(tie), neighbour))
+    return settled
@@ -0,0 +1,164 @@
+"""Dense character grids with neighbour iteration."""
+
+from collections.abc import Iterable, Iterator
+
+# (dx, dy) offsets; y grows downwards like line numbers in the input
+ORTHOGONAL = ((0, -1), (1, 0), (0, 1), (-1, 0))
+DIAGONAL = ((1, -1), (1, 1), (-1, 1), (-1, -1))
+ALL_DIRECTIONS = (
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1),
+)
+
+
+class Grid:
+    """Rectangular grid of single-byte cells stored in one ``bytearray``.
+
+    Cells are addressed as ``grid[x, y]`` and hold one-character strings.
+    Storing one byte per cell instead of a list of lists of strings keeps
+    large maps compact and makes copying and searching C-level operations.
+    """
+
+    __slots__ = ("width", "height", "_cells")
+
+    def __init__(self, width: int, height: int, fill: str = "."):
+        """Create a grid filled with a single character."""
+        self.width = width
+        self.height = height
+        self._cells = bytearray(fill.encode("ascii") * (width * height))
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "Grid":
+        """Create a grid from equally long lines of text."""
+        rows = [line.encode("ascii") for line in lines]
+        grid = cls(len(rows[0]) if rows else 0, len(rows))
+        if any(len(row) != grid.width for row in rows):
+            raise ValueError("All grid lines must have the same length")
+        grid._cells = bytearray(b"".join(rows))
+        return grid
+
+    def __getitem__(self, pos: tuple[int, int]) -> str:
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position {pos} is outside the grid")
+        return chr(self._cells[y * self.width + x])
+
+    def __setitem__(self, pos: tuple[int, int], value: str) -> None:
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position {pos} is outside the grid")
+        self._cells[y * self.width + x] = ord(value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self._cells == other._cells
+
+    # Cells can be changed in place, so grids are unhashable like lists
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows())
+
+    def copy(self) -> "Grid":
+        """Get an independent copy of the grid."""
+        grid = Grid(self.width, self.height)
+        grid._cells = self._cells[:]
+        return grid
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Check if a position is inside the grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def rows(self) -> Iterator[str]:
+        """Iterate over the rows as strings."""
+        for y in range(self.height):
+            start = y * self.width
+            yield self._cells[start : start + self.width].decode("ascii")
+
+    def neighbours(
+        self,
+        x: int,
+        y: int,
+        directions: Iterable[tuple[int, int]] = ALL_DIRECTIONS,
+    ) -> Iterator[tuple[int, int]]:
+        """Iterate over in-bounds neighbour positions of a cell."""
+        width, height = self.width, self.height
+        for dx, dy in directions:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                yield nx, ny
+
+    def count_neighbours(
+        self,
+        x: int,
+        y: int,
+        value: str,
+        directions: Iterable[tuple[int, int]] = ALL_DIRECTIONS,
+    ) -> int:
+        """Count neighbours of a cell holding a given character."""
+        target = ord(value)
+        cells, width, height = self._cells, self.width, self.height
+        total = 0
+        for dx, dy in directions:
+            nx, ny = x + dx, y + dy
+            if (
+                0 <= nx < width
+                and 0 <= ny < height
+                and cells[ny * width + nx] == target
+            ):
+                total += 1
+        return total
+
+    def neighbour_counts(
+        self, value: str, directions: Iterable[tuple[int, int]] = ALL_DIRECTIONS
+    ) -> bytes:
+        """Count neighbours holding a character for every cell at once.
+
+        The grid is turned into one big integer with a byte per cell (plus a
+        zero padding byte per row so shifts never wrap into the next row),
+        and the shifted copies for each direction are added together. Counts
+        never exceed 8, so no byte overflows into its neighbour.
+
+        Returns:
+            One count per cell, indexed as ``y * width + x``
+        """
+        width, height = self.width, self.height
+        stride = width + 1
+        size = stride * height
+
+        table = bytearray(256)
+        table[ord(value)] = 1
+        mask = self._cells.translate(table)
+        padded = b"".join(
+            mask[y * width : (y + 1) * width] + b"\0" for y in range(height)
+        )
+        bits = int.from_bytes(padded, "little")
+
+        total = 0
+        for dx, dy in directions:
+            offset = (dy * stride + dx) * 8
+            total += bits >> offset if offset > 0 else bits << -offset
+
+        total &= (1 << (size * 8)) - 1
+        counts = total.to_bytes(size, "little")
+        return b"".join(counts[y * stride : y * stride + width] for y in range(height))
+
+    def find_all(self, value: str) -> Iterator[tuple[int, int]]:
+        """Iterate over positions holding a character, row by row."""
+        target = value.encode("ascii")
+        cells, width = self._cells, self.width
+        index = cells.find(target)
+        while index != -1:
+            yield index % width, index // width
+            index = cells.find(target, index + 1)
+
+    def count(self, value: str) -> int:
+        """Count cells holding a character."""
+        return self._cells.count(value.encode("ascii"))
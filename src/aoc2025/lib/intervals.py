@@ -0,0 +1,90 @@
+"""Sets of integers stored as sorted, merged inclusive ranges."""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+
+
+class IntervalSet:
+    """Immutable set of integers stored as disjoint inclusive ranges.
+
+    Ranges are merged on construction (overlapping and adjacent ranges become
+    one) and kept in two parallel ``array('q')`` buffers, so membership is a
+    binary search and values must fit in a signed 64-bit integer.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()):
+        """Build the set from inclusive (start, end) ranges in any order."""
+        self._starts = array("q")
+        self._ends = array("q")
+
+        for start, end in sorted(ranges):
+            if start > end:
+                raise ValueError(f"Range start {start} is after end {end}")
+            if self._ends and start <= self._ends[-1] + 1:
+                if end > self._ends[-1]:
+                    self._ends[-1] = end
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+
+    def __contains__(self, value: int) -> bool:
+        """Check if a value is in any range."""
+        i = bisect_right(self._starts, value) - 1
+        return i >= 0 and value <= self._ends[i]
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the merged (start, end) ranges in order."""
+        return zip(self._starts, self._ends, strict=True)
+
+    def __len__(self) -> int:
+        """Get the number of merged ranges."""
+        return len(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self) -> int:
+        return hash((self._starts.tobytes(), self._ends.tobytes()))
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)!r})"
+
+    @property
+    def size(self) -> int:
+        """Get the number of integers covered by the set."""
+        return sum(self._ends) - sum(self._starts) + len(self._starts)
+
+    def range_containing(self, value: int) -> tuple[int, int] | None:
+        """Get the merged range containing a value, if any."""
+        i = bisect_right(self._starts, value) - 1
+        if i >= 0 and value <= self._ends[i]:
+            return self._starts[i], self._ends[i]
+        return None
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """Get the set of integers in either set."""
+        return IntervalSet([*self, *other])
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """Get the set of integers in both sets."""
+        ranges: list[tuple[int, int]] = []
+        a, b = list(self), list(other)
+        i = j = 0
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+            if start <= end:
+                ranges.append((start, end))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(ranges)
+
+    __or__ = union
+    __and__ = intersection
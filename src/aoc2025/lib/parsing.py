@@ -0,0 +1,89 @@
+"""Helpers for pulling numbers out of puzzle input text.
+
+Text is encoded once and every byte that cannot be part of a number is
+mapped to a space with ``bytes.translate``, so tokenizing is a couple of
+C-level passes instead of a regex or per-line ``split``/``int`` calls.
+"""
+
+from array import array
+from typing import Literal, overload
+
+_DIGITS = b"0123456789"
+
+# Translation tables keeping digits (and '-' for signed parsing)
+_UNSIGNED_TABLE = bytes(b if b in _DIGITS else ord(" ") for b in range(256))
+_SIGNED_TABLE = bytes(b if b in _DIGITS + b"-" else ord(" ") for b in range(256))
+
+
+def _tokens(text: str, signed: bool) -> list[bytes]:
+    """Split text into tokens that each read as one integer."""
+    if not signed:
+        return text.encode().translate(_UNSIGNED_TABLE).split()
+
+    data = text.encode().translate(_SIGNED_TABLE)
+    if b"-" in data:
+        # Start a new token at every dash, then drop dashes not followed by a
+        # digit, so tokens match what the regex -?[0-9]+ would find
+        data = data.replace(b"-", b" -").replace(b"- ", b"  ")
+        if data.endswith(b"-"):
+            data = data[:-1]
+    return data.split()
+
+
+def ints(text: str) -> list[int]:
+    """Extract all signed integers from text, in order.
+
+    A ``-`` directly before a digit is read as a sign, so ``"3-5"`` gives
+    ``[3, -5]``; use :func:`positive_ints` for dash-separated ranges.
+    """
+    return list(map(int, _tokens(text, signed=True)))
+
+
+def positive_ints(text: str) -> list[int]:
+    """Extract all unsigned integers from text, in order."""
+    return list(map(int, _tokens(text, signed=False)))
+
+
+def int_array(text: str, signed: bool = True) -> array[int]:
+    """Extract all integers from text into a compact ``array('q')``.
+
+    Args:
+        text: Text to parse
+        signed: Read ``-`` before a digit as a sign instead of a separator
+
+    Raises:
+        OverflowError: If a number does not fit in a signed 64-bit integer
+    """
+    return array("q", list(map(int, _tokens(text, signed))))
+
+
+@overload
+def int_rows(
+    text: str, columns: Literal[2], signed: bool = True
+) -> list[tuple[int, int]]: ...
+
+
+@overload
+def int_rows(
+    text: str, columns: Literal[3], signed: bool = True
+) -> list[tuple[int, int, int]]: ...
+
+
+@overload
+def int_rows(text: str, columns: int, signed: bool = True) -> list[tuple[int, ...]]: ...
+
+
+def int_rows(text: str, columns: int, signed: bool = True) -> list[tuple[int, ...]]:
+    """Extract all integers from text grouped into rows of ``columns`` values.
+
+    The numbers are read in order, e.g. ``columns=2`` turns ``a-b`` ranges
+    into ``(a, b)`` pairs. Rows are built by zipping strided slices of all
+    parsed values instead of splitting the text line by line.
+
+    Raises:
+        ValueError: If the number of integers is not a multiple of columns
+    """
+    values = list(map(int, _tokens(text, signed)))
+    if columns < 1 or len(values) % columns:
+        raise ValueError(f"Cannot shape {len(values)} integers into rows of {columns}")
+    return list(zip(*(values[i::columns] for i in range(columns)), strict=True))
@@ -0,0 +1,61 @@
+"""Disjoint-set forest over integer elements."""
+
+from array import array
+
+
+class UnionFind:
+    """Union-find over elements ``0..n-1`` with path halving and union by size.
+
+    Parents and set sizes are kept in ``array('q')`` buffers rather than
+    dictionaries, so map other keys to dense indices first.
+    """
+
+    __slots__ = ("_parent", "_size", "count")
+
+    def __init__(self, n: int):
+        """Create ``n`` singleton sets."""
+        self._parent = array("q", range(n))
+        self._size = array("q", [1]) * n
+        self.count = n
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self._parent)
+
+    def find(self, x: int) -> int:
+        """Get the representative of the set containing x."""
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets containing a and b.
+
+        Returns:
+            True if the sets were separate and have been merged
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+
+        size = self._size
+        if size[root_a] < size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        size[root_a] += size[root_b]
+        self.count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """Check if a and b are in the same set."""
+        return self.find(a) == self.find(b)
+
+    def set_size(self, x: int) -> int:
+        """Get the size of the set containing x."""
+        return self._size[self.find(x)]
+
+    def set_sizes(self) -> list[int]:
+        """Get the sizes of all sets."""
+        return [self._size[x] for x in range(len(self._parent)) if self.find(x) == x]
@@ -0,0 +1,399 @@
+"""Memoization for pure solution helpers with bounded caches and statistics.
+
+``functools.cache`` grows without bound and only reports hits and misses.
+:func:`memoize` adds an LRU size limit, counts evictions, can persist the
+cache to disk between runs, and registers every cache so ``aoc run --stats``
+can show whether caching actually pays off for each helper.
+"""
+
+import atexit
+import inspect
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from pathlib import Path
+from types import MethodType
+from typing import Any, NamedTuple, overload
+
+from .config import settings
+
+
+class _KwargsMarker:
+    """Separates positional from keyword arguments in cache keys."""
+
+    def __reduce__(self) -> str:
+        # Unpickle as the module-level singleton so persisted keys still match
+        return "_KWARGS"
+
+
+_KWARGS = _KwargsMarker()
+
+# Lone arguments of these types are their own cache key, saving a tuple
+_SCALAR_KEYS = frozenset({int, str, float, bool, type(None)})
+
+
+class CacheInfo(NamedTuple):
+    """Counters for one memoized function."""
+
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+    persisted: bool
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of calls answered from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class CacheChanges(NamedTuple):
+    """What one memoized function did in a worker process since last asked."""
+
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    # New results of a persisted cache, for the parent process to save
+    entries: dict[Hashable, Any]
+
+
+class Memoized[R]:
+    """Callable wrapper caching the results of a pure function.
+
+    Created by :func:`memoize`; see there for the options. Works on plain
+    functions and on methods, where it binds like a regular function.
+
+    Cache hits take no lock, so they cost about as much as a dict lookup.
+    The counters are not locked either, and under concurrent calls they can
+    be slightly off.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., R],
+        maxsize: int | None,
+        persist: bool,
+        is_method: bool,
+        ignore_self: bool,
+    ):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be 0 or more, or None, got {maxsize}")
+
+        self.__wrapped__ = func
+        self.__name__ = func.__name__
+        self.__qualname__ = func.__qualname__
+        self.__doc__ = func.__doc__
+        self.__module__ = func.__module__
+
+        self.maxsize = maxsize
+        self.persist = persist
+        self.is_method = is_method
+        self.ignore_self = ignore_self
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._cache: OrderedDict[Hashable, R] = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = not persist
+        self._dirty = False
+        # Results not yet reported to the parent process (see track_changes)
+        self._unreported: dict[Hashable, R] = {}
+
+        # Reloading a solution module replaces its caches instead of adding more
+        _registry[f"{self.__module__}.{self.__qualname__}"] = self
+
+    def __get__(self, instance: object, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def _key(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+        """Build the cache key for a call."""
+        if self.is_method:
+            if self.ignore_self:
+                args = args[1:]
+            else:
+                # Solutions stand in with a key derived from their input
+                args = (getattr(args[0], "memo_key", args[0]), *args[1:])
+        if kwargs:
+            return (*args, _KWARGS, *kwargs.items())
+        if len(args) == 1 and type(args[0]) in _SCALAR_KEYS:
+            return args[0]
+        return args
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        if not self._loaded:
+            self._load()
+
+        if kwargs or self.is_method or len(args) != 1:
+            key = self._key(args, kwargs)
+        elif type(args[0]) in _SCALAR_KEYS:
+            key = args[0]
+        else:
+            key = args
+        cache = self._cache
+        try:
+            result = cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            if self.maxsize is not None:
+                try:
+                    cache.move_to_end(key)
+                except KeyError:
+                    pass  # Evicted by another thread in the meantime
+            return result
+
+        # Compute outside the lock so recursive helpers do not deadlock
+        result = self.__wrapped__(*args, **kwargs)
+
+        with self._lock:
+            self.misses += 1
+            cache[key] = result
+            self._dirty = True
+            if _tracking and self.persist:
+                self._unreported[key] = result
+            if self.maxsize is not None and len(cache) > self.maxsize:
+                cache.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Get the hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return CacheInfo(
+                name=f"{self.__module__}.{self.__qualname__}",
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._cache),
+                persisted=self.persist,
+            )
+
+    def cache_clear(self, keep_file: bool = False) -> None:
+        """Empty the cache and reset the counters.
+
+        Args:
+            keep_file: Leave the on-disk copy of a persisted cache alone
+                instead of removing it. It is not read back in this process.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._unreported.clear()
+            self.hits = self.misses = self.evictions = 0
+            self._dirty = False
+            self._loaded = True
+        if self.persist and not keep_file:
+            self.cache_path().unlink(missing_ok=True)
+
+    def cache_path(self) -> Path:
+        """Get the file the cache is persisted to.
+
+        The name includes a hash of the file defining the function, so
+        editing a solution starts from an empty cache instead of reusing
+        results from the old code.
+        """
+        from .runner import file_hash
+
+        source = inspect.getsourcefile(self.__wrapped__)
+        version = file_hash(Path(source))[:16] if source else "unknown"
+        name = f"{self.__module__}.{self.__qualname__}-{version}.pickle"
+        return settings.cache_dir / "memo" / name
+
+    def _load(self) -> None:
+        """Fill the cache from disk on first use, ignoring unreadable files."""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            path = self.cache_path()
+            try:
+                with path.open("rb") as f:
+                    entries: dict[Hashable, R] = pickle.load(f)
+            except Exception:
+                # Missing, corrupt, or referring to renamed modules or classes;
+                # unpickling can raise nearly anything for such files
+                return
+            self._cache.update(entries)
+            while self.maxsize is not None and len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def take_changes(self) -> CacheChanges | None:
+        """Get and reset the counters and unreported results, if any."""
+        with self._lock:
+            if not (self.hits or self.misses or self.evictions):
+                return None
+            changes = CacheChanges(
+                name=f"{self.__module__}.{self.__qualname__}",
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=self._unreported,
+            )
+            self.hits = self.misses = self.evictions = 0
+            self._unreported = {}
+            return changes
+
+    def merge_changes(self, changes: CacheChanges) -> None:
+        """Add the counters and results reported by a worker process."""
+        if changes.entries and not self._loaded:
+            self._load()
+        with self._lock:
+            self.hits += changes.hits
+            self.misses += changes.misses
+            self.evictions += changes.evictions
+            if changes.entries:
+                self._cache.update(changes.entries)
+                self._dirty = True
+                while self.maxsize is not None and len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+
+    def save(self) -> None:
+        """Write the cache to disk if it is persisted and has new entries."""
+        if not self.persist:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._cache)
+            self._dirty = False
+
+        path = self.cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename, so readers never see half a file
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+
+
+_registry: dict[str, Memoized[Any]] = {}
+
+# Set in pool workers, whose cache activity is reported to the parent process
+_tracking = False
+
+
+@overload
+def memoize[R](func: Callable[..., R], /) -> Memoized[R]: ...
+
+
+@overload
+def memoize[R](
+    *,
+    maxsize: int | None = 1024,
+    persist: bool = False,
+    ignore_self: bool = False,
+) -> Callable[[Callable[..., R]], Memoized[R]]: ...
+
+
+def memoize[R](
+    func: Callable[..., R] | None = None,
+    /,
+    *,
+    maxsize: int | None = 1024,
+    persist: bool = False,
+    ignore_self: bool = False,
+) -> Memoized[R] | Callable[[Callable[..., R]], Memoized[R]]:
+    """Cache the results of a pure function by its arguments.
+
+    Can be used bare (``@memoize``) or with options (``@memoize(maxsize=64)``).
+    All arguments must be hashable, and picklable when persisting.
+
+    Args:
+        func: Function to wrap
+        maxsize: Maximum number of cached results; the least recently used
+            one is evicted when full. ``None`` means unbounded.
+        persist: Keep the cache in ``settings.cache_dir`` between runs. The
+            file is keyed by a hash of the defining source file.
+        ignore_self: Leave the instance out of a method's cache key, so the
+            method shares its cache between instances. Only use this when the
+            result does not depend on the instance. Otherwise the instance is
+            part of the key; for solutions that is a hash of their input
+            (:attr:`SolutionBase.memo_key
+            <aoc2025.models.SolutionBase.memo_key>`), so results are not
+            shared across inputs, also not through a persisted cache.
+    """
+
+    def decorator(f: Callable[..., R]) -> Memoized[R]:
+        # Functions defined in a class body have the class in their qualname
+        scope = f.__qualname__.removesuffix(f.__name__)
+        is_method = bool(scope) and not scope.endswith("<locals>.")
+        return Memoized(f, maxsize, persist, is_method, ignore_self)
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def cache_stats() -> list[CacheInfo]:
+    """Get the counters of every memoized function, in definition order."""
+    return [memoized.cache_info() for memoized in _registry.values()]
+
+
+def clear_all() -> None:
+    """Empty every cache in memory, leaving persisted copies on disk."""
+    for memoized in _registry.values():
+        memoized.cache_clear(keep_file=True)
+
+
+def track_changes() -> None:
+    """Report cache activity in this process instead of keeping it here.
+
+    Call in pool worker processes. Their counters would never reach
+    ``aoc run --stats`` and their persisted caches would never be saved,
+    since ``atexit`` handlers do not run in them. Instead the worker sends
+    :func:`take_changes` back with its results and the parent process
+    applies them with :func:`merge_changes`.
+    """
+    global _tracking
+    _tracking = True
+
+
+def take_changes() -> list[CacheChanges]:
+    """Get and reset the activity of every cache since the last call."""
+    return [
+        changes
+        for memoized in _registry.values()
+        if (changes := memoized.take_changes()) is not None
+    ]
+
+
+def merge_changes(changes: Iterable[CacheChanges]) -> None:
+    """Apply cache activity reported by worker processes to this process.
+
+    Counters are added to the matching caches, and new results of
+    persisted caches are stored so they are saved at exit. Functions not
+    loaded in this process are skipped.
+    """
+    for change in changes:
+        memoized = _registry.get(change.name)
+        if memoized is not None:
+            memoized.merge_changes(change)
+
+
+def save_all() -> None:
+    """Write all persisted caches with new entries to disk.
+
+    Caches that cannot be written are skipped; they only cost a recompute.
+    Worker processes leave saving to their parent (see :func:`track_changes`).
+    """
+    if _tracking:
+        return
+    for memoized in _registry.values():
+        try:
+            memoized.save()
+        except (OSError, pickle.PicklingError):
+            continue
+
+
+atexit.register(save_all)
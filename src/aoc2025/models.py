@@ -1,11 +1,21 @@
 """Pydantic models for AOC toolkit."""
 
+import hashlib
+import random
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Callable, Sequence
+from functools import cached_property
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal, Self, overload
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from .debug import Message, debug_level, emit
+from .lib.parsing import int_array, int_rows
+from .memo import Memoized
+from .parallel import parallel_map
+from .shared import SharedInput
 
 class Config(BaseModel):
     """Configuration for AOC."""
@@ -27,7 +37,19 @@ class SubmissionResponse(BaseModel):
 
     success: bool
     message: str
-    wait_time: int | None = None
+    wait_time: int | None = Field(
+        default=None, description="Seconds left before another answer is accepted"
+    )
+    cooldown: int | None = Field(
+        default=None, description="Seconds to wait after this wrong answer"
+    )
+    hint: Literal["too_high", "too_low"] | None = Field(
+        default=None, description="Direction hint given with a wrong answer"
+    )
+    already_completed: bool = False
+    from_ledger: bool = Field(
+        default=False, description="Judged from earlier verdicts without a request"
+    )
 
 
 class DayInfo(BaseModel):
@@ -40,6 +62,23 @@ class DayInfo(BaseModel):
     solution_path: Path | None = None
 
 
+class PartResult(BaseModel):
+    """Answer and measurements from running one part of a solution."""
+
+    day: int = Field(..., ge=1, le=25)
+    part: int = Field(..., ge=1, le=2)
+    answer: str
+    duration: float = Field(..., description="Solve time in seconds")
+    parse_duration: float | None = Field(
+        default=None, description="Time to load and split the input in seconds"
+    )
+    peak_memory: int | None = Field(
+        default=None, description="Peak traced memory in bytes"
+    )
+    solution_hash: str = ""
+    input_hash: str = ""
+
+
 class SolutionBase(ABC, BaseModel):
     """Base class for all day solutions using Pydantic."""
 
@@ -51,10 +90,14 @@ class SolutionBase(ABC, BaseModel):
         default_factory=list, description="Input split into lines"
     )
 
+    _shared: SharedInput | None = PrivateAttr(default=None)
+
     class Config:
         """Pydantic config."""
 
         arbitrary_types_allowed = True
+        # @memoize'd methods are not fields
+        ignored_types = (Memoized,)
 
     def model_post_init(self, __context: Any) -> None:
         """Initialize after model creation."""
@@ -62,10 +105,143 @@ class SolutionBase(ABC, BaseModel):
             self.input_lines = self.raw_input.strip().split("\n")
 
     @classmethod
-    def from_file(cls, file_path: Path) -> "SolutionBase":
-        """Load solution from input file."""
-        raw_input = file_path.read_text()
-        return cls(raw_input=raw_input)
+    def from_file(cls, file_path: Path, shared: bool = False) -> "SolutionBase":
+        """Load solution from input file.
+
+        Args:
+            file_path: Input file to read
+            shared: Also place the input in shared memory for worker processes
+        """
+        if not shared:
+            return cls(raw_input=file_path.read_text())
+
+        data = file_path.read_bytes()
+        solution = cls(raw_input=data.decode())
+        solution._shared = SharedInput.from_bytes(data)
+        return solution
+
+    @classmethod
+    def from_shared(cls, shared: SharedInput) -> "SolutionBase":
+        """Create a solution from input another process placed in shared memory.
+
+        :attr:`raw_bytes` and :meth:`int_view` read the shared memory
+        directly, so worker functions that stick to them share one copy of
+        the input. ``raw_input`` and ``input_lines`` are decoded from it once
+        here, without validating them again.
+        """
+        text = shared.text()
+        solution = cls.model_construct(
+            raw_input=text, input_lines=text.strip().split("\n") if text else []
+        )
+        solution._shared = shared
+        return solution
+
+    @property
+    def raw_bytes(self) -> memoryview:
+        """Read-only view of the input bytes.
+
+        Zero-copy when the input is in shared memory, as it is in
+        :meth:`parallel_map` workers.
+        """
+        if self._shared is not None:
+            return self._shared.raw
+        return memoryview(self.raw_input.encode()).toreadonly()
+
+    @cached_property
+    def memo_key(self) -> str:
+        """Hash of the input, standing in for the solution in ``@memoize`` keys."""
+        return hashlib.sha256(self.raw_bytes).hexdigest()[:16]
+
+    def share_input(self) -> SharedInput:
+        """Get the input in shared memory, copying it there on first use."""
+        if self._shared is None:
+            self._shared = SharedInput.from_bytes(self.raw_input.encode())
+        return self._shared
+
+    def int_array(self, signed: bool = True) -> array[int]:
+        """Extract all integers from the raw input into an ``array('q')``."""
+        return int_array(self.raw_input, signed)
+
+    def int_view(self, signed: bool = True) -> memoryview:
+        """Get all integers in the raw input as a read-only ``int64`` view.
+
+        With the input in shared memory, the integers are parsed once by the
+        owning process and worker processes read the same memory instead of
+        parsing their own copy. Parse before calling :meth:`parallel_map` so
+        the workers can see the array.
+        """
+        key = "ints" if signed else "positive_ints"
+        shared = self._shared
+        if shared is not None and key in shared:
+            return shared.array(key)
+        if shared is not None and shared.owner:
+            return shared.add_array(key, self.int_array(signed))
+        return memoryview(self.int_array(signed)).toreadonly()
+
+    @overload
+    def int_rows(
+        self, columns: Literal[2], signed: bool = True
+    ) -> list[tuple[int, int]]: ...
+
+    @overload
+    def int_rows(
+        self, columns: Literal[3], signed: bool = True
+    ) -> list[tuple[int, int, int]]: ...
+
+    @overload
+    def int_rows(self, columns: int, signed: bool = True) -> list[tuple[int, ...]]: ...
+
+    def int_rows(self, columns: int, signed: bool = True) -> list[tuple[int, ...]]:
+        """Extract all integers from the raw input grouped into rows."""
+        return int_rows(self.raw_input, columns, signed)
+
+    def parallel_map[C, R](
+        self,
+        fn: Callable[[Self, C], R],
+        chunks: Sequence[C],
+        workers: int | None = None,
+    ) -> list[R]:
+        """Apply ``fn(self, chunk)`` to every chunk across CPU cores.
+
+        ``fn`` must be a module-level function or a method of the solution
+        class. Results come back in chunk order. See
+        :func:`aoc2025.parallel.split_ranges` and
+        :func:`aoc2025.parallel.batched` for building balanced chunks.
+        """
+        return parallel_map(self, fn, chunks, workers)
+
+    def debug(self, message: Message, *args: object, level: int = 1) -> None:
+        """Write a debug message if ``aoc run -v`` asked for this level.
+
+        Formatting is deferred until the message is known to be wanted:
+        pass ``%``-style arguments (``self.debug("ID %d", num)``) or a
+        function returning the text (``self.debug(lambda: grid.render())``).
+        Use level 2 for very chatty output, shown with ``-vv``.
+        """
+        emit(level, message, args)
+
+    def debugging(self, level: int = 1) -> bool:
+        """Check whether debug messages of a level are shown.
+
+        Useful to skip work that only exists to produce debug output.
+        """
+        return debug_level() >= level
+
+    @classmethod
+    def generate_input(cls, rng: random.Random, size: int) -> str | None:
+        """Generate a random puzzle input for ``aoc compare``.
+
+        Optional hook: override to let alternative implementations be
+        checked against each other beyond the test and real inputs.
+
+        Args:
+            rng: Source of randomness; use only this, so seeds reproduce
+            size: Rough number of items (ranges, lines, ...) to generate
+
+        Returns:
+            The input, or None if the day cannot generate inputs
+        """
+        return None
 
     @abstractmethod
     def part_1(self) -> int | str:
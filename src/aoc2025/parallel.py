@@ -0,0 +1,260 @@
+"""Spread independent pieces of a solution over a pool of worker processes.
+
+Workers rebuild the solution once at startup from the solution's
+:class:`~aoc2025.shared.SharedInput`, attaching to the shared memory blocks
+by name instead of having the input pickled into every task. Tasks then
+only carry a reference to the worker function and their chunk of work, and
+results come back in chunk order so reductions over them are deterministic.
+What ``@memoize`` caches did in a worker comes back with each result, so
+``aoc run --stats`` counts it and persisted caches are saved by the parent.
+"""
+
+import atexit
+import math
+import multiprocessing
+import os
+import sys
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .memo import CacheChanges, merge_changes, take_changes, track_changes
+from .shared import SharedInput, SharedInputHandle
+
+if TYPE_CHECKING:
+    from .models import SolutionBase
+
+# Aim for a few chunks per worker so an unlucky slow chunk does not leave
+# the other workers idle at the end
+CHUNKS_PER_WORKER = 4
+
+# Solution instance rebuilt by each worker process in _init_worker
+_worker_solution: "SolutionBase | None" = None
+
+# Set in pool workers: the pool already uses every core, so a nested pool
+# started by the work itself would only oversubscribe them
+_in_worker = False
+
+# Set in threads that must not start pools, such as the showcase's solve
+# jobs: one pool per web worker process would oversubscribe the cores
+_serial_thread = threading.local()
+
+
+class _PoolKey(NamedTuple):
+    """What the workers of a pool were started with."""
+
+    day: int
+    solution_path: str
+    handle: SharedInputHandle
+    workers: int
+
+
+# The last pool started, kept running for later calls on the same input,
+# with the input it was started for: workers start on demand, so one may
+# still have to attach after the solution that owned the input is gone
+_pool: tuple[_PoolKey, ProcessPoolExecutor, SharedInput] | None = None
+_pool_lock = threading.Lock()
+
+
+def default_workers() -> int:
+    """Get the number of CPU cores this process may use."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_pieces() -> int:
+    """Get how many chunks to split work into for the default pool size."""
+    return default_workers() * CHUNKS_PER_WORKER
+
+
+def split_ranges(
+    ranges: Iterable[tuple[int, int]], pieces: int | None = None
+) -> list[list[tuple[int, int]]]:
+    """Split inclusive integer ranges into pieces of roughly equal total size.
+
+    Large ranges are cut so that every piece covers about the same number of
+    integers, no matter how unevenly sized the input ranges are. Order is
+    preserved: concatenating the pieces gives back the original ranges.
+
+    Args:
+        ranges: Inclusive ``(start, end)`` ranges
+        pieces: Number of pieces to aim for (defaults to a few per CPU core)
+
+    Returns:
+        Non-empty lists of ranges, at most ``pieces`` of them
+    """
+    ranges = [(start, end) for start, end in ranges if start <= end]
+    total = sum(end - start + 1 for start, end in ranges)
+    if not total:
+        return []
+
+    target = math.ceil(total / max(pieces or default_pieces(), 1))
+    result: list[list[tuple[int, int]]] = []
+    current: list[tuple[int, int]] = []
+    room = target
+    for start, end in ranges:
+        while start <= end:
+            stop = min(end, start + room - 1)
+            current.append((start, stop))
+            room -= stop - start + 1
+            start = stop + 1
+            if room == 0:
+                result.append(current)
+                current, room = [], target
+    if current:
+        result.append(current)
+    return result
+
+
+def batched[T](items: Sequence[T], pieces: int | None = None) -> list[Sequence[T]]:
+    """Split a sequence into at most ``pieces`` consecutive, similar-size slices.
+
+    ``pieces`` defaults to a few per CPU core.
+    """
+    size = math.ceil(len(items) / max(pieces or default_pieces(), 1)) or 1
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def mark_worker_process() -> None:
+    """Make :func:`parallel_map` run serially by default in this process.
+
+    Call from the initializer of any pool whose workers run solutions.
+    """
+    global _in_worker
+    _in_worker = True
+
+
+def mark_serial_thread() -> None:
+    """Make :func:`parallel_map` run serially by default in this thread.
+
+    Call from the initializer of thread pools that run solutions inside a
+    long-lived server process.
+    """
+    _serial_thread.active = True
+
+
+def _serial_by_default() -> bool:
+    return _in_worker or getattr(_serial_thread, "active", False)
+
+
+def _init_worker(day: int, solution_path: str, handle: SharedInputHandle) -> None:
+    """Load the solution module and rebuild the solution from shared input."""
+    global _worker_solution
+
+    from .runner import load_solution_class
+
+    mark_worker_process()
+    track_changes()
+
+    Solution = load_solution_class(day, Path(solution_path))
+    _worker_solution = Solution.from_shared(SharedInput.attach(handle))
+
+
+def _get_pool(key: _PoolKey, shared: SharedInput) -> ProcessPoolExecutor:
+    """Get the pool for a solution and input, starting it if needed.
+
+    A pool for anything else is shut down first, so at most one pool of
+    idle workers is kept.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool[0] == key:
+            return _pool[1]
+        if _pool is not None:
+            _pool[1].shutdown(cancel_futures=True)
+        # Spawn fresh interpreters: forking a process that runs threads (like
+        # the showcase server) can deadlock the children
+        executor = ProcessPoolExecutor(
+            max_workers=key.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(key.day, key.solution_path, key.handle),
+        )
+        _pool = (key, executor, shared)
+        return executor
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes kept for :func:`parallel_map`, if any.
+
+    Runs at exit; call it earlier to free the workers' memory sooner.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool[1].shutdown(cancel_futures=True)
+            _pool = None
+
+
+atexit.register(shutdown_pool)
+
+
+def _run_chunk[C, R](
+    fn: Callable[["SolutionBase", C], R], chunk: C
+) -> tuple[R, list[CacheChanges]]:
+    """Apply a worker function to one chunk with the worker's solution.
+
+    Returns:
+        The result and what ``@memoize`` caches did while computing it
+    """
+    if _worker_solution is None:
+        raise RuntimeError("Worker process was not initialized")
+    return fn(_worker_solution, chunk), take_changes()
+
+
+def parallel_map[S: "SolutionBase", C, R](
+    solution: S,
+    fn: Callable[[S, C], R],
+    chunks: Sequence[C],
+    workers: int | None = None,
+) -> list[R]:
+    """Apply ``fn(solution, chunk)`` to every chunk on a process pool.
+
+    ``fn`` is sent to the workers by reference, so it must be a module-level
+    function or a method of the solution class. Each worker has its own
+    copy of the solution, built from the input in shared memory (see
+    :meth:`SolutionBase.share_input`).
+
+    Runs in this process when there is only one worker or one chunk, where
+    starting a pool would only add overhead. Otherwise the pool is kept
+    after the call, so later calls for the same solution and input (like
+    the other part) skip starting and importing in the workers again.
+
+    Args:
+        solution: Solution whose input the workers should use
+        fn: Function taking the solution and one chunk
+        chunks: Independent pieces of work
+        workers: Number of processes (defaults to the usable CPU cores, or
+            1 inside a worker process of another pool or a serial thread)
+
+    Returns:
+        Results in the same order as ``chunks``
+    """
+    workers = min(
+        workers or (1 if _serial_by_default() else default_workers()), len(chunks)
+    )
+    if workers <= 1:
+        return [fn(solution, chunk) for chunk in chunks]
+
+    module = sys.modules[type(solution).__module__]
+    if module.__file__ is None:
+        raise ValueError("Solution must be defined in a file to run in parallel")
+
+    shared = solution.share_input()
+    key = _PoolKey(solution.day, module.__file__, shared.handle(), workers)
+    pool = _get_pool(key, shared)
+    results: list[R] = []
+    try:
+        for result, changes in pool.map(_run_chunk, [fn] * len(chunks), chunks):
+            # Counted and saved here, as if the work had run in this process
+            merge_changes(changes)
+            results.append(result)
+    except BrokenProcessPool:
+        # A worker died; start over with a new pool next time
+        shutdown_pool()
+        raise
+    return results
@@ -0,0 +1,107 @@
+"""Local cache of puzzle descriptions.
+
+Puzzle pages are fetched by :meth:`AOCClient.fetch_puzzle
+<aoc2025.api.AOCClient.fetch_puzzle>`, which keeps the page's title and
+``<article>`` sections here together with the validators needed to refetch
+it conditionally. Everything that only displays a description (the
+scaffolded README, the showcase) reads this cache and never goes online.
+"""
+
+import re
+from pathlib import Path
+
+from bs4 import BeautifulSoup, Tag
+from pydantic import BaseModel, Field
+
+from .config import settings
+from .store import JsonStore
+
+# "--- Day 1: Secret Entrance ---"
+TITLE_PATTERN = re.compile(r"---\s*Day\s+\d+:\s*(.*?)\s*---")
+
+# Markup kept in cached articles; everything else is unwrapped to its text
+ALLOWED_TAGS = {
+    "h2", "p", "em", "code", "pre", "ul", "ol", "li", "a", "span", "br",
+}  # fmt: skip
+ALLOWED_ATTRIBUTES = {"a": {"href", "title"}, "span": {"title"}}
+
+
+class PuzzlePage(BaseModel):
+    """Description of one day's puzzle as last fetched."""
+
+    day: int = Field(default=0, ge=0, le=25)
+    year: int = 0
+    title: str = ""
+    articles: list[str] = Field(
+        default_factory=list, description="Sanitized HTML of each part's article"
+    )
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+
+def _clean_article(article: Tag, base_url: str) -> str:
+    """Reduce an article to harmless markup with absolute links."""
+    for tag in article.find_all(["script", "style"]):
+        tag.decompose()
+    for tag in article.find_all(True):
+        if tag.name not in ALLOWED_TAGS:
+            tag.unwrap()
+        else:
+            allowed = ALLOWED_ATTRIBUTES.get(tag.name, set())
+            tag.attrs = {k: v for k, v in tag.attrs.items() if k in allowed}
+            href = tag.get("href")
+            if not isinstance(href, str):
+                continue
+            if href.startswith("/"):
+                tag["href"] = base_url + href
+            elif not href.startswith(("https://", "http://")):
+                del tag["href"]
+    return article.decode_contents()
+
+
+def parse_puzzle_page(html: str, day: int, year: int, base_url: str) -> PuzzlePage:
+    """Extract the title and article sections from a puzzle page."""
+    soup = BeautifulSoup(html, "html.parser")
+    articles = soup.find_all("article", class_="day-desc")
+
+    title = ""
+    if articles:
+        heading = articles[0].find("h2")
+        match = TITLE_PATTERN.search(heading.get_text()) if heading else None
+        title = match.group(1) if match else ""
+
+    return PuzzlePage(
+        day=day,
+        year=year,
+        title=title,
+        articles=[_clean_article(a, base_url) for a in articles],
+    )
+
+
+class PuzzleCache:
+    """Fetched puzzle pages, one JSON file per year and day."""
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the pages (defaults to
+                ``settings.cache_dir / "puzzles"``)
+        """
+        self.cache_dir = cache_dir or settings.cache_dir / "puzzles"
+
+    def path(self, day: int, year: int = 2025) -> Path:
+        """Get the file holding a day's page."""
+        return self.cache_dir / f"{year}-day-{day:02d}.json"
+
+    def get(self, day: int, year: int = 2025) -> PuzzlePage | None:
+        """Get a cached page, or None if it was never fetched."""
+        path = self.path(day, year)
+        if not path.exists():
+            return None
+        return JsonStore(path, PuzzlePage).read()
+
+    def save(self, page: PuzzlePage) -> None:
+        """Store a fetched page, replacing any older copy."""
+        JsonStore(self.path(page.day, page.year), PuzzlePage).write(page)
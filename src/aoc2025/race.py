@@ -0,0 +1,128 @@
+"""Unlock-to-submit pipeline for ``aoc race``.
+
+Everything that can happen before the unlock does: the solution is
+imported, and shortly before the unlock the client opens its keep-alive
+connection. Then :func:`race` sleeps until the unlock, downloads the input,
+solves part 1 straight from memory and, if asked to, submits the answer
+through the submission queue on the same connection. Each stage is timed
+relative to the unlock.
+
+All waiting and timing goes through the client's ``clock`` and ``sleep``,
+so a rehearsal can run against a local stand-in server (``AOC_BASE_URL``)
+with a fake clock.
+"""
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+import requests
+
+from .api import AOCClient
+from .models import SolutionBase
+from .submissions import QueuedSubmission, SubmissionQueue
+from .unlock import sleep_until
+
+# Seconds before the unlock at which the connection is opened; well within
+# common keep-alive timeouts, so it is still open at the unlock
+CONNECT_LEAD = 10.0
+
+
+class Stage(NamedTuple):
+    """One timed step of a race."""
+
+    name: str
+    # Seconds from the unlock to the start of the stage (negative before it)
+    started: float
+    duration: float
+
+    @property
+    def finished(self) -> float:
+        """Seconds from the unlock to the end of the stage."""
+        return self.started + self.duration
+
+
+class RaceReport(NamedTuple):
+    """What a race did and how long each stage took."""
+
+    day: int
+    input_text: str
+    answer: str
+    stages: list[Stage]
+    submission: QueuedSubmission | None = None
+
+    @property
+    def since_unlock(self) -> float:
+        """Seconds from the unlock to the end of the last stage."""
+        return self.stages[-1].finished if self.stages else 0.0
+
+
+def race(
+    client: AOCClient,
+    day: int,
+    Solution: type[SolutionBase],
+    unlock_at: float,
+    submit: bool = False,
+    queue: SubmissionQueue | None = None,
+    on_stage: Callable[[Stage], None] | None = None,
+) -> RaceReport:
+    """Wait for the unlock, then download, solve and optionally submit part 1.
+
+    Args:
+        client: Client used for all requests, waiting and timing
+        day: Day number (1-25)
+        Solution: The day's already imported ``Solution`` class
+        unlock_at: Unix time the puzzle unlocks (see
+            :func:`~aoc2025.unlock.unlock_time`)
+        submit: Submit the part 1 answer
+        queue: Queue to submit through (defaults to ``SubmissionQueue()``)
+        on_stage: Called with each stage as soon as it is done
+
+    Returns:
+        The input, the answer, the submission's verdict (if submitted) and
+        the stage timings
+    """
+    stages: list[Stage] = []
+
+    def timed[R](name: str, step: Callable[[], R]) -> R:
+        start = client.clock()
+        result = step()
+        stage = Stage(name, start - unlock_at, client.clock() - start)
+        stages.append(stage)
+        if on_stage:
+            on_stage(stage)
+        return result
+
+    if client.clock() < unlock_at - CONNECT_LEAD:
+        sleep_until(unlock_at - CONNECT_LEAD, client.clock, client.sleep)
+
+    def connect() -> None:
+        try:
+            client.connect(day)
+        except requests.RequestException:
+            pass  # The download opens its own connection then
+
+    timed("connect", connect)
+    timed("wait", lambda: sleep_until(unlock_at, client.clock, client.sleep))
+    text = timed("download", lambda: client.download_input(day))
+    answer = timed("solve", lambda: str(Solution(raw_input=text).part_1()))
+
+    submission = None
+    if submit:
+        submit_queue = queue or SubmissionQueue()
+        submission = timed("submit", lambda: _submit(client, submit_queue, day, answer))
+
+    return RaceReport(day, text, answer, stages, submission)
+
+
+def _submit(
+    client: AOCClient, queue: SubmissionQueue, day: int, answer: str
+) -> QueuedSubmission:
+    """Submit part 1 through the queue and get the answer's entry."""
+    entry = queue.enqueue(day, 1, answer)
+    if entry.status != "pending":
+        return entry  # Already judged or solved; nothing to send
+
+    for finished in queue.drain(client):
+        if (finished.day, finished.part, finished.answer) == (day, 1, entry.answer):
+            return finished
+    return entry  # Removed from the queue while draining
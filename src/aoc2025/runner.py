@@ -0,0 +1,126 @@
+"""Loading and running day solutions."""
+
+import hashlib
+import importlib.util
+import sys
+import threading
+import tracemalloc
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+
+from .models import PartResult, SolutionBase
+from .scaffold import DayScaffold
+
+
+def load_solution_module(day: int, solution_path: Path | None = None) -> ModuleType:
+    """Import a day's solution.py from its file path.
+
+    The module is registered in ``sys.modules`` as ``day_XX.solution`` so that
+    objects defined in it can be pickled by reference.
+
+    Raises:
+        FileNotFoundError: If the solution file does not exist
+        ImportError: If the module could not be loaded
+    """
+    if solution_path is None:
+        solution_path = DayScaffold(day).get_solution_path()
+
+    if not solution_path.exists():
+        raise FileNotFoundError(f"Solution file not found: {solution_path}")
+
+    # Register a parent package too, since pickle imports "day_XX" before
+    # looking up "day_XX.solution"
+    package_name = f"day_{day:02d}"
+    if package_name not in sys.modules:
+        package = ModuleType(package_name)
+        package.__path__ = [str(solution_path.parent)]
+        sys.modules[package_name] = package
+
+    module_name = f"{package_name}.solution"
+    spec = importlib.util.spec_from_file_location(module_name, solution_path)
+    if spec is None or spec.loader is None:
+        raise ImportError("Could not load solution module")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_solution_class(
+    day: int, solution_path: Path | None = None
+) -> type[SolutionBase]:
+    """Import a day's solution module and return its ``Solution`` class."""
+    module = load_solution_module(day, solution_path)
+    return module.Solution
+
+
+@lru_cache(maxsize=256)
+def _hash_contents(path: Path, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def file_hash(path: Path) -> str:
+    """Get the SHA-256 of a file, reusing the digest while it is unchanged."""
+    stat = path.stat()
+    return _hash_contents(path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+# tracemalloc is process-wide, so only one traced run may happen at a time
+_trace_lock = threading.Lock()
+
+
+def run_part(
+    solution: SolutionBase,
+    part: int,
+    trace_memory: bool = False,
+    solution_hash: str = "",
+    input_hash: str = "",
+    parse_duration: float | None = None,
+) -> PartResult:
+    """Run one part of a solution and measure it.
+
+    Args:
+        solution: Solution instance with input loaded
+        part: Part number (1 or 2)
+        trace_memory: Record peak memory with tracemalloc (slows the run down)
+        solution_hash: Hash of the solution file, recorded in the result
+        input_hash: Hash of the input file, recorded in the result
+        parse_duration: Time it took to load the input, recorded in the result
+
+    Returns:
+        PartResult with the answer, duration and optional peak memory
+    """
+    if part not in (1, 2):
+        raise ValueError(f"Part must be 1 or 2, got {part}")
+
+    solve = solution.part_1 if part == 1 else solution.part_2
+    peak_memory = None
+
+    if trace_memory:
+        with _trace_lock:
+            tracemalloc.start()
+            try:
+                start = perf_counter()
+                answer = solve()
+                duration = perf_counter() - start
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    else:
+        start = perf_counter()
+        answer = solve()
+        duration = perf_counter() - start
+
+    return PartResult(
+        day=solution.day,
+        part=part,
+        answer=str(answer),
+        duration=duration,
+        parse_duration=parse_duration,
+        peak_memory=peak_memory,
+        solution_hash=solution_hash,
+        input_hash=input_hash,
+    )
@@ -48,7 +48,7 @@ from .solution import Solution
 __all__ = ["Solution"]
 '''
 
-README_TEMPLATE = """# Day {day}: [Title TBD]
+README_TEMPLATE = """# Day {day}: {title}
 
 ## Part 1
 
@@ -63,6 +63,15 @@ TODO: Add notes about part 2
 TODO: Describe your solution approach
 """
 
+ANSWERS_TEMPLATE = """# Known answers, checked by 'aoc verify'
+input:
+  part_1:
+  part_2:
+test_input:
+  part_1:
+  part_2:
+"""
+
 
 class DayScaffold:
     """Create scaffolding for a new day's solution."""
@@ -75,13 +84,18 @@ class DayScaffold:
         self.day = day
         self.year = year
         self.day_dir = settings.solutions_dir / f"day_{day:02d}"
+        self.title = "[Title TBD]"
 
-    def create(self, force: bool = False) -> None:
+    def create(self, force: bool = False, title: str | None = None) -> None:
         """Create the directory structure and files for a day.
 
         Args:
             force: Overwrite existing files if True
+            title: Puzzle title for the README (a placeholder if unknown)
         """
+        if title:
+            self.title = title
+
         if self.day_dir.exists() and not force:
             console.print(
                 f"[yellow]Directory {self.day_dir} already exists. Use --force to overwrite.[/yellow]"
@@ -95,6 +109,7 @@ class DayScaffold:
         self._create_file("__init__.py", INIT_TEMPLATE, force)
         self._create_file("solution.py", SOLUTION_TEMPLATE, force)
         self._create_file("README.md", README_TEMPLATE, force)
+        self._create_file("answers.yml", ANSWERS_TEMPLATE, force)
         self._create_file("input.txt", "", force)
         self._create_file("test_input.txt", "", force)
 
@@ -110,7 +125,7 @@ class DayScaffold:
             console.print(f"[yellow]  Skipping {filename} (already exists)[/yellow]")
             return
 
-        content = template.format(day=self.day, year=self.year)
+        content = template.format(day=self.day, year=self.year, title=self.title)
         file_path.write_text(content)
         console.print(f"[green]  Created {filename}[/green]")
 
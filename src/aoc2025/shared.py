@@ -0,0 +1,196 @@
+"""Puzzle input placed in shared memory so worker processes can attach to it.
+
+The process that loads the input owns the blocks: it copies the raw bytes
+(and any integer arrays parsed from them) into ``multiprocessing.shared_memory``
+once, and workers attach by name and read them without copying. Owned
+blocks are unlinked when the owner is closed, garbage collected or exits;
+if the owner is killed outright, the ``multiprocessing`` resource tracker
+removes them instead. Only processes started by ``multiprocessing`` from the
+owner (and so sharing its resource tracker) should attach.
+"""
+
+import sys
+import weakref
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+
+class SharedInputHandle(NamedTuple):
+    """Picklable description of a :class:`SharedInput` for attaching to it."""
+
+    raw_name: str
+    raw_size: int
+    arrays: tuple[tuple[str, str, int], ...]  # (key, block name, item count)
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    """Get the memory of an open shared memory block."""
+    if shm.buf is None:
+        raise ValueError(f"Shared memory block {shm.name} is closed")
+    return shm.buf
+
+
+def _create_block(data: bytes | memoryview) -> SharedMemory:
+    """Create a shared memory block holding a copy of some bytes."""
+    # Zero-size blocks are not allowed
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    _buffer(shm)[: len(data)] = data
+    return shm
+
+
+def _attach_block(name: str) -> SharedMemory:
+    """Attach to an existing block without taking over its cleanup."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    # Before 3.13 attaching always registers the block with the resource
+    # tracker. Workers started by multiprocessing share the owner's tracker,
+    # where registering a name twice is a no-op, so this leaves cleanup with
+    # the owner. Unregistering here would drop the owner's registration.
+    return SharedMemory(name=name)
+
+
+def _release(
+    blocks: list[SharedMemory], views: dict[str | None, memoryview], unlink: bool
+) -> None:
+    """Close blocks and optionally remove them, tolerating repeated calls.
+
+    The views handed out for the blocks are released first: a block cannot
+    be closed while any view into it is alive, and ``SharedMemory`` would
+    otherwise report that again when it is garbage collected.
+    """
+    for view in views.values():
+        try:
+            view.release()
+        except BufferError:
+            pass  # Something still holds a buffer of the view itself
+    views.clear()
+    for shm in blocks:
+        try:
+            shm.close()
+        except BufferError:
+            # A view derived from a released one (like a slice of it) is
+            # still alive; the OS frees the mapping once this process exits
+            pass
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+    blocks.clear()
+
+
+class SharedInput:
+    """Raw puzzle input and named ``int64`` arrays in shared memory.
+
+    Create with :meth:`from_bytes` in the owning process, pass
+    :meth:`handle` to workers and rebuild there with :meth:`attach`.
+    Arrays have to be added before taking the handle to be visible to
+    workers.
+    """
+
+    def __init__(
+        self, handle: SharedInputHandle, blocks: list[SharedMemory], owner: bool
+    ):
+        """Wrap already created or attached blocks; use the classmethods."""
+        self._raw_size = handle.raw_size
+        self._raw = blocks[0]
+        self._arrays = {
+            key: (shm, count)
+            for (key, _, count), shm in zip(handle.arrays, blocks[1:], strict=True)
+        }
+        self._blocks = blocks
+        # Read-only views handed out, by array key (None for the raw bytes),
+        # so they can be released before the blocks are closed
+        self._views: dict[str | None, memoryview] = {}
+        self.owner = owner
+        # Runs on close(), garbage collection or interpreter exit, whichever
+        # comes first
+        self._finalizer = weakref.finalize(
+            self, _release, self._blocks, self._views, owner
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SharedInput":
+        """Copy raw input into a new shared block owned by this process."""
+        shm = _create_block(data)
+        return cls(SharedInputHandle(shm.name, len(data), ()), [shm], owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedInputHandle) -> "SharedInput":
+        """Attach to blocks created by another process."""
+        names = [handle.raw_name] + [name for _, name, _ in handle.arrays]
+        blocks: list[SharedMemory] = []
+        try:
+            for name in names:
+                blocks.append(_attach_block(name))
+        except BaseException:
+            _release(blocks, {}, unlink=False)
+            raise
+        return cls(handle, blocks, owner=False)
+
+    def handle(self) -> SharedInputHandle:
+        """Get the names and sizes workers need to attach."""
+        arrays = tuple(
+            (key, shm.name, count) for key, (shm, count) in self._arrays.items()
+        )
+        return SharedInputHandle(self._raw.name, self._raw_size, arrays)
+
+    @property
+    def raw(self) -> memoryview:
+        """Zero-copy, read-only view of the raw input bytes."""
+        view = self._views.get(None)
+        if view is None:
+            view = _buffer(self._raw)[: self._raw_size].toreadonly()
+            self._views[None] = view
+        return view
+
+    def text(self) -> str:
+        """Decode the raw input into a string."""
+        return str(self.raw, "utf-8")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._arrays
+
+    def add_array(self, key: str, values: array[int]) -> memoryview:
+        """Copy an ``array('q')`` into a new shared block.
+
+        Returns:
+            Zero-copy, read-only view of the shared copy, indexable like the
+            array
+
+        Raises:
+            PermissionError: If this process does not own the input
+            KeyError: If an array with this key already exists
+        """
+        if not self.owner:
+            raise PermissionError("Only the owning process can add arrays")
+        if key in self._arrays:
+            raise KeyError(f"Shared array {key!r} already exists")
+        if values.typecode != "q":
+            values = array("q", values)
+
+        shm = _create_block(memoryview(values).cast("B"))
+        self._blocks.append(shm)
+        self._arrays[key] = (shm, len(values))
+        return self.array(key)
+
+    def array(self, key: str) -> memoryview:
+        """Get a zero-copy, read-only ``int64`` view of a shared array."""
+        view = self._views.get(key)
+        if view is None:
+            shm, count = self._arrays[key]
+            view = _buffer(shm)[: count * 8].cast("q").toreadonly()
+            self._views[key] = view
+        return view
+
+    def close(self) -> None:
+        """Detach from the blocks, removing them if this process owns them.
+
+        Views returned earlier are released and can no longer be used.
+        Pool workers that are still starting fail to attach once the owner
+        is closed, so stop a pool started for this input first
+        (:func:`aoc2025.parallel.shutdown_pool`).
+        """
+        self._finalizer()
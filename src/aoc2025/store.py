@@ -0,0 +1,115 @@
+"""Pydantic models persisted as JSON files shared between processes."""
+
+import os
+import sys
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import BaseModel
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def lock_file(f: IO[Any], blocking: bool = True) -> None:
+        """Take an exclusive lock on an open file.
+
+        Raises:
+            BlockingIOError: If ``blocking`` is off and the lock is held
+        """
+        # msvcrt locks byte ranges; everyone locks the first byte
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError as e:
+                if not blocking:
+                    raise BlockingIOError(f"{f.name} is locked") from e
+                time.sleep(0.05)
+
+    def unlock_file(f: IO[Any]) -> None:
+        """Release a lock taken with :func:`lock_file`."""
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def lock_file(f: IO[Any], blocking: bool = True) -> None:
+        """Take an exclusive lock on an open file.
+
+        Raises:
+            BlockingIOError: If ``blocking`` is off and the lock is held
+        """
+        fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def unlock_file(f: IO[Any]) -> None:
+        """Release a lock taken with :func:`lock_file`."""
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class JsonStore[M: BaseModel]:
+    """One model instance kept in a JSON file.
+
+    Reads and read-modify-write updates happen under an exclusive lock
+    (``flock``, or ``msvcrt.locking`` on Windows) on a sibling ``.lock``
+    file, and writes replace the file atomically, so concurrent CLI
+    invocations never lose each other's changes or see a half-written file.
+    A missing file reads as the model's defaults.
+    """
+
+    def __init__(self, path: Path, model: type[M]):
+        """Initialize the store.
+
+        Args:
+            path: JSON file holding the model
+            model: Model class; all its fields need defaults
+        """
+        self.path = path
+        self.model = model
+
+    @contextmanager
+    def lock(self) -> Generator[None]:
+        """Hold the exclusive lock guarding the file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.with_suffix(".lock").open("a+") as lock:
+            lock_file(lock)
+            try:
+                yield
+            finally:
+                unlock_file(lock)
+
+    def read(self) -> M:
+        """Get a snapshot of the stored model."""
+        with self.lock():
+            return self._read()
+
+    def write(self, value: M) -> None:
+        """Replace the stored model."""
+        with self.lock():
+            self._write(value)
+
+    @contextmanager
+    def update(self) -> Generator[M]:
+        """Load the model under the lock and save it when the block exits.
+
+        Nothing is saved if the block raises.
+        """
+        with self.lock():
+            value = self._read()
+            yield value
+            self._write(value)
+
+    def _read(self) -> M:
+        if not self.path.exists():
+            return self.model()
+        return self.model.model_validate_json(self.path.read_text())
+
+    def _write(self, value: M) -> None:
+        # Write next to the target and rename, so a crash never truncates it
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(value.model_dump_json(indent=2))
+        os.replace(tmp_path, self.path)
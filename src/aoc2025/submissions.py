@@ -0,0 +1,249 @@
+"""Persistent queue of answers waiting to be submitted.
+
+Advent of Code only accepts an answer every so often: submitting too soon
+is refused with the time left to wait, and every wrong answer starts a
+cooldown of a minute or more. Answers are therefore queued in a JSON file
+and submitted one at a time by a single drainer, which sleeps until the
+server will accept the next one. The queue also remembers every verdict,
+so an answer that was already judged is never sent again.
+"""
+
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .api import AOCClient
+from .config import settings
+from .models import SubmissionResponse
+from .store import JsonStore, lock_file, unlock_file
+
+# Minimum gap between two submissions, even when the server names no cooldown
+MIN_INTERVAL = 5.0
+
+# Cooldown assumed after a wrong answer whose message names none
+DEFAULT_COOLDOWN = 60.0
+
+Status = Literal["pending", "correct", "wrong", "rejected"]
+
+
+class QueuedSubmission(BaseModel):
+    """One answer in the submission queue."""
+
+    day: int = Field(..., ge=1, le=25)
+    part: Literal[1, 2]
+    answer: str
+    status: Status = "pending"
+    queued_at: float
+    submitted_at: float | None = None
+    attempts: int = 0
+    message: str = ""
+
+
+class QueueState(BaseModel):
+    """Contents of the queue file."""
+
+    submissions: list[QueuedSubmission] = Field(default_factory=list)
+    not_before: float = Field(
+        default=0.0, description="Unix time before which nothing may be submitted"
+    )
+
+
+class AlreadyDrainingError(RuntimeError):
+    """Raised when another process is already draining the queue."""
+
+
+class SubmissionQueue:
+    """Answers waiting to be submitted, persisted in a JSON file.
+
+    Every change re-reads the file under an exclusive lock (see
+    :class:`~aoc2025.store.JsonStore`), so several processes (say
+    ``aoc submit`` while a background drainer is waiting) can use the same
+    queue safely. Only one process drains at a time.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        clock: Callable[[], float] | None = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            path: Queue file (defaults to ``settings.queue_file``)
+            clock: Function returning the current Unix time (defaults to the
+                client's clock when draining, ``time.time`` otherwise)
+        """
+        self.path = path or settings.queue_file
+        self._store = JsonStore(self.path, QueueState)
+        self._clock = clock
+
+    def _now(self, client: AOCClient | None = None) -> float:
+        if self._clock is not None:
+            return self._clock()
+        if client is not None:
+            return client.clock()
+        return time.time()
+
+    def state(self) -> QueueState:
+        """Get a snapshot of the queue."""
+        return self._store.read()
+
+    def enqueue(
+        self, day: int, part: Literal[1, 2], answer: int | str
+    ) -> QueuedSubmission:
+        """Add an answer to the queue unless its outcome is already known.
+
+        Answers that were rejected without a verdict (say, by an expired
+        session's login page) can be queued again.
+
+        Returns:
+            The new pending entry, or the existing entry that makes
+            submitting pointless: a pending or wrong copy of the same
+            answer, or the correct answer if the part is already solved
+        """
+        answer = str(answer).strip()
+        with self._store.update() as state:
+            for entry in state.submissions:
+                if entry.day != day or entry.part != part:
+                    continue
+                if entry.status == "correct" or (
+                    entry.answer == answer and entry.status in ("pending", "wrong")
+                ):
+                    return entry.model_copy()
+
+            entry = QueuedSubmission(
+                day=day, part=part, answer=answer, queued_at=self._now()
+            )
+            state.submissions.append(entry)
+            return entry.model_copy()
+
+    def remove(self, day: int, part: int | None = None) -> int:
+        """Drop pending answers for a day (and part), returning how many."""
+        with self._store.update() as state:
+            before = len(state.submissions)
+            state.submissions = [
+                e
+                for e in state.submissions
+                if not (
+                    e.status == "pending"
+                    and e.day == day
+                    and (part is None or e.part == part)
+                )
+            ]
+            return before - len(state.submissions)
+
+    @contextmanager
+    def _drain_lock(self) -> Generator[None]:
+        """Hold the lock that makes this process the only drainer."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.with_suffix(".drain.lock").open("a+") as lock:
+            try:
+                lock_file(lock, blocking=False)
+            except BlockingIOError as e:
+                raise AlreadyDrainingError(
+                    "Another process is already draining the submission queue"
+                ) from e
+            try:
+                yield
+            finally:
+                unlock_file(lock)
+
+    def drain(
+        self,
+        client: AOCClient,
+        on_wait: Callable[[QueuedSubmission, float], None] | None = None,
+        on_result: Callable[[QueuedSubmission, SubmissionResponse], None] | None = None,
+    ) -> list[QueuedSubmission]:
+        """Submit pending answers one by one, oldest first, until none are left.
+
+        Before each submission this waits (with ``client.sleep``) until the
+        server's cooldown has passed. Refusals for answering too soon push
+        the next attempt back by the time the server asks for and keep the
+        answer pending.
+
+        Args:
+            client: Client used to submit and to wait
+            on_wait: Called with the next entry and the seconds to wait
+            on_result: Called with each entry and the server's response
+
+        Returns:
+            The entries that got a verdict, in submission order
+
+        Raises:
+            AlreadyDrainingError: If another process is draining the queue
+        """
+        finished: list[QueuedSubmission] = []
+        with self._drain_lock():
+            while True:
+                state = self.state()
+                pending = [e for e in state.submissions if e.status == "pending"]
+                if not pending:
+                    return finished
+
+                entry = pending[0]
+                delay = state.not_before - self._now(client)
+                if delay > 0:
+                    if on_wait:
+                        on_wait(entry, delay)
+                    client.sleep(delay)
+                    continue
+
+                response = client.submit_answer(entry.day, entry.part, entry.answer)
+                updated = self._apply(entry, response, self._now(client))
+                if on_result:
+                    on_result(updated, response)
+                if updated.status != "pending":
+                    finished.append(updated)
+
+    def _apply(
+        self, entry: QueuedSubmission, response: SubmissionResponse, now: float
+    ) -> QueuedSubmission:
+        """Store the outcome of a submission and schedule the next one."""
+        with self._store.update() as state:
+            match = next(
+                (
+                    e
+                    for e in state.submissions
+                    if (e.day, e.part, e.answer, e.queued_at)
+                    == (entry.day, entry.part, entry.answer, entry.queued_at)
+                ),
+                None,
+            )
+            if match is None:
+                # Removed while we were submitting; keep the verdict anyway
+                match = entry.model_copy()
+                state.submissions.append(match)
+
+            match.attempts += 1
+            match.submitted_at = now
+            match.message = response.message
+            # Verdicts from the ledger cost no request, so need no cooldown
+            next_allowed = 0.0 if response.from_ledger else now + MIN_INTERVAL
+
+            if response.success:
+                match.status = "correct"
+                # Other guesses for a solved part can never be right
+                for other in state.submissions:
+                    if other.status == "pending" and (other.day, other.part) == (
+                        match.day,
+                        match.part,
+                    ):
+                        other.status = "rejected"
+                        other.message = "Part already solved"
+            elif response.wait_time is not None:
+                next_allowed = now + max(response.wait_time, MIN_INTERVAL)
+            elif response.cooldown is not None:
+                match.status = "wrong"
+                next_allowed = now + max(response.cooldown, DEFAULT_COOLDOWN)
+            elif response.from_ledger and not response.already_completed:
+                match.status = "wrong"
+            else:
+                # Already completed, or a response we could not interpret
+                match.status = "rejected"
+
+            state.not_before = max(state.not_before, next_allowed)
+            return match.model_copy()
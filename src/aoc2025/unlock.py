@@ -0,0 +1,47 @@
+"""Puzzle unlock times and waiting for them precisely."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+# Long waits are slept in chunks this long, so a clock that jumps (NTP
+# adjustments, a laptop waking from suspend) is noticed
+MAX_SLEEP = 60.0
+
+# The last stretch before a deadline is slept in short slices, since a
+# single long sleep can overshoot by the scheduler's granularity
+FINE_WINDOW = 0.05
+FINE_SLICE = 0.001
+
+
+def unlock_time(year: int, day: int) -> float:
+    """Get the Unix time a puzzle unlocks (midnight EST, UTC-5)."""
+    return datetime(year, 12, day, 5, 0, 0, tzinfo=UTC).timestamp()
+
+
+def sleep_until(
+    deadline: float,
+    clock: Callable[[], float],
+    sleep: Callable[[float], None],
+) -> float:
+    """Sleep until ``clock()`` reaches a deadline, without busy-waiting.
+
+    Args:
+        deadline: Unix time to wake up at
+        clock: Function returning the current Unix time
+        sleep: Function used for waiting; with a fake clock it should
+            advance that clock
+
+    Returns:
+        Seconds the wake-up was late by (0 or more)
+    """
+    while True:
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return -remaining
+        coarse = min(remaining - FINE_WINDOW, MAX_SLEEP)
+        # A coarse sleep shorter than a slice could be below the clock's
+        # resolution and never move a fake clock, so it is sliced as well
+        if coarse >= FINE_SLICE:
+            sleep(coarse)
+        else:
+            sleep(min(remaining, FINE_SLICE))
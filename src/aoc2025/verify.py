@@ -0,0 +1,338 @@
+"""Check every day's answers against known-good values.
+
+Each day can keep its expected answers in ``solutions/day_XX/answers.yml``::
+
+    input:
+      part_1: 1234
+      part_2: 5678
+    test_input:
+      part_1: 3
+      part_2: 6
+
+:func:`verify_days` runs the days in separate worker processes, several at
+a time, and kills any day that runs past its timeout. Days whose solution,
+inputs and expected answers are unchanged since they last passed are
+skipped, so re-running the suite after touching one day only re-solves
+that day.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import traceback
+from collections import deque
+from collections.abc import Callable, Iterable
+from contextlib import redirect_stdout
+from functools import cache
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from time import monotonic, perf_counter
+from typing import Literal, NamedTuple
+
+import yaml
+from pydantic import BaseModel, Field
+
+from .config import settings
+from .parallel import default_workers, mark_worker_process
+from .runner import file_hash, load_solution_class
+from .scaffold import DayScaffold
+from .store import JsonStore
+
+# Default limit for solving all checked inputs of one day
+DEFAULT_TIMEOUT = 60.0
+
+ANSWERS_FILE = "answers.yml"
+
+InputName = Literal["input", "test_input"]
+Status = Literal["pass", "fail", "error", "timeout", "skipped", "missing"]
+
+
+class PartAnswers(BaseModel):
+    """Expected answers for one input file; unknown parts are left out."""
+
+    part_1: int | str | None = None
+    part_2: int | str | None = None
+
+    def expected(self) -> dict[int, str]:
+        """Get the expected answer per part, as printed by ``aoc run``."""
+        answers = {1: self.part_1, 2: self.part_2}
+        return {part: str(a) for part, a in answers.items() if a is not None}
+
+
+class ExpectedAnswers(BaseModel):
+    """Contents of a day's ``answers.yml``."""
+
+    input: PartAnswers = Field(default_factory=PartAnswers)
+    test_input: PartAnswers = Field(default_factory=PartAnswers)
+
+
+class Check(NamedTuple):
+    """Outcome of one part on one input."""
+
+    input: InputName
+    part: int
+    expected: str
+    actual: str
+
+    @property
+    def passed(self) -> bool:
+        """Whether the answer matched."""
+        return self.expected == self.actual
+
+
+class DayVerdict(NamedTuple):
+    """Outcome of verifying one day."""
+
+    day: int
+    status: Status
+    checks: list[Check]
+    duration: float = 0.0
+    message: str = ""
+
+
+class VerifyState(BaseModel):
+    """Fingerprints of the days that passed their last verification."""
+
+    passed: dict[str, str] = Field(default_factory=dict)
+
+
+def load_expected(day: int) -> ExpectedAnswers | None:
+    """Load a day's expected answers, or None if it has no answers file."""
+    path = DayScaffold(day).day_dir / ANSWERS_FILE
+    if not path.exists():
+        return None
+    return ExpectedAnswers.model_validate(yaml.safe_load(path.read_text()) or {})
+
+
+def _input_paths(day: int) -> dict[InputName, Path]:
+    scaffold = DayScaffold(day)
+    return {
+        "input": scaffold.get_input_path(),
+        "test_input": scaffold.get_test_input_path(),
+    }
+
+
+@cache
+def _package_hash() -> str:
+    """Hash the aoc2025 sources that solutions can import.
+
+    The showcase under ``web/`` is left out, since solutions never use it.
+    """
+    package_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        relative = path.relative_to(package_dir)
+        if relative.parts[0] == "web":
+            continue
+        digest.update(f"{relative.as_posix()}:{file_hash(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def _fingerprint(day: int) -> str:
+    """Hash everything a day's verdict depends on.
+
+    That includes the aoc2025 library, so changing a shared helper re-runs
+    every day instead of trusting earlier passes.
+    """
+    scaffold = DayScaffold(day)
+    paths = [
+        scaffold.get_solution_path(),
+        scaffold.day_dir / ANSWERS_FILE,
+        *_input_paths(day).values(),
+    ]
+    digest = hashlib.sha256(f"aoc2025:{_package_hash()}\n".encode())
+    for path in paths:
+        digest.update(
+            f"{path.name}:{file_hash(path) if path.exists() else ''}\n".encode()
+        )
+    return digest.hexdigest()
+
+
+def _solve_day(
+    day: int,
+    solution_path: Path,
+    work: list[tuple[InputName, Path, list[int]]],
+    conn: Connection,
+) -> None:
+    """Worker process entry point: solve the requested parts and report back.
+
+    Sends ``("ok", [(input, part, answer), ...])`` or ``("error", message)``.
+    """
+    try:
+        mark_worker_process()
+        Solution = load_solution_class(day, solution_path)
+        answers: list[tuple[InputName, int, str]] = []
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            for input_name, input_path, parts in work:
+                solution = Solution.from_file(input_path)
+                for part in parts:
+                    answer = solution.part_1() if part == 1 else solution.part_2()
+                    answers.append((input_name, part, str(answer)))
+        conn.send(("ok", answers))
+    except Exception:
+        conn.send(("error", traceback.format_exc(limit=-3).strip()))
+    finally:
+        conn.close()
+
+
+class _Job(NamedTuple):
+    day: int
+    expected: ExpectedAnswers
+    fingerprint: str
+
+
+class _Running(NamedTuple):
+    job: _Job
+    process: BaseProcess
+    conn: Connection
+    started: float
+    deadline: float
+
+
+def _compare(job: _Job, answers: list[tuple[InputName, int, str]]) -> list[Check]:
+    actual = {(input_name, part): answer for input_name, part, answer in answers}
+    checks: list[Check] = []
+    for input_name in ("input", "test_input"):
+        expected: PartAnswers = getattr(job.expected, input_name)
+        for part, answer in expected.expected().items():
+            checks.append(
+                Check(input_name, part, answer, actual.get((input_name, part), ""))
+            )
+    return checks
+
+
+def verify_days(
+    days: Iterable[int],
+    timeout: float = DEFAULT_TIMEOUT,
+    workers: int | None = None,
+    force: bool = False,
+    state_path: Path | None = None,
+    on_result: Callable[[DayVerdict], None] | None = None,
+) -> list[DayVerdict]:
+    """Solve days in worker processes and compare against expected answers.
+
+    Args:
+        days: Days to verify
+        timeout: Seconds each day may take before its worker is killed
+        workers: Days solved at once (defaults to the number of CPU cores)
+        force: Re-run days that are unchanged since they last passed
+        state_path: File remembering passing days (defaults to
+            ``settings.cache_dir / "verify.json"``)
+        on_result: Called with each verdict as soon as it is known
+
+    Returns:
+        One verdict per day, in the order given
+    """
+    store = JsonStore(state_path or settings.cache_dir / "verify.json", VerifyState)
+    passed = store.read().passed
+    verdicts: dict[int, DayVerdict] = {}
+
+    def finish(verdict: DayVerdict, fingerprint: str | None = None) -> None:
+        verdicts[verdict.day] = verdict
+        if verdict.status != "skipped":
+            with store.update() as state:
+                if fingerprint is not None and verdict.status == "pass":
+                    state.passed[str(verdict.day)] = fingerprint
+                else:
+                    state.passed.pop(str(verdict.day), None)
+        if on_result:
+            on_result(verdict)
+
+    days = list(days)
+    queue: deque[_Job] = deque()
+    for day in days:
+        expected = load_expected(day)
+        if expected is None or not (
+            expected.input.expected() or expected.test_input.expected()
+        ):
+            finish(
+                DayVerdict(day, "missing", [], message=f"No answers in {ANSWERS_FILE}")
+            )
+            continue
+        fingerprint = _fingerprint(day)
+        if not force and passed.get(str(day)) == fingerprint:
+            finish(DayVerdict(day, "skipped", [], message="Unchanged since last pass"))
+            continue
+        queue.append(_Job(day, expected, fingerprint))
+
+    ctx = multiprocessing.get_context("spawn")
+    running: list[_Running] = []
+    limit = max(workers or default_workers(), 1)
+
+    while queue or running:
+        while queue and len(running) < limit:
+            job = queue.popleft()
+            inputs = _input_paths(job.day)
+            work = [
+                (input_name, inputs[input_name], list(parts))
+                for input_name in ("input", "test_input")
+                if (parts := getattr(job.expected, input_name).expected())
+            ]
+            missing = [str(path) for _, path, _ in work if not path.exists()]
+            if missing:
+                finish(DayVerdict(job.day, "error", [], message=f"Missing {missing}"))
+                continue
+
+            parent_conn, child_conn = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_solve_day,
+                args=(
+                    job.day,
+                    DayScaffold(job.day).get_solution_path(),
+                    work,
+                    child_conn,
+                ),
+            )
+            process.start()
+            child_conn.close()
+            now = monotonic()
+            running.append(
+                _Running(job, process, parent_conn, perf_counter(), now + timeout)
+            )
+
+        if not running:
+            continue
+
+        next_deadline = min(r.deadline for r in running)
+        ready = wait([r.conn for r in running], max(next_deadline - monotonic(), 0))
+
+        still_running: list[_Running] = []
+        for r in running:
+            duration = perf_counter() - r.started
+            if r.conn in ready:
+                try:
+                    status, payload = r.conn.recv()
+                except EOFError:
+                    status, payload = "error", "Worker exited without a result"
+                r.process.join()
+                r.conn.close()
+                if status == "ok" and isinstance(payload, list):
+                    checks = _compare(r.job, payload)
+                    ok = all(c.passed for c in checks)
+                    finish(
+                        DayVerdict(
+                            r.job.day, "pass" if ok else "fail", checks, duration
+                        ),
+                        r.job.fingerprint,
+                    )
+                else:
+                    finish(DayVerdict(r.job.day, "error", [], duration, str(payload)))
+            elif monotonic() >= r.deadline:
+                r.process.kill()
+                r.process.join()
+                r.conn.close()
+                finish(
+                    DayVerdict(
+                        r.job.day,
+                        "timeout",
+                        [],
+                        duration,
+                        f"Killed after {timeout:g}s",
+                    )
+                )
+            else:
+                still_running.append(r)
+        running = still_running
+
+    return [verdicts[day] for day in days]
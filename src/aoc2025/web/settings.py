@@ -28,8 +28,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "aoc2025.web.showcase.middleware.MetricsMiddleware",
+    "aoc2025.web.showcase.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "aoc2025.web.showcase.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -66,6 +69,47 @@ DATABASES = {
     }
 }
 
+# Cache
+# Rendered day data is keyed by a fingerprint of the day's files, so entries
+# never need explicit invalidation.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "aoc2025-showcase",
+        "OPTIONS": {"MAX_ENTRIES": 100},
+    }
+}
+
+# Seconds browsers may reuse a showcase page before revalidating with ETag
+SHOWCASE_CACHE_MAX_AGE = int(os.environ.get("SHOWCASE_CACHE_MAX_AGE", "60"))
+
+# Background threads per worker process used to solve days for the showcase
+SHOWCASE_SOLVE_WORKERS = int(os.environ.get("SHOWCASE_SOLVE_WORKERS", "2"))
+
+# Record peak memory of background solves with tracemalloc; traced solves are
+# slower and run one at a time, since tracemalloc is process-wide
+SHOWCASE_TRACE_MEMORY = os.environ.get("SHOWCASE_TRACE_MEMORY", "False") == "True"
+
+# Send a Server-Timing header with the phases of each request (exposes timings
+# of internals, so off by default in production)
+SHOWCASE_SERVER_TIMING = os.environ.get("SHOWCASE_SERVER_TIMING", str(DEBUG)) == "True"
+
+# Log requests slower than this many milliseconds with their phases; 0 disables
+SHOWCASE_SLOW_REQUEST_MS = float(os.environ.get("SHOWCASE_SLOW_REQUEST_MS", "1000"))
+
+# Where highlighted code and rendered READMEs are kept between processes;
+# 'manage.py build_fragments' fills it at build time
+SHOWCASE_FRAGMENT_DIR = Path(
+    os.environ.get("SHOWCASE_FRAGMENT_DIR", BASE_DIR / "fragments")
+)
+
+# Bearer token required to scrape /metrics; leave empty to allow anyone
+SHOWCASE_METRICS_TOKEN = os.environ.get("SHOWCASE_METRICS_TOKEN", "")
+
+# Set by 'aoc export-site' while it renders pages, which leaves out controls
+# that only work against a running server (downloading input, solve polling)
+SHOWCASE_STATIC_EXPORT = False
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -0,0 +1,161 @@
+"""Static export of the showcase.
+
+Every page is rendered once through the regular views, with answers solved
+up front instead of by background jobs, and written out as plain files that
+any static file server can host. Inline ``<style>`` blocks become shared
+stylesheets named after a hash of their contents, so browsers cache them
+across pages and forever, and every text file gets a gzipped sibling for
+servers that serve pre-compressed files (``gzip_static`` in nginx, for
+example).
+"""
+
+import gzip
+import hashlib
+import os
+import re
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import NamedTuple
+
+from aoc2025.config import settings as aoc_settings
+from aoc2025.scaffold import DayScaffold
+
+from .history import ensure_django
+
+STYLE_PATTERN = re.compile(r"<style>(.*?)</style>", re.DOTALL)
+
+# Signs of a CSRF token in a page, which must never be published
+CSRF_MARKERS = ("csrfmiddlewaretoken", "X-CSRFToken")
+
+ASSETS_DIR = "assets"
+
+# Files worth compressing; everything the export writes is one of these
+COMPRESSED_SUFFIXES = {".html", ".css", ".txt"}
+
+
+class ExportReport(NamedTuple):
+    """What an export wrote."""
+
+    pages: int
+    assets: int
+    files: int
+    bytes_written: int
+
+
+def _days() -> list[int]:
+    solutions_dir = aoc_settings.solutions_dir
+    if not solutions_dir.exists():
+        return []
+    return sorted(
+        int(d.name.split("_")[1])
+        for d in solutions_dir.iterdir()
+        if d.is_dir() and d.name.startswith("day_")
+    )
+
+
+def _page_path(out_dir: Path, url: str) -> Path:
+    """Map a URL to the file a static server would answer it with."""
+    relative = url.strip("/")
+    if url.endswith("/"):
+        return out_dir / relative / "index.html"
+    return out_dir / relative
+
+
+class _Writer:
+    def __init__(self, out_dir: Path):
+        self.out_dir = out_dir
+        self.assets: dict[str, str] = {}
+        self.files = 0
+        self.bytes_written = 0
+
+    def write(self, path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        self.files += 1
+        self.bytes_written += len(content)
+        if path.suffix in COMPRESSED_SUFFIXES:
+            # mtime=0 keeps the output identical between runs
+            compressed = gzip.compress(content, compresslevel=9, mtime=0)
+            path.with_name(path.name + ".gz").write_bytes(compressed)
+            self.files += 1
+            self.bytes_written += len(compressed)
+
+    def stylesheet(self, css: str) -> str:
+        """Write a stylesheet once and get its URL."""
+        content = css.strip().encode()
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        if digest not in self.assets:
+            name = f"style.{digest}.css"
+            self.write(self.out_dir / ASSETS_DIR / name, content)
+            self.assets[digest] = f"/{ASSETS_DIR}/{name}"
+        return self.assets[digest]
+
+    def page(self, url: str, html: str) -> None:
+        if any(marker in html for marker in CSRF_MARKERS):
+            raise RuntimeError(f"{url} contains a CSRF token")
+        html = STYLE_PATTERN.sub(
+            lambda m: f'<link rel="stylesheet" href="{self.stylesheet(m.group(1))}">',
+            html,
+        )
+        self.write(_page_path(self.out_dir, url), html.encode())
+
+
+def export_site(out_dir: Path) -> ExportReport:
+    """Render the whole showcase into a directory of static files.
+
+    Pages link to each other with absolute paths, so the directory must be
+    served at the root of a site. Existing files in it are overwritten but
+    not removed.
+
+    Pages are rendered with ``SHOWCASE_STATIC_EXPORT`` set, which leaves
+    out controls that need the server, such as downloading input.
+
+    Raises:
+        RuntimeError: If a page cannot be rendered or contains a CSRF token
+    """
+    ensure_django()
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from .jobs import jobs
+
+    call_command("migrate", interactive=False, verbosity=0)
+
+    client = Client(HTTP_HOST=settings.ALLOWED_HOSTS[0])
+    writer = _Writer(out_dir)
+
+    def get(url: str) -> bytes:
+        response = client.get(url)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {response.status_code}")
+        if response.streaming:
+            return b"".join(response.streaming_content)  # type: ignore[arg-type]
+        return response.content
+
+    urls = [reverse("showcase:index")]
+    if aoc_settings.leaderboard_id:
+        # As last fetched; the index only links to it when an ID is set
+        urls.append(reverse("showcase:leaderboard"))
+    for day in _days():
+        scaffold = DayScaffold(day)
+        has_input = scaffold.get_input_path().exists()
+        if scaffold.get_solution_path().exists() and has_input:
+            # Solve now, so the page shows answers instead of a spinner; any
+            # printing the solution does would only clutter the export output
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                jobs.result(day, wait=True)
+        urls.append(reverse("showcase:day_detail", args=[day]))
+        urls.append(reverse("showcase:day_history", args=[day]))
+        if has_input:
+            input_url = reverse("showcase:day_input", args=[day])
+            writer.write(_page_path(out_dir, input_url), get(input_url))
+
+    with override_settings(SHOWCASE_STATIC_EXPORT=True):
+        for url in urls:
+            writer.page(url, get(url).decode())
+
+    return ExportReport(
+        len(urls), len(writer.assets), writer.files, writer.bytes_written
+    )
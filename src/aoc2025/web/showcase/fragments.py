@@ -0,0 +1,95 @@
+"""Pre-rendered HTML fragments for day pages.
+
+Solution code is highlighted with Pygments and READMEs are rendered from
+Markdown on the server, so pages arrive ready to display without any
+client-side highlighting. Rendering is the expensive part, so each
+fragment is keyed by the SHA-256 of its source file and kept both on disk
+(``SHOWCASE_FRAGMENT_DIR``, filled at build time by the
+``build_fragments`` management command) and in memory. An edited file gets
+a new key, so stale fragments are never served.
+"""
+
+import os
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import Literal
+
+import markdown
+from django.conf import settings
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+
+from aoc2025.runner import file_hash
+
+from .metrics import CACHE_LOOKUPS
+
+Kind = Literal["python", "markdown"]
+
+# Bump when rendering changes, so fragments built by older code are ignored
+RENDER_VERSION = 1
+
+PYGMENTS_STYLE = "monokai"
+
+MARKDOWN_EXTENSIONS = ["fenced_code", "codehilite", "tables"]
+
+
+def _formatter() -> HtmlFormatter[str]:
+    return HtmlFormatter(style=PYGMENTS_STYLE, cssclass="highlight")
+
+
+@cache
+def highlight_css() -> str:
+    """Get the stylesheet for highlighted code, built once per process."""
+    return _formatter().get_style_defs(".highlight")
+
+
+def render_source(kind: Kind, text: str) -> str:
+    """Render source text to an HTML fragment."""
+    if kind == "python":
+        return highlight(text, PythonLexer(), _formatter())
+    return markdown.markdown(
+        text,
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs={"codehilite": {"css_class": "highlight"}},
+    )
+
+
+def _fragment_path(kind: Kind, digest: str) -> Path:
+    return (
+        Path(settings.SHOWCASE_FRAGMENT_DIR) / f"{kind}-v{RENDER_VERSION}-{digest}.html"
+    )
+
+
+@lru_cache(maxsize=128)
+def _load(kind: Kind, digest: str, source: Path) -> str:
+    path = _fragment_path(kind, digest)
+    try:
+        html = path.read_text()
+    except FileNotFoundError:
+        pass
+    else:
+        CACHE_LOOKUPS.labels("fragment", "hit").inc()
+        return html
+
+    CACHE_LOOKUPS.labels("fragment", "miss").inc()
+    html = render_source(kind, source.read_text())
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename, so readers never see half a file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(html)
+        os.replace(tmp_path, path)
+    except OSError:
+        # A read-only disk only costs the next process a re-render
+        pass
+    return html
+
+
+def fragment(kind: Kind, source: Path) -> str:
+    """Get the rendered HTML for a source file, rendering it only once.
+
+    Raises:
+        FileNotFoundError: If the source file does not exist
+    """
+    return _load(kind, file_hash(source), source)
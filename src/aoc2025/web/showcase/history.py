@@ -0,0 +1,66 @@
+"""Recording and querying solve history for showcase app.
+
+These helpers are also used by the CLI, which runs outside of Django, so
+they configure Django on first use and import models lazily.
+"""
+
+import os
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from aoc2025.models import PartResult
+
+if TYPE_CHECKING:
+    from .models import SolveResult
+
+
+def ensure_django() -> None:
+    """Configure Django if it is not running already."""
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "aoc2025.web.settings")
+        django.setup()
+
+
+def record_results(results: Iterable[PartResult], source: str) -> None:
+    """Store part results in the database.
+
+    Args:
+        results: Results to store
+        source: One of ``SolveResult.Source`` values
+    """
+    ensure_django()
+    from .models import SolveResult
+
+    SolveResult.objects.bulk_create(
+        SolveResult(
+            day=result.day,
+            part=result.part,
+            solution_hash=result.solution_hash,
+            input_hash=result.input_hash,
+            answer=result.answer,
+            duration=result.duration,
+            peak_memory=result.peak_memory,
+            source=source,
+        )
+        for result in results
+    )
+
+
+def latest_results(
+    day: int, solution_hash: str, input_hash: str
+) -> dict[int, "SolveResult"]:
+    """Get the most recent result per part for a solution and input version."""
+    ensure_django()
+    from .models import SolveResult
+
+    latest: dict[int, SolveResult] = {}
+    recent = SolveResult.objects.filter(
+        day=day, solution_hash=solution_hash, input_hash=input_hash
+    ).order_by("-created_at")[:10]
+    for result in recent:
+        latest.setdefault(result.part, result)
+    return latest
@@ -0,0 +1,302 @@
+"""Background solve jobs for showcase app.
+
+Solving runs on a small in-process thread pool so that views never block on
+solution code. Each solution and input version has a ``SolveJob`` row in the
+database, which all server processes share: the process that claims it
+solves while holding a lease, and the others report the job as computing
+until its result is stored there. Results are also kept in the Django cache
+of each process, and answers already recorded for the same hashes are used
+instead of solving again. Peak memory is only traced with
+``SHOWCASE_TRACE_MEMORY``, since tracing slows solves down and serializes them.
+
+The private leaderboard is refreshed the same way: pages render whatever is
+cached and at most one background fetch runs at a time.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from aoc2025.api import AOCClient
+from aoc2025.config import settings as aoc_settings
+from aoc2025.leaderboard import REFRESH_INTERVAL, CachedLeaderboard, LeaderboardCache
+from aoc2025.models import PartResult
+from aoc2025.parallel import mark_serial_thread
+from aoc2025.runner import file_hash, load_solution_class, run_part
+from aoc2025.scaffold import DayScaffold
+
+from .history import latest_results, record_results
+from .metrics import CACHE_LOOKUPS, SOLUTION_LOAD_DURATION, SOLVE_DURATION
+from .models import SolveJob, SolveResult
+from .timing import phase
+
+logger = logging.getLogger(__name__)
+
+# Seconds a failed solve is remembered before the next request retries it
+ERROR_CACHE_TIMEOUT = 30
+
+# Seconds a process may solve a claimed job before another process takes it
+# over, in case the one solving it died
+SOLVE_LEASE = 600
+
+# Seconds between checks on a job another process is solving, when waiting
+WAIT_POLL_INTERVAL = 0.5
+
+
+def solve_day(day: int, solution_hash: str, input_hash: str) -> dict[str, Any]:
+    """Run both parts of a day's solution, record and collect the answers."""
+    result: dict[str, Any] = {"status": "done"}
+    part_results: list[PartResult] = []
+    try:
+        with SOLUTION_LOAD_DURATION.labels(str(day)).time():
+            Solution = load_solution_class(day)
+            solution = Solution.from_file(DayScaffold(day).get_input_path())
+
+        for part in (1, 2):
+            try:
+                part_result = run_part(
+                    solution,
+                    part,
+                    trace_memory=settings.SHOWCASE_TRACE_MEMORY,
+                    solution_hash=solution_hash,
+                    input_hash=input_hash,
+                )
+                part_results.append(part_result)
+                SOLVE_DURATION.labels(str(day), str(part)).observe(part_result.duration)
+                result[f"part{part}_answer"] = part_result.answer
+            except NotImplementedError:
+                result[f"part{part}_answer"] = "Not implemented"
+    except Exception as e:
+        return {"status": "error", "error": str(e), "finished_at": time.time()}
+
+    try:
+        record_results(part_results, source=SolveResult.Source.WEB)
+    except Exception:
+        # The answers are still good; only the history misses these runs
+        logger.exception("Could not record results for day %d", day)
+
+    result["finished_at"] = time.time()
+    return result
+
+
+def claim_job(
+    day: int, solution_hash: str, input_hash: str
+) -> tuple[int | None, dict[str, Any]]:
+    """Claim the solve of a solution and input version for this process.
+
+    A job is claimed when it is new, when the lease of the process solving
+    it has run out, or when it failed more than ``ERROR_CACHE_TIMEOUT``
+    seconds ago. Claims are conditional updates, so only one process wins.
+
+    Returns:
+        The job's ID if this process should solve it, and otherwise None
+        with the stored result or ``{"status": "computing"}``
+    """
+    computing: dict[str, Any] = {"status": SolveJob.Status.COMPUTING.value}
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=SOLVE_LEASE)
+    job, created = SolveJob.objects.get_or_create(
+        day=day,
+        solution_hash=solution_hash,
+        input_hash=input_hash,
+        defaults={
+            "status": SolveJob.Status.COMPUTING,
+            "lease_until": lease_until,
+            "updated_at": now,
+        },
+    )
+    if created:
+        return job.pk, computing
+
+    if job.status == SolveJob.Status.DONE and job.result:
+        return None, job.result
+    if job.status == SolveJob.Status.ERROR and job.result:
+        if now < job.updated_at + timedelta(seconds=ERROR_CACHE_TIMEOUT):
+            return None, job.result
+    if job.status == SolveJob.Status.COMPUTING and now < job.lease_until:
+        return None, computing
+
+    # Matching the state read above makes sure no other process took it since
+    taken = SolveJob.objects.filter(
+        pk=job.pk, status=job.status, updated_at=job.updated_at
+    ).update(status=SolveJob.Status.COMPUTING, lease_until=lease_until, updated_at=now)
+    return (job.pk if taken else None), computing
+
+
+class SolveJobs:
+    """Deduplicating pool of background solve jobs."""
+
+    def __init__(self, max_workers: int):
+        """Initialize the job pool."""
+        # Solutions run serially here; parallel_map would otherwise start a
+        # process pool per job in every web worker process
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="showcase-solve",
+            initializer=mark_serial_thread,
+        )
+        self._lock = threading.Lock()
+        self._running: dict[str, Future[dict[str, Any]]] = {}
+
+    def result(self, day: int, wait: bool = False) -> dict[str, Any]:
+        """Get the answers for a day's current solution and input.
+
+        Looks in the cache first, then for recorded results and the job in
+        the database, and only then starts a background job.
+
+        Args:
+            day: Day number (1-25)
+            wait: Block until the job has finished instead of returning
+                right away, also when another process is solving it
+
+        Returns:
+            The finished result with the Unix time it finished at
+            (``finished_at``), or ``{"status": "computing"}`` while running
+        """
+        scaffold = DayScaffold(day)
+        with phase("hash"):
+            solution_hash = file_hash(scaffold.get_solution_path())
+            input_hash = file_hash(scaffold.get_input_path())
+        key = f"showcase:solve:{day}:{solution_hash[:16]}:{input_hash[:16]}"
+
+        with phase("cache"):
+            cached = cache.get(key)
+        if cached is not None:
+            CACHE_LOOKUPS.labels("solve", "hit").inc()
+            return cached
+
+        with phase("db"):
+            recorded = latest_results(day, solution_hash, input_hash)
+        if set(recorded) == {1, 2}:
+            CACHE_LOOKUPS.labels("solve", "db").inc()
+            result = {
+                "status": "done",
+                "finished_at": max(r.created_at.timestamp() for r in recorded.values()),
+            }
+            for part, part_result in recorded.items():
+                result[f"part{part}_answer"] = part_result.answer
+            cache.set(key, result, timeout=None)
+            return result
+
+        CACHE_LOOKUPS.labels("solve", "miss").inc()
+
+        while True:
+            # A job that finished since the lookup above has cached its result
+            # and left _running under this lock, so checking both here cannot
+            # start a second job for the same key in this process; the claim
+            # keeps other processes from starting one too
+            with self._lock:
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+                future = self._running.get(key)
+                current: dict[str, Any] = {}
+                if future is None:
+                    with phase("db"):
+                        job_id, current = claim_job(day, solution_hash, input_hash)
+                    if job_id is not None:
+                        future = self._executor.submit(
+                            self._run, day, key, job_id, solution_hash, input_hash
+                        )
+                        self._running[key] = future
+
+            if future is not None:
+                if wait:
+                    return future.result()
+                return {"status": SolveJob.Status.COMPUTING.value}
+
+            # Finished or being solved by another process
+            if current["status"] != SolveJob.Status.COMPUTING:
+                _cache_result(key, current)
+                return current
+            if not wait:
+                return current
+            time.sleep(WAIT_POLL_INTERVAL)
+
+    def _run(
+        self, day: int, key: str, job_id: int, solution_hash: str, input_hash: str
+    ) -> dict[str, Any]:
+        result: dict[str, Any] | None = None
+        try:
+            result = solve_day(day, solution_hash, input_hash)
+            return result
+        finally:
+            if result is not None:
+                try:
+                    SolveJob.objects.filter(pk=job_id).update(
+                        status=result["status"],
+                        result=result,
+                        updated_at=timezone.now(),
+                    )
+                except Exception:
+                    # Other processes solve it again once the lease runs out
+                    logger.exception("Could not store the solve job for day %d", day)
+            with self._lock:
+                if result is not None:
+                    _cache_result(key, result)
+                self._running.pop(key, None)
+
+
+def _cache_result(key: str, result: dict[str, Any]) -> None:
+    """Keep a finished result in this process's cache."""
+    # Errors may be transient, so they are only kept briefly
+    failed = result["status"] == SolveJob.Status.ERROR
+    cache.set(key, result, timeout=ERROR_CACHE_TIMEOUT if failed else None)
+
+
+class LeaderboardRefresh:
+    """Single background fetch of the private leaderboard."""
+
+    def __init__(self):
+        """Initialize the refresher."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="showcase-leaderboard"
+        )
+        self._lock = threading.Lock()
+        self._running: Future[None] | None = None
+        # A failed fetch is not retried before this time
+        self._retry_at = 0.0
+        self.last_error: str | None = None
+
+    def cached(self, leaderboard_id: str) -> CachedLeaderboard | None:
+        """Get the cached leaderboard, refreshing it in the background if stale.
+
+        Never waits for the network. A refresh is only started when a
+        session cookie is configured and the cached copy is missing or older
+        than AOC's 15-minute guidance, and a failed fetch waits as long.
+        """
+        now = time.time()
+        cached = LeaderboardCache().get(leaderboard_id)
+        stale = cached is None or cached.is_stale(now)
+        if stale and aoc_settings.session_cookie and now >= self._retry_at:
+            with self._lock:
+                if self._running is None:
+                    self._running = self._executor.submit(self._run, leaderboard_id)
+        return cached
+
+    @property
+    def refreshing(self) -> bool:
+        """Whether a fetch is in progress."""
+        return self._running is not None
+
+    def _run(self, leaderboard_id: str) -> None:
+        try:
+            AOCClient().fetch_leaderboard(leaderboard_id)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            self._retry_at = time.time() + REFRESH_INTERVAL
+        finally:
+            with self._lock:
+                self._running = None
+
+
+jobs = SolveJobs(max_workers=settings.SHOWCASE_SOLVE_WORKERS)
+leaderboard_refresh = LeaderboardRefresh()
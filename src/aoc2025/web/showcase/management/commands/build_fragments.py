@@ -0,0 +1,32 @@
+"""Pre-render day page fragments so the first visit after a deploy is fast."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from aoc2025.config import settings as aoc_settings
+
+from ...fragments import Kind, fragment
+
+# File in each day directory -> how it is rendered
+SOURCES: dict[str, Kind] = {"solution.py": "python", "README.md": "markdown"}
+
+
+class Command(BaseCommand):
+    help = "Highlight solution code and render READMEs for all days"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        solutions_dir = aoc_settings.solutions_dir
+        if not solutions_dir.exists():
+            self.stdout.write(f"No solutions directory at {solutions_dir}")
+            return
+
+        count = 0
+        for day_dir in sorted(solutions_dir.glob("day_*")):
+            for name, kind in SOURCES.items():
+                source = day_dir / name
+                if source.exists():
+                    fragment(kind, source)
+                    count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rendered {count} fragment(s)"))
@@ -0,0 +1,77 @@
+"""Prometheus metrics for showcase app.
+
+Metrics live in the default ``prometheus_client`` registry. Under gunicorn
+with several worker processes, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty
+directory before the workers start: every process then writes its samples to
+memory-mapped files there and the ``/metrics`` view aggregates them, so the
+numbers cover all workers instead of whichever one served the scrape.
+"""
+
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Solving days takes anything from microseconds to tens of seconds
+SOLVE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+REQUEST_DURATION = Histogram(
+    "showcase_request_duration_seconds",
+    "Time to produce a response, by URL name and day",
+    ["view", "method", "day"],
+)
+REQUESTS = Counter(
+    "showcase_requests_total",
+    "Responses sent, by URL name and status code",
+    ["view", "method", "status"],
+)
+SOLUTION_LOAD_DURATION = Histogram(
+    "showcase_solution_load_duration_seconds",
+    "Time to import a day's solution and read its input",
+    ["day"],
+)
+SOLVE_DURATION = Histogram(
+    "showcase_solve_duration_seconds",
+    "Time to solve one part of a day in a background job",
+    ["day", "part"],
+    buckets=SOLVE_BUCKETS,
+)
+FILE_READ_DURATION = Histogram(
+    "showcase_file_read_duration_seconds",
+    "Time to read solution, input, README and cached puzzle files for a day page",
+    ["kind"],
+)
+CACHE_LOOKUPS = Counter(
+    "showcase_cache_lookups_total",
+    "Cache lookups by cache and outcome (hit, miss or db for recorded answers)",
+    ["cache", "result"],
+)
+
+# Keep label values bounded whatever clients send
+_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+def method_label(method: str | None) -> str:
+    """Get a bounded label value for an HTTP method."""
+    return method if method in _METHODS else "other"
+
+
+def day_label(day: object) -> str:
+    """Get a bounded label value for a day number, empty if not a valid day."""
+    return str(day) if isinstance(day, int) and 1 <= day <= 25 else ""
+
+
+def render_latest() -> bytes:
+    """Render all metrics in the Prometheus text exposition format."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
@@ -0,0 +1,137 @@
+"""Middleware for showcase app."""
+
+import logging
+import re
+from collections.abc import Callable
+from time import perf_counter
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+from .metrics import REQUEST_DURATION, REQUESTS, day_label, method_label
+from .timing import format_server_timing, start_request, stop_request
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+re_accepts_brotli = re.compile(r"\bbr\b")
+
+logger = logging.getLogger(__name__)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress responses with brotli when available, falling back to gzip.
+
+    Brotli is only used for non-streaming responses and only if the optional
+    ``brotli`` package is installed; everything else is handled by Django's
+    ``GZipMiddleware``.
+    """
+
+    def process_response(
+        self, request: HttpRequest, response: HttpResponseBase
+    ) -> HttpResponseBase:
+        """Compress the response body according to Accept-Encoding."""
+        # Compressing a partial response would make Content-Range meaningless
+        if response.status_code == 206:
+            return response
+
+        ae = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if (
+            brotli is None
+            or response.streaming
+            or response.has_header("Content-Encoding")
+            or not re_accepts_brotli.search(ae)
+        ):
+            return super().process_response(request, response)
+
+        content: bytes = response.content  # type: ignore[attr-defined]
+        if len(content) < 200:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressed: bytes = brotli.compress(content)
+        if len(compressed) >= len(content):
+            return response
+
+        response.content = compressed  # type: ignore[attr-defined]
+        response.headers["Content-Length"] = str(len(compressed))
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
+
+
+class MetricsMiddleware:
+    """Record request counts and latencies for the ``/metrics`` endpoint.
+
+    Requests are labelled by URL name rather than path, so the number of
+    series stays bounded. For streaming responses the latency covers the
+    time until the response starts, not the whole body.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]):
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        """Time the rest of the middleware chain and the view."""
+        start = perf_counter()
+        response = self.get_response(request)
+        duration = perf_counter() - start
+
+        match = request.resolver_match
+        view = match.view_name if match else "unmatched"
+        day = day_label(match.kwargs.get("day")) if match else ""
+        method = method_label(request.method)
+
+        REQUEST_DURATION.labels(view, method, day).observe(duration)
+        REQUESTS.labels(view, method, str(response.status_code)).inc()
+        return response
+
+
+class ServerTimingMiddleware:
+    """Report where a request's time went, phase by phase.
+
+    Collects the phases views mark with :func:`aoc2025.web.showcase.timing.phase`.
+    With ``SHOWCASE_SERVER_TIMING`` enabled they are sent in a
+    ``Server-Timing`` header; requests slower than
+    ``SHOWCASE_SLOW_REQUEST_MS`` are logged with the same breakdown. When
+    both are off, requests pass straight through.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]):
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        """Time the request and attach or log the phase breakdown."""
+        send_header: bool = settings.SHOWCASE_SERVER_TIMING
+        slow_ms: float = settings.SHOWCASE_SLOW_REQUEST_MS
+        if not send_header and slow_ms <= 0:
+            return self.get_response(request)
+
+        phases = start_request()
+        start = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_request()
+        total = perf_counter() - start
+
+        timing = format_server_timing(phases, total)
+        if send_header:
+            response.headers["Server-Timing"] = timing
+        if 0 < slow_ms <= total * 1000:
+            logger.warning(
+                "Slow request %s %s (%d): %s",
+                request.method,
+                request.path,
+                response.status_code,
+                timing,
+            )
+        return response
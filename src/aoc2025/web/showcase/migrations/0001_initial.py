@@ -0,0 +1,64 @@
+# Generated by Django 6.1.2 on 2026-10-19 08:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SolveResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.PositiveSmallIntegerField()),
+                ("part", models.PositiveSmallIntegerField()),
+                ("solution_hash", models.CharField(max_length=64)),
+                ("input_hash", models.CharField(max_length=64)),
+                ("answer", models.TextField()),
+                ("duration", models.FloatField(help_text="Solve time in seconds")),
+                (
+                    "peak_memory",
+                    models.PositiveBigIntegerField(
+                        blank=True, help_text="Peak traced memory in bytes", null=True
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(
+                        choices=[
+                            ("cli", "CLI run"),
+                            ("bench", "Benchmark"),
+                            ("web", "Web showcase"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["day", "part", "-created_at"],
+                        name="solve_day_part_recent",
+                    ),
+                    models.Index(
+                        fields=["day", "solution_hash", "input_hash", "-created_at"],
+                        name="solve_day_version_recent",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 6.1.2 on 2026-10-19 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("showcase", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SolveJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.PositiveSmallIntegerField()),
+                ("solution_hash", models.CharField(max_length=64)),
+                ("input_hash", models.CharField(max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("computing", "Computing"),
+                            ("done", "Done"),
+                            ("error", "Error"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "result",
+                    models.JSONField(
+                        blank=True,
+                        help_text="Answers or error of the finished job",
+                        null=True,
+                    ),
+                ),
+                (
+                    "lease_until",
+                    models.DateTimeField(
+                        help_text="When a computing job is considered abandoned"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "solution_hash", "input_hash"),
+                        name="solve_job_version_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,84 @@
+"""Models for showcase app."""
+
+from django.db import models
+
+
+class SolveResult(models.Model):
+    """Answer and measurements from one run of one part of a day."""
+
+    class Source(models.TextChoices):
+        """Where a result was produced."""
+
+        CLI = "cli", "CLI run"
+        BENCH = "bench", "Benchmark"
+        WEB = "web", "Web showcase"
+
+    day = models.PositiveSmallIntegerField()
+    part = models.PositiveSmallIntegerField()
+    solution_hash = models.CharField(max_length=64)
+    input_hash = models.CharField(max_length=64)
+    answer = models.TextField()
+    duration = models.FloatField(help_text="Solve time in seconds")
+    peak_memory = models.PositiveBigIntegerField(
+        null=True, blank=True, help_text="Peak traced memory in bytes"
+    )
+    source = models.CharField(max_length=8, choices=Source.choices)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["day", "part", "-created_at"], name="solve_day_part_recent"
+            ),
+            models.Index(
+                fields=["day", "solution_hash", "input_hash", "-created_at"],
+                name="solve_day_version_recent",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Day {self.day} part {self.part}: {self.answer} ({self.source})"
+
+    @property
+    def duration_ms(self) -> float:
+        """Solve time in milliseconds."""
+        return self.duration * 1000
+
+
+class SolveJob(models.Model):
+    """State of the background solve of one solution and input version.
+
+    Shared by all server processes: the one that claims a job holds a lease
+    on it while solving, and the others report it as computing meanwhile.
+    """
+
+    class Status(models.TextChoices):
+        """Where a job is at."""
+
+        COMPUTING = "computing", "Computing"
+        DONE = "done", "Done"
+        ERROR = "error", "Error"
+
+    day = models.PositiveSmallIntegerField()
+    solution_hash = models.CharField(max_length=64)
+    input_hash = models.CharField(max_length=64)
+    status = models.CharField(max_length=16, choices=Status.choices)
+    result = models.JSONField(
+        null=True, blank=True, help_text="Answers or error of the finished job"
+    )
+    lease_until = models.DateTimeField(
+        help_text="When a computing job is considered abandoned"
+    )
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "solution_hash", "input_hash"],
+                name="solve_job_version_unique",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"Day {self.day} solve job: {self.status}"
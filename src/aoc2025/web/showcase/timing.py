@@ -0,0 +1,56 @@
+"""Per-request phase timings for showcase app.
+
+Views wrap the steps worth knowing about in :func:`phase`, and
+``ServerTimingMiddleware`` collects them for the current request. The
+breakdown is sent in a ``Server-Timing`` header, which browsers show in
+their network panel, and logged for requests slower than a threshold.
+Outside a timed request :func:`phase` does nothing.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+# Phase name -> accumulated seconds, for the request being handled
+_phases: ContextVar[dict[str, float] | None] = ContextVar(
+    "showcase_phases", default=None
+)
+
+
+@contextmanager
+def phase(name: str) -> Generator[None]:
+    """Time a block as a named phase of the current request.
+
+    Repeated phases with the same name are added up. The name must be a
+    valid ``Server-Timing`` metric name (letters, digits, ``_`` and ``-``).
+    """
+    phases = _phases.get()
+    if phases is None:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + perf_counter() - start
+
+
+def start_request() -> dict[str, float]:
+    """Start collecting phases for the current request."""
+    phases: dict[str, float] = {}
+    _phases.set(phases)
+    return phases
+
+
+def stop_request() -> None:
+    """Stop collecting phases for the current request."""
+    _phases.set(None)
+
+
+def format_server_timing(phases: dict[str, float], total: float) -> str:
+    """Format phases and the total duration as a ``Server-Timing`` value."""
+    metrics = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in phases.items()]
+    metrics.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(metrics)
@@ -9,6 +9,11 @@ app_name = "showcase"
 urlpatterns = [
     path("", views.index, name="index"),
     path("day/<int:day>/", views.day_detail, name="day_detail"),
+    path("day/<int:day>/history/", views.day_history, name="day_history"),
+    path("day/<int:day>/input.txt", views.day_input, name="day_input"),
+    path("leaderboard/", views.leaderboard, name="leaderboard"),
+    path("metrics", views.metrics, name="metrics"),
+    path("api/solve-status/<int:day>/", views.solve_status_api, name="solve_status"),
     path(
         "api/download-input/<int:day>/", views.download_input_api, name="download_input"
     ),
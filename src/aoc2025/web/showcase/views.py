@@ -1,16 +1,190 @@
 """Views for showcase app."""
 
-import importlib.util
-import sys
+import hashlib
+import hmac
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
 
-from django.http import HttpRequest, JsonResponse
+from django.conf import settings
+from django.core.cache import cache
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+from django.views.decorators.http import condition
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from aoc2025.api import AOCClient
 from aoc2025.config import settings as aoc_settings
+from aoc2025.puzzles import PuzzleCache
 from aoc2025.scaffold import DayScaffold
 
+from .fragments import fragment, highlight_css
+from .jobs import jobs, leaderboard_refresh
+from .metrics import CACHE_LOOKUPS, FILE_READ_DURATION, render_latest
+from .models import SolveResult
+from .timing import phase
 
+# Number of input lines embedded in the day page; the rest is fetched on demand
+INPUT_PREVIEW_LINES = 20
+
+# Chunk size used when streaming input files
+INPUT_CHUNK_SIZE = 64 * 1024
+
+
+def _fingerprint(paths: list[Path]) -> tuple[str, datetime | None]:
+    """Fingerprint files by name, size and mtime.
+
+    Returns:
+        Tuple of (hex digest, latest modification time). Missing files are
+        skipped, so creating or deleting a file changes the digest too.
+    """
+    digest = hashlib.sha256()
+    latest_mtime: float | None = None
+    with phase("fingerprint"):
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+            if latest_mtime is None or stat.st_mtime > latest_mtime:
+                latest_mtime = stat.st_mtime
+
+    last_modified = (
+        datetime.fromtimestamp(latest_mtime, tz=UTC) if latest_mtime else None
+    )
+    return digest.hexdigest()[:32], last_modified
+
+
+def _scaffold(day: int) -> DayScaffold:
+    """Get the scaffold for a day, treating an invalid day as a missing page."""
+    try:
+        return DayScaffold(day)
+    except ValueError as e:
+        raise Http404(str(e)) from e
+
+
+def _day_paths(day: int) -> list[Path]:
+    """Get the files that a day's page is built from."""
+    scaffold = DayScaffold(day)
+    return [
+        scaffold.get_solution_path(),
+        scaffold.get_input_path(),
+        scaffold.day_dir / "README.md",
+        PuzzleCache().path(day),
+    ]
+
+
+def _index_paths() -> list[Path]:
+    """Get the files that the index page is built from."""
+    solutions_dir = aoc_settings.solutions_dir
+    if not solutions_dir.exists():
+        return []
+
+    paths = [solutions_dir]
+    for day_dir in sorted(solutions_dir.iterdir()):
+        if day_dir.is_dir() and day_dir.name.startswith("day_"):
+            paths.extend([day_dir / "solution.py", day_dir / "input.txt"])
+    return paths
+
+
+def _index_etag(request: HttpRequest) -> str:
+    return _fingerprint(_index_paths())[0]
+
+
+def _index_last_modified(request: HttpRequest) -> datetime | None:
+    return _fingerprint(_index_paths())[1]
+
+
+class _DayState(NamedTuple):
+    """What a day page's validators and body are computed from."""
+
+    files_etag: str
+    etag: str
+    last_modified: datetime | None
+    solve: dict[str, Any] | None
+
+
+def _status_etag(files_etag: str, status: str) -> str:
+    return hashlib.sha256(f"{files_etag}:{status}".encode()).hexdigest()[:32]
+
+
+def _day_state(request: HttpRequest, day: int) -> _DayState:
+    """Fingerprint a day's page, once per request.
+
+    The ETag covers the solve status as well as the files, so a page that
+    was still computing is not revalidated once the answers are ready, and
+    Last-Modified includes the time the solve finished. A finished solve is
+    final for the files it was run on, so a client that already has the
+    finished page is answered from the file fingerprint alone, without
+    looking up the solve.
+    """
+    state: _DayState | None = getattr(request, "_showcase_day_state", None)
+    if state is not None:
+        return state
+
+    scaffold = _scaffold(day)
+    files_etag, last_modified = _fingerprint(_day_paths(day))
+    solvable = (
+        scaffold.get_solution_path().exists() and scaffold.get_input_path().exists()
+    )
+
+    done_etag = _status_etag(files_etag, "done")
+    if solvable and quote_etag(done_etag) in parse_etags(
+        request.headers.get("If-None-Match", "")
+    ):
+        # Only used to answer 304; the finish time is not known here
+        state = _DayState(files_etag, done_etag, None, None)
+        request._showcase_day_state = state  # type: ignore[attr-defined]
+        return state
+
+    solve = None
+    if solvable:
+        # Solving runs in a background job; this only looks the answers up
+        solve = jobs.result(day)
+    status = solve["status"] if solve else "none"
+    if status == "computing":
+        last_modified = None  # Only the ETag tells the finished page apart
+    elif solve is not None and "finished_at" in solve:
+        finished_at = datetime.fromtimestamp(solve["finished_at"], tz=UTC)
+        last_modified = max(filter(None, [last_modified, finished_at]))
+
+    state = _DayState(
+        files_etag, _status_etag(files_etag, status), last_modified, solve
+    )
+    request._showcase_day_state = state  # type: ignore[attr-defined]
+    return state
+
+
+def _day_etag(request: HttpRequest, day: int) -> str | None:
+    if not 1 <= day <= 25:
+        return None
+    return _day_state(request, day).etag
+
+
+def _day_last_modified(request: HttpRequest, day: int) -> datetime | None:
+    if not 1 <= day <= 25:
+        return None
+    return _day_state(request, day).last_modified
+
+
+def _cacheable(response: HttpResponseBase) -> HttpResponseBase:
+    """Let browsers reuse a page briefly before revalidating it."""
+    patch_cache_control(response, private=True, max_age=settings.SHOWCASE_CACHE_MAX_AGE)
+    return response
+
+
+@condition(etag_func=_index_etag, last_modified_func=_index_last_modified)
 def index(request: HttpRequest):
     """Show all completed days."""
     solutions_dir = aoc_settings.solutions_dir
@@ -31,18 +205,24 @@ def index(request: HttpRequest):
                     }
                 )
 
-    context = {"days": days, "year": 2025}
-    return render(request, "showcase/index.html", context)
+    context = {
+        "days": days,
+        "year": 2025,
+        "has_leaderboard": bool(aoc_settings.leaderboard_id),
+    }
+    with phase("render"):
+        response = render(request, "showcase/index.html", context)
+    return _cacheable(response)
 
 
-def day_detail(request: HttpRequest, day: int):
-    """Show detail for a specific day."""
+def _build_day_context(day: int) -> dict[str, Any]:
+    """Read, run and collect everything shown on a day's page."""
     scaffold = DayScaffold(day)
     solution_path = scaffold.get_solution_path()
     input_path = scaffold.get_input_path()
     readme_path = scaffold.day_dir / "README.md"
 
-    context = {
+    context: dict[str, Any] = {
         "day": day,
         "year": 2025,
         "has_solution": solution_path.exists(),
@@ -50,47 +230,273 @@ def day_detail(request: HttpRequest, day: int):
         "aoc_url": f"https://adventofcode.com/2025/day/{day}",
     }
 
-    # Load solution code
+    # Highlighted solution code; answers are computed by a background job
     if solution_path.exists():
-        context["solution_code"] = solution_path.read_text()
+        with FILE_READ_DURATION.labels("solution").time(), phase("fragment"):
+            context["solution_html"] = fragment("python", solution_path)
 
-        # Try to run the solution
-        try:
-            spec = importlib.util.spec_from_file_location(
-                f"day_{day:02d}.solution", solution_path
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[f"day_{day:02d}.solution"] = module
-                spec.loader.exec_module(module)
-
-                if input_path.exists():
-                    Solution = module.Solution
-                    solution = Solution.from_file(input_path)
-
-                    try:
-                        context["part1_answer"] = str(solution.part_1())
-                    except NotImplementedError:
-                        context["part1_answer"] = "Not implemented"
-
-                    try:
-                        context["part2_answer"] = str(solution.part_2())
-                    except NotImplementedError:
-                        context["part2_answer"] = "Not implemented"
-        except Exception as e:
-            context["error"] = str(e)
-
-    # Load input text
+    # Load input summary; the full text is served by the day_input endpoint
     if input_path.exists():
-        input_text = input_path.read_text()
-        context["input_text"] = input_text
-        context["input_line_count"] = len(input_text.splitlines())
+        with FILE_READ_DURATION.labels("input").time(), phase("read"):
+            input_lines = input_path.read_text().splitlines()
+        context["input_preview"] = "\n".join(input_lines[:INPUT_PREVIEW_LINES])
+        context["input_line_count"] = len(input_lines)
+        context["input_truncated"] = len(input_lines) > INPUT_PREVIEW_LINES
+        context["input_size"] = input_path.stat().st_size
 
-    # Load README
+    # README rendered from Markdown
     if readme_path.exists():
-        context["readme"] = readme_path.read_text()
+        with FILE_READ_DURATION.labels("readme").time(), phase("fragment"):
+            context["readme_html"] = fragment("markdown", readme_path)
+
+    # Puzzle description, if 'aoc puzzle' or 'aoc new' cached it; pages are
+    # never fetched while rendering
+    with FILE_READ_DURATION.labels("puzzle").time(), phase("read"):
+        puzzle = PuzzleCache().get(day)
+    if puzzle is not None:
+        context["puzzle_title"] = puzzle.title
+        context["puzzle_articles"] = puzzle.articles
+
+    return context
+
+
+@condition(etag_func=_day_etag, last_modified_func=_day_last_modified)
+def day_detail(request: HttpRequest, day: int):
+    """Show detail for a specific day."""
+    # The fingerprint changes whenever the day's files do, which makes stale
+    # entries unreachable instead of requiring explicit invalidation.
+    state = _day_state(request, day)
+    cache_key = f"showcase:day:{day}:{state.files_etag}"
+
+    with phase("cache"):
+        context = cache.get(cache_key)
+    if context is None:
+        CACHE_LOOKUPS.labels("day_page", "miss").inc()
+        context = _build_day_context(day)
+        with phase("cache"):
+            cache.set(cache_key, context, timeout=None)
+    else:
+        CACHE_LOOKUPS.labels("day_page", "hit").inc()
+
+    context = {
+        **context,
+        "highlight_css": highlight_css(),
+        "static_export": settings.SHOWCASE_STATIC_EXPORT,
+    }
+    if state.solve is not None:
+        context["solve"] = state.solve
+
+    with phase("render"):
+        response = render(request, "showcase/day_detail.html", context)
+    return _cacheable(response)
+
+
+def _input_etag(request: HttpRequest, day: int) -> str | None:
+    if not 1 <= day <= 25:
+        return None
+    return _fingerprint([DayScaffold(day).get_input_path()])[0]
+
+
+def _input_last_modified(request: HttpRequest, day: int) -> datetime | None:
+    if not 1 <= day <= 25:
+        return None
+    return _fingerprint([DayScaffold(day).get_input_path()])[1]
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``Range`` header into inclusive byte offsets.
+
+    Returns:
+        (start, end) tuple, or None if the header is not a single byte range.
+
+    Raises:
+        ValueError: If the range cannot be satisfied for a file of this size.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+
+    start_s, sep, end_s = spec.strip().partition("-")
+    if not sep or not (start_s + end_s).isdigit():
+        return None
+
+    if not start_s:
+        # Suffix range: the last N bytes
+        length = int(end_s)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+
+    start = int(start_s)
+    end = min(int(end_s), size - 1) if end_s else size - 1
+    if start >= size or end < start:
+        raise ValueError(f"Range {header!r} not satisfiable for size {size}")
+    return start, end
+
+
+def _stream_file(path: Path, start: int, length: int):
+    """Yield ``length`` bytes of a file starting at ``start`` in chunks."""
+    with path.open("rb") as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(INPUT_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@condition(etag_func=_input_etag, last_modified_func=_input_last_modified)
+def day_input(request: HttpRequest, day: int):
+    """Stream the full input for a day, honouring single byte ranges."""
+    input_path = _scaffold(day).get_input_path()
+    if not input_path.exists():
+        raise Http404(f"No input for day {day}")
+
+    size = input_path.stat().st_size
+    start, end = 0, size - 1
+    status = 200
+
+    range_header = request.headers.get("Range")
+    if range_header and size:
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+        if byte_range:
+            start, end = byte_range
+            status = 206
+
+    length = end - start + 1 if size else 0
+    response = StreamingHttpResponse(
+        _stream_file(input_path, start, length),
+        status=status,
+        content_type="text/plain; charset=utf-8",
+    )
+    response.headers["Accept-Ranges"] = "bytes"
+    response.headers["Content-Length"] = str(length)
+    if status == 206:
+        response.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return _cacheable(response)
+
+
+# Size of the history chart in SVG user units
+CHART_WIDTH = 600
+CHART_HEIGHT = 160
+
+
+def _chart_points(durations: list[float], max_duration: float) -> str:
+    """Scale durations (oldest first) into an SVG polyline points string."""
+    if not durations or max_duration <= 0:
+        return ""
+    step = CHART_WIDTH / max(len(durations) - 1, 1)
+    return " ".join(
+        f"{i * step:.1f},{CHART_HEIGHT - d / max_duration * CHART_HEIGHT:.1f}"
+        for i, d in enumerate(durations)
+    )
+
+
+def day_history(request: HttpRequest, day: int):
+    """Show recorded answers and timings for a day."""
+    _scaffold(day)  # Validates the day number
+
+    with phase("db"):
+        results = list(SolveResult.objects.filter(day=day)[:200])
+    max_duration = max((r.duration for r in results), default=0.0)
+
+    series = []
+    for part in (1, 2):
+        durations = [r.duration for r in reversed(results) if r.part == part]
+        series.append(
+            {
+                "part": part,
+                "points": _chart_points(durations, max_duration),
+                "runs": len(durations),
+            }
+        )
+
+    context = {
+        "day": day,
+        "year": 2025,
+        "results": results,
+        "series": series,
+        "max_duration_ms": max_duration * 1000,
+        "chart_width": CHART_WIDTH,
+        "chart_height": CHART_HEIGHT,
+    }
+    with phase("render"):
+        return render(request, "showcase/day_history.html", context)
+
+
+def leaderboard(request: HttpRequest):
+    """Show the private leaderboard as last fetched.
+
+    Renders from the local cache only; a stale or missing copy is refreshed
+    in the background and shows up on a later visit.
+    """
+    leaderboard_id = aoc_settings.leaderboard_id
+    cached = leaderboard_refresh.cached(leaderboard_id) if leaderboard_id else None
+
+    days: list[int] = []
+    members = []
+    if cached is not None:
+        days = cached.leaderboard.days()
+        for rank, member in enumerate(cached.leaderboard.ranked(), start=1):
+            members.append(
+                {
+                    "rank": rank,
+                    "name": member.display_name,
+                    "score": member.local_score,
+                    "stars": member.stars,
+                    "days": [member.stars_on(day) for day in days],
+                }
+            )
+
+    context = {
+        "year": 2025,
+        "configured": bool(leaderboard_id),
+        "fetched": cached is not None,
+        "fetched_at": (
+            datetime.fromtimestamp(cached.fetched_at, tz=UTC) if cached else None
+        ),
+        "stale": cached is None or cached.is_stale(time.time()),
+        "refreshing": leaderboard_refresh.refreshing,
+        "error": leaderboard_refresh.last_error,
+        "days": days,
+        "members": members,
+    }
+    with phase("render"):
+        return _cacheable(render(request, "showcase/leaderboard.html", context))
+
+
+def solve_status_api(request: HttpRequest, day: int):
+    """API endpoint reporting the background solve job for a day."""
+    scaffold = _scaffold(day)
+    if not scaffold.get_solution_path().exists():
+        return JsonResponse({"status": "error", "error": "No solution"}, status=404)
+    if not scaffold.get_input_path().exists():
+        return JsonResponse({"status": "error", "error": "No input"}, status=404)
+
+    response = JsonResponse(jobs.result(day))
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def metrics(request: HttpRequest):
+    """Expose metrics in the Prometheus text format."""
+    token = settings.SHOWCASE_METRICS_TOKEN
+    if token:
+        expected = f"Bearer {token}"
+        given = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(given.encode(), expected.encode()):
+            return HttpResponse("Unauthorized", status=401, content_type="text/plain")
 
-    return render(request, "showcase/day_detail.html", context)
+    response = HttpResponse(render_latest(), content_type=CONTENT_TYPE_LATEST)
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 
 def download_input_api(request: HttpRequest, day: int):
@@ -0,0 +1,144 @@
+"""Shared fixtures: a fake clock and a local stand-in for the AOC server."""
+
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+import pytest
+
+from aoc2025.api import AOCClient
+
+RIGHT_ANSWER = "That's the right answer! You are one gold star closer."
+WRONG_ANSWER = (
+    "That's not the right answer; your answer is too {}. Please wait one minute "
+    "before trying again."
+)
+TOO_RECENT = "You gave an answer too recently. You have 30s left to wait."
+
+
+class FakeClock:
+    """Clock whose sleeps advance it instantly and are recorded."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class Request(NamedTuple):
+    """One request the stand-in server received."""
+
+    method: str
+    path: str
+    body: str
+    connection: int
+
+
+class StandInServer:
+    """Local HTTP server answering like adventofcode.com.
+
+    Inputs are served from :attr:`inputs`, and answer submissions get the
+    messages queued in :attr:`verdicts` (the right answer once they run
+    out). Every request is recorded with the number of the TCP connection
+    it came in on.
+    """
+
+    def __init__(self):
+        self.inputs: dict[int, str] = {}
+        self.verdicts: list[str] = []
+        self.requests: list[Request] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def posts(self) -> list[Request]:
+        """Get the answer submissions received so far."""
+        return [r for r in self.requests if r.method == "POST"]
+
+    def client(self, **kwargs: object) -> AOCClient:
+        """Get a client with a session cookie that talks to this server."""
+        return AOCClient(session_cookie="test", base_url=self.url, **kwargs)  # type: ignore[arg-type]
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps connections open between requests
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+                    self.connection_number = server.connections
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _record(self) -> str:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length).decode()
+                with server._lock:
+                    server.requests.append(
+                        Request(self.command, self.path, body, self.connection_number)
+                    )
+                return body
+
+            def _send(self, status: int, text: str = "") -> None:
+                data = text.encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(data)
+
+            def do_HEAD(self) -> None:
+                self._record()
+                self._send(404)
+
+            def do_GET(self) -> None:
+                self._record()
+                parts = self.path.strip("/").split("/")
+                if len(parts) == 4 and parts[3] == "input":
+                    text = server.inputs.get(int(parts[2]))
+                    if text is not None:
+                        self._send(200, text)
+                        return
+                self._send(404, "Not found")
+
+            def do_POST(self) -> None:
+                self._record()
+                with server._lock:
+                    verdict = server.verdicts.pop(0) if server.verdicts else None
+                message = verdict or RIGHT_ANSWER
+                self._send(200, f"<main><article><p>{message}</p></article></main>")
+
+        return Handler
+
+    def serve(self) -> None:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def aoc_server() -> Generator[StandInServer]:
+    server = StandInServer()
+    server.serve()
+    yield server
+    server.close()
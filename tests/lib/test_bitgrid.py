@@ -0,0 +1,93 @@
+"""Tests for BitGrid's packed storage and whole-grid neighbour counts."""
+
+import random
+
+import pytest
+
+from aoc2025.lib import ALL_DIRECTIONS, ORTHOGONAL, BitGrid
+
+
+def random_lines(rng: random.Random, width: int, height: int) -> list[str]:
+    return ["".join(rng.choice("#.") for _ in range(width)) for _ in range(height)]
+
+
+def naive_count(lines: list[str], x: int, y: int, directions) -> int:
+    return sum(
+        1
+        for dx, dy in directions
+        if 0 <= x + dx < len(lines[0])
+        and 0 <= y + dy < len(lines)
+        and lines[y + dy][x + dx] == "#"
+    )
+
+
+def test_from_lines_round_trips_through_render():
+    lines = ["#..#", ".##.", "...."]
+    grid = BitGrid.from_lines(lines)
+
+    assert grid.render() == "\n".join(lines)
+    assert len(grid) == 4
+    assert (0, 0) in grid and (1, 1) in grid
+    assert (1, 0) not in grid and (5, 0) not in grid
+
+
+def test_rows_of_different_length_are_rejected():
+    with pytest.raises(ValueError):
+        BitGrid.from_lines(["##", "#"])
+
+
+def test_set_and_positions():
+    grid = BitGrid(3, 2)
+    grid.set(2, 0)
+    grid.set(0, 1)
+    grid.set(2, 0, False)
+    grid.set(1, 1)
+
+    assert list(grid.positions()) == [(0, 1), (1, 1)]
+    with pytest.raises(IndexError):
+        grid.set(3, 0)
+
+
+def test_shifts_do_not_wrap_into_neighbouring_rows():
+    grid = BitGrid.from_lines(["..#", "#.."])
+
+    assert grid.shifted(1, 0).render() == ".#.\n..."
+    assert grid.shifted(-1, 0).render() == "...\n.#."
+    assert grid.shifted(0, 1).render() == "#..\n..."
+
+
+@pytest.mark.parametrize("directions", [ALL_DIRECTIONS, ORTHOGONAL])
+def test_neighbour_count_planes_match_naive_counts(directions):
+    rng = random.Random(31)
+    for _ in range(50):
+        width, height = rng.randint(1, 12), rng.randint(1, 12)
+        lines = random_lines(rng, width, height)
+        planes = BitGrid.from_lines(lines).neighbour_count_planes(directions)
+
+        for y in range(height):
+            for x in range(width):
+                bit = y * (width + 1) + x
+                count = sum(((plane >> bit) & 1) << i for i, plane in enumerate(planes))
+                assert count == naive_count(lines, x, y, directions), (lines, x, y)
+
+
+def test_with_neighbours_fewer_than_matches_naive_filter():
+    rng = random.Random(4)
+    for _ in range(50):
+        width, height = rng.randint(1, 10), rng.randint(1, 10)
+        lines = random_lines(rng, width, height)
+        grid = BitGrid.from_lines(lines)
+
+        for n in range(10):
+            expected = {
+                (x, y)
+                for y in range(height)
+                for x in range(width)
+                if lines[y][x] == "#" and naive_count(lines, x, y, ALL_DIRECTIONS) < n
+            }
+            assert set(grid.with_neighbours_fewer_than(n).positions()) == expected
+
+
+def test_grids_are_unhashable():
+    with pytest.raises(TypeError):
+        hash(BitGrid(2, 2))
@@ -0,0 +1,55 @@
+"""Tests for the int-backed BitSet."""
+
+import random
+
+import pytest
+
+from aoc2025.lib import BitSet
+
+
+def test_add_discard_and_membership():
+    members = BitSet([3, 0, 64])
+    members.add(5)
+    members.discard(0)
+    members.discard(7)
+
+    assert list(members) == [3, 5, 64]
+    assert len(members) == 3
+    assert 64 in members and 0 not in members and -1 not in members
+    assert not BitSet() and members
+
+
+def test_negative_members_are_rejected():
+    with pytest.raises(ValueError):
+        BitSet([-1])
+    with pytest.raises(ValueError):
+        BitSet().add(-1)
+
+
+def test_members_combine_with_existing_bits():
+    rng = random.Random(7)
+    values = [rng.randrange(100_000) for _ in range(5_000)]
+
+    members = BitSet(iter(values), bits=0b101)
+
+    assert list(members) == sorted({0, 2, *values})
+    assert BitSet([5, 5, 5]).bits == 1 << 5
+
+
+def test_equal_sets_hash_alike():
+    assert BitSet([1, 2]) == BitSet(bits=0b110)
+    assert len({BitSet([1, 2]), BitSet([2, 1]), BitSet([3])}) == 2
+
+
+def test_matches_a_plain_set():
+    rng = random.Random(31)
+    for _ in range(200):
+        a_values = {rng.randrange(100) for _ in range(rng.randint(0, 20))}
+        b_values = {rng.randrange(100) for _ in range(rng.randint(0, 20))}
+        a, b = BitSet(a_values), BitSet(b_values)
+
+        assert list(a) == sorted(a_values)
+        assert set(a | b) == a_values | b_values
+        assert set(a & b) == a_values & b_values
+        assert set(a ^ b) == a_values ^ b_values
+        assert set(a - b) == a_values - b_values
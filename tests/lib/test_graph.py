@@ -0,0 +1,80 @@
+"""Tests for breadth-first search and Dijkstra over implicit graphs."""
+
+import random
+from collections.abc import Callable
+
+from aoc2025.lib import ORTHOGONAL, Grid, bfs, dijkstra
+
+MAZE = [
+    "S.#.....",
+    ".##.###.",
+    "....#...",
+    "###.#.#.",
+    "......#E",
+]
+
+
+Pos = tuple[int, int]
+
+
+def open_neighbours(grid: Grid) -> Callable[[Pos], list[Pos]]:
+    def neighbours(pos: Pos) -> list[Pos]:
+        return [p for p in grid.neighbours(*pos, ORTHOGONAL) if grid[p] != "#"]
+
+    return neighbours
+
+
+def floyd_warshall(n: int, edges: dict[tuple[int, int], int]) -> list[list[float]]:
+    dist = [[0.0 if i == j else float("inf") for j in range(n)] for i in range(n)]
+    for (a, b), cost in edges.items():
+        dist[a][b] = min(dist[a][b], cost)
+    for k in range(n):
+        for i in range(n):
+            for j in range(n):
+                dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+    return dist
+
+
+def test_bfs_finds_shortest_steps_through_a_maze():
+    grid = Grid.from_lines(MAZE)
+    distances = bfs((0, 0), open_neighbours(grid))
+
+    assert distances[0, 0] == 0
+    assert distances[7, 4] == 15
+    # Walls are never visited
+    assert all(grid[pos] != "#" for pos in distances)
+
+
+def test_bfs_stops_at_the_goal():
+    grid = Grid.from_lines(MAZE)
+    distances = bfs((0, 0), open_neighbours(grid), goal=lambda pos: pos == (3, 0))
+
+    assert distances[3, 0] == 7
+    assert (7, 4) not in distances
+
+
+def test_dijkstra_prefers_cheap_detours():
+    edges = {"a": [("b", 10), ("c", 1)], "c": [("d", 1)], "d": [("b", 1)], "b": []}
+    distances = dijkstra("a", lambda node: edges[node])
+
+    assert distances == {"a": 0, "c": 1, "d": 2, "b": 3}
+
+
+def test_dijkstra_matches_floyd_warshall():
+    rng = random.Random(31)
+    for _ in range(100):
+        n = rng.randint(1, 12)
+        edges = {
+            (rng.randrange(n), rng.randrange(n)): rng.randint(0, 20)
+            for _ in range(rng.randint(0, 30))
+        }
+        adjacency: dict[int, list[tuple[int, int]]] = {i: [] for i in range(n)}
+        for (a, b), cost in edges.items():
+            adjacency[a].append((b, cost))
+
+        expected = floyd_warshall(n, edges)
+        distances = dijkstra(0, adjacency.__getitem__)
+
+        reachable = {i for i in range(n) if expected[0][i] != float("inf")}
+        assert set(distances) == reachable
+        assert all(distances[i] == expected[0][i] for i in reachable)
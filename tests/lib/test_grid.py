@@ -0,0 +1,62 @@
+"""Tests for the bytearray-backed character Grid."""
+
+import random
+
+import pytest
+
+from aoc2025.lib import ALL_DIRECTIONS, ORTHOGONAL, Grid
+
+
+def test_access_and_bounds():
+    grid = Grid.from_lines(["ab", "cd"])
+
+    assert grid[1, 0] == "b"
+    grid[0, 1] = "x"
+    assert str(grid) == "ab\nxd"
+    with pytest.raises(IndexError):
+        grid[2, 0]
+
+
+def test_copy_is_independent():
+    grid = Grid.from_lines(["..", ".."])
+    copy = grid.copy()
+    copy[0, 0] = "#"
+
+    assert grid[0, 0] == "."
+    assert copy != grid
+
+
+def test_neighbours_skip_out_of_bounds_positions():
+    grid = Grid(3, 3)
+
+    assert sorted(grid.neighbours(0, 0)) == [(0, 1), (1, 0), (1, 1)]
+    assert len(list(grid.neighbours(1, 1, ORTHOGONAL))) == 4
+
+
+def test_find_all_and_count():
+    grid = Grid.from_lines(["#.#", "..#"])
+
+    assert list(grid.find_all("#")) == [(0, 0), (2, 0), (2, 1)]
+    assert grid.count("#") == 3
+
+
+@pytest.mark.parametrize("directions", [ALL_DIRECTIONS, ORTHOGONAL])
+def test_neighbour_counts_match_count_neighbours(directions):
+    rng = random.Random(31)
+    for _ in range(50):
+        width, height = rng.randint(1, 12), rng.randint(1, 12)
+        grid = Grid.from_lines(
+            "".join(rng.choice("@.") for _ in range(width)) for _ in range(height)
+        )
+        counts = grid.neighbour_counts("@", directions)
+
+        assert len(counts) == width * height
+        for y in range(height):
+            for x in range(width):
+                expected = grid.count_neighbours(x, y, "@", directions)
+                assert counts[y * width + x] == expected
+
+
+def test_grids_are_unhashable():
+    with pytest.raises(TypeError):
+        hash(Grid(2, 2))
@@ -0,0 +1,64 @@
+"""Tests for IntervalSet merging, membership and set operations."""
+
+import random
+
+import pytest
+
+from aoc2025.lib import IntervalSet
+
+
+def random_ranges(rng: random.Random, count: int) -> list[tuple[int, int]]:
+    ranges = []
+    for _ in range(count):
+        start = rng.randint(-50, 50)
+        ranges.append((start, start + rng.randint(0, 10)))
+    return ranges
+
+
+def covered(ranges: list[tuple[int, int]]) -> set[int]:
+    return {n for start, end in ranges for n in range(start, end + 1)}
+
+
+def test_overlapping_and_adjacent_ranges_merge():
+    intervals = IntervalSet([(10, 14), (1, 3), (4, 5), (12, 20), (30, 30)])
+
+    assert list(intervals) == [(1, 5), (10, 20), (30, 30)]
+    assert intervals.size == 5 + 11 + 1
+
+
+def test_reversed_range_is_rejected():
+    with pytest.raises(ValueError):
+        IntervalSet([(5, 4)])
+
+
+def test_membership_and_containing_range():
+    intervals = IntervalSet([(1, 5), (10, 20)])
+
+    assert 1 in intervals and 20 in intervals
+    assert 0 not in intervals and 7 not in intervals and 21 not in intervals
+    assert intervals.range_containing(12) == (10, 20)
+    assert intervals.range_containing(7) is None
+
+
+def test_matches_a_plain_set():
+    rng = random.Random(31)
+    for _ in range(200):
+        a_ranges = random_ranges(rng, rng.randint(0, 8))
+        b_ranges = random_ranges(rng, rng.randint(0, 8))
+        a, b = IntervalSet(a_ranges), IntervalSet(b_ranges)
+        a_values, b_values = covered(a_ranges), covered(b_ranges)
+
+        assert a.size == len(a_values)
+        assert all((n in a) == (n in a_values) for n in range(-60, 70))
+        assert covered(list(a | b)) == a_values | b_values
+        assert covered(list(a & b)) == a_values & b_values
+        # Merged ranges are disjoint and never touch
+        merged = list(a)
+        assert all(
+            prev[1] + 1 < cur[0] for prev, cur in zip(merged, merged[1:], strict=False)
+        )
+
+
+def test_equal_sets_hash_alike():
+    assert hash(IntervalSet([(1, 3), (4, 5)])) == hash(IntervalSet([(1, 5)]))
+    assert len({IntervalSet([(1, 5)]), IntervalSet([(1, 2), (3, 5)])}) == 1
@@ -0,0 +1,36 @@
+"""Tests for the regex-free integer tokenizer."""
+
+import random
+import re
+
+import pytest
+
+from aoc2025.lib import int_array, int_rows, ints, positive_ints
+
+
+def test_signs_and_separators():
+    assert ints("x=-3, y=12 -- 4-5 -") == [-3, 12, 4, -5]
+    assert positive_ints("3-5,10-12") == [3, 5, 10, 12]
+    assert ints("") == []
+
+
+def test_int_array_and_overflow():
+    assert list(int_array("1 -2 3")) == [1, -2, 3]
+    with pytest.raises(OverflowError):
+        int_array(str(2**63))
+
+
+def test_int_rows():
+    assert int_rows("1-2\n3-4", 2, signed=False) == [(1, 2), (3, 4)]
+    with pytest.raises(ValueError):
+        int_rows("1 2 3", 2)
+
+
+def test_matches_the_regex_it_replaces():
+    rng = random.Random(31)
+    alphabet = "0123456789--- ,\nx"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+
+        assert ints(text) == [int(m) for m in re.findall(r"-?[0-9]+", text)], text
+        assert positive_ints(text) == [int(m) for m in re.findall(r"[0-9]+", text)]
@@ -0,0 +1,38 @@
+"""Tests for the array-backed UnionFind."""
+
+import random
+
+from aoc2025.lib import UnionFind
+
+
+def test_union_merges_sets_once():
+    uf = UnionFind(5)
+
+    assert uf.union(0, 1)
+    assert uf.union(3, 4)
+    assert not uf.union(1, 0)
+    assert uf.connected(0, 1) and not uf.connected(1, 3)
+    assert uf.count == 3
+    assert sorted(uf.set_sizes()) == [1, 2, 2]
+    assert uf.set_size(4) == 2
+
+
+def test_matches_naive_components():
+    rng = random.Random(31)
+    for _ in range(100):
+        n = rng.randint(1, 30)
+        uf = UnionFind(n)
+        components = [{i} for i in range(n)]
+        for _ in range(rng.randint(0, 40)):
+            a, b = rng.randrange(n), rng.randrange(n)
+            uf.union(a, b)
+            ca = next(c for c in components if a in c)
+            cb = next(c for c in components if b in c)
+            if ca is not cb:
+                components.remove(cb)
+                ca |= cb
+
+        assert uf.count == len(components)
+        assert sorted(uf.set_sizes()) == sorted(len(c) for c in components)
+        for component in components:
+            assert all(uf.connected(x, min(component)) for x in component)
@@ -0,0 +1,70 @@
+"""Tests for the AOC client, run against a local stand-in server."""
+
+from pathlib import Path
+
+import pytest
+from conftest import WRONG_ANSWER, FakeClock, StandInServer
+
+from aoc2025.api import AOCClient
+from aoc2025.ledger import AnswerLedger
+
+
+def test_requests_reuse_one_connection(clock: FakeClock, aoc_server: StandInServer):
+    aoc_server.inputs[1] = "L68\nR48\n"
+    client = aoc_server.client(clock=clock, sleep=clock.sleep)
+
+    client.connect(1)
+    assert client.download_input(1) == "L68\nR48\n"
+    assert client.download_input(1) == "L68\nR48\n"
+    assert client.submit_answer(1, 1, 3).success
+
+    assert [(r.method, r.path) for r in aoc_server.requests] == [
+        ("HEAD", "/2025/day/1"),
+        ("GET", "/2025/day/1/input"),
+        ("GET", "/2025/day/1/input"),
+        ("POST", "/2025/day/1/answer"),
+    ]
+    assert {r.connection for r in aoc_server.requests} == {1}
+    assert aoc_server.connections == 1
+
+
+def test_ledger_hits_skip_the_post(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    ledger = AnswerLedger(tmp_path / "ledger.json")
+    client = aoc_server.client(clock=clock, sleep=clock.sleep, ledger=ledger)
+    aoc_server.verdicts = [WRONG_ANSWER.format("low")]
+
+    first = client.submit_answer(2, 1, 100)
+    assert (first.hint, first.cooldown, first.from_ledger) == ("too_low", 60, False)
+
+    again = client.submit_answer(2, 1, "100")
+    lower = client.submit_answer(2, 1, 50)
+    assert again.from_ledger and not again.success
+    assert lower.from_ledger and lower.hint == "too_low"
+    assert len(aoc_server.posts()) == 1
+
+    assert client.submit_answer(2, 1, 150).success
+    assert client.submit_answer(2, 1, 150).from_ledger
+    assert client.submit_answer(2, 1, 151).already_completed
+    assert [p.body for p in aoc_server.posts()] == [
+        "level=1&answer=100",
+        "level=1&answer=150",
+    ]
+    assert clock.sleeps == []
+
+
+@pytest.mark.parametrize(
+    ("message", "wait_time"),
+    [
+        ("You gave an answer too recently. You have 45s left to wait.", 45),
+        ("You gave an answer too recently. You have 1m 5s left to wait.", 65),
+        ("You gave an answer too recently.", 60),
+    ],
+)
+def test_answering_too_soon_reports_the_wait(message: str, wait_time: int):
+    client = AOCClient(session_cookie="test", base_url="http://127.0.0.1:9")
+    response = client._parse_submission_response(  # pyright: ignore[reportPrivateUsage]
+        f"<article><p>{message}</p></article>"
+    )
+    assert (response.success, response.wait_time) == (False, wait_time)
@@ -0,0 +1,57 @@
+"""Tests for the answer ledger."""
+
+from pathlib import Path
+from typing import Literal
+
+from aoc2025.ledger import AnswerLedger
+from aoc2025.models import SubmissionResponse
+
+
+def wrong(hint: Literal["too_high", "too_low"] | None = None) -> SubmissionResponse:
+    return SubmissionResponse(success=False, message="wrong", cooldown=60, hint=hint)
+
+
+def test_unknown_answers_need_submitting(tmp_path: Path):
+    ledger = AnswerLedger(tmp_path / "ledger.json")
+    assert ledger.check(1, 1, 5) is None
+
+
+def test_hints_become_bounds(tmp_path: Path):
+    ledger = AnswerLedger(tmp_path / "ledger.json")
+    ledger.record(1, 1, 100, wrong("too_low"))
+    ledger.record(1, 1, 90, wrong("too_low"))
+    ledger.record(1, 1, 200, wrong("too_high"))
+    ledger.record(1, 1, "abc", wrong())
+
+    record = ledger.get(1, 1)
+    assert (record.above, record.below) == (100, 200)
+    assert record.wrong == ["100", "90", "200", "abc"]
+
+    too_low = ledger.check(1, 1, 50)
+    too_high = ledger.check(1, 1, 250)
+    assert too_low is not None and too_low.hint == "too_low"
+    assert too_high is not None and too_high.hint == "too_high"
+    assert too_low.from_ledger and not too_low.success
+    assert ledger.check(1, 1, "abc") is not None
+    assert ledger.check(1, 1, 150) is None
+    assert ledger.check(1, 2, 50) is None
+
+
+def test_solved_parts_are_judged_locally(tmp_path: Path):
+    ledger = AnswerLedger(tmp_path / "ledger.json")
+    ledger.record(2, 1, 150, SubmissionResponse(success=True, message="right"))
+
+    same = ledger.check(2, 1, " 150 ")
+    other = ledger.check(2, 1, 151)
+    assert same is not None and same.success and same.from_ledger
+    assert other is not None and other.already_completed and not other.success
+
+
+def test_responses_without_a_verdict_are_not_recorded(tmp_path: Path):
+    ledger = AnswerLedger(tmp_path / "ledger.json")
+    ledger.record(3, 1, 7, SubmissionResponse(success=False, message="", wait_time=30))
+    ledger.record(
+        3, 1, 8, SubmissionResponse(success=False, message="", from_ledger=True)
+    )
+
+    assert ledger.get(3, 1) == AnswerLedger(tmp_path / "other.json").get(3, 1)
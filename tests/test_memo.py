@@ -0,0 +1,151 @@
+"""Tests for the memoize decorator: LRU bounds, persistence and worker changes."""
+
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+
+from aoc2025 import memo
+from aoc2025.config import settings
+from aoc2025.memo import Memoized, memoize
+from aoc2025.runner import file_hash
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path]:
+    monkeypatch.setattr(settings, "cache_dir", tmp_path)
+    yield tmp_path
+    # Nothing is left dirty for the atexit save into the real cache directory
+    memo.clear_all()
+
+
+def counted() -> tuple[Callable[[int], int], list[int]]:
+    """Get a function squaring its argument and the arguments it was called with."""
+    calls: list[int] = []
+
+    def square(n: int) -> int:
+        calls.append(n)
+        return n * n
+
+    return square, calls
+
+
+def test_lru_evicts_the_least_recently_used():
+    square, calls = counted()
+    cached = memoize(maxsize=2)(square)
+
+    for n in (1, 2, 1, 3, 2, 1):
+        cached(n)
+
+    # 3 evicts 2, since 1 was used since; then 2 evicts 1, and 1 evicts 3
+    assert calls == [1, 2, 3, 2, 1]
+    info = cached.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 5, 3, 2)
+    assert info.hit_rate == 1 / 6
+
+
+def test_persisted_cache_round_trip(cache_dir: Path):
+    square, calls = counted()
+    cached = memoize(persist=True)(square)
+    cached(2)
+    cached(3)
+
+    path = cached.cache_path()
+    assert path.parent == cache_dir / "memo"
+    assert file_hash(Path(__file__))[:16] in path.name
+    assert not path.exists()
+
+    cached.save()
+    assert path.exists()
+
+    # A fresh wrapper, as in the next run, starts from the saved results
+    reloaded = memoize(persist=True)(square)
+    assert (reloaded(2), reloaded(3), reloaded(4)) == (4, 9, 16)
+    assert calls == [2, 3, 4]
+    assert (reloaded.cache_info().hits, reloaded.cache_info().misses) == (2, 1)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not a pickle",
+        # A class in a module that no longer exists
+        b"\x80\x04\x95\x1a\x00\x00\x00\x00\x00\x00\x00\x8c\x0bgone_module"
+        b"\x94\x8c\x05Thing\x94\x93\x94)\x81\x94.",
+        # A dict with an unhashable key
+        b"\x80\x04}(]K\x01u.",
+        # A pickle protocol from the future
+        b"\x80\x09.",
+    ],
+)
+def test_unreadable_cache_file_is_ignored(content: bytes):
+    square, calls = counted()
+    cached = memoize(persist=True)(square)
+    path = cached.cache_path()
+    path.parent.mkdir(parents=True)
+    path.write_bytes(content)
+
+    assert cached(5) == 25
+    assert calls == [5]
+
+
+def test_cache_clear_can_keep_the_file():
+    square, calls = counted()
+    cached = memoize(persist=True)(square)
+    cached(2)
+    cached.save()
+
+    cached.cache_clear(keep_file=True)
+    assert cached.cache_path().exists()
+    # The kept file is not read back in this process
+    cached(2)
+    assert calls == [2, 2]
+    assert cached.cache_info().misses == 1
+
+    cached.cache_clear()
+    assert not cached.cache_path().exists()
+    assert cached.cache_info().currsize == 0
+
+
+def test_worker_changes_merge_into_the_parent(monkeypatch: pytest.MonkeyPatch):
+    square, calls = counted()
+    parent = memoize(persist=True, maxsize=2)(square)
+    worker = Memoized(
+        square, maxsize=2, persist=True, is_method=False, ignore_self=False
+    )
+
+    monkeypatch.setattr(memo, "_tracking", True)
+    worker(1)
+    worker(1)
+    worker(2)
+    worker(3)
+    changes = worker.take_changes()
+
+    assert changes is not None
+    assert (changes.hits, changes.misses, changes.evictions) == (1, 3, 1)
+    assert changes.entries == {1: 1, 2: 4, 3: 9}
+    # Reported activity is not reported again
+    assert worker.take_changes() is None
+
+    monkeypatch.setattr(memo, "_tracking", False)
+    parent.merge_changes(changes)
+    info = parent.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 3, 2, 2)
+    assert (parent(2), parent(3)) == (4, 9)
+    assert calls == [1, 2, 3]
+
+    # Merged results are saved by the parent
+    parent.save()
+    assert parent.cache_path().exists()
+
+
+def test_unpersisted_changes_carry_only_counters(monkeypatch: pytest.MonkeyPatch):
+    square, _ = counted()
+    cached = memoize(square)
+    monkeypatch.setattr(memo, "_tracking", True)
+
+    cached(1)
+    changes = memo.take_changes()
+
+    name = f"{cached.__module__}.{cached.__qualname__}"
+    assert [(c.misses, c.entries) for c in changes if c.name == name] == [(1, {})]
@@ -0,0 +1,113 @@
+"""Tests for splitting work and running it on a pool of worker processes."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from aoc2025 import parallel
+from aoc2025.models import SolutionBase
+from aoc2025.parallel import batched, parallel_map, shutdown_pool, split_ranges
+from aoc2025.runner import load_solution_class
+
+# Later chunks finish first, so results arriving in completion order would
+# come back reversed
+SOLUTION = '''
+import os
+import time
+
+from aoc2025.models import SolutionBase
+
+
+class Solution(SolutionBase):
+    day = 24
+
+    def part_1(self):
+        return 0
+
+    def part_2(self):
+        return 0
+
+    def slow_sum(self, chunk):
+        start, end = chunk
+        time.sleep(0.02 * (8 - start))
+        return sum(range(start, end + 1)) + len(self.raw_input)
+
+    def pid(self, chunk):
+        return os.getpid()
+'''
+
+
+@pytest.fixture
+def solution(tmp_path: Path) -> Generator[SolutionBase]:
+    path = tmp_path / "day_24" / "solution.py"
+    path.parent.mkdir()
+    path.write_text(SOLUTION)
+    yield load_solution_class(24, path)(raw_input="abc")
+    shutdown_pool()
+
+
+def test_results_keep_chunk_order(solution: SolutionBase):
+    chunks = [(i, i + 1) for i in range(8)]
+    fn = type(solution).slow_sum  # type: ignore[attr-defined]
+
+    expected = [2 * i + 1 + 3 for i in range(8)]
+    assert parallel_map(solution, fn, chunks, workers=4) == expected
+    assert parallel_map(solution, fn, chunks, workers=1) == expected
+
+
+def test_pool_is_reused_for_the_same_input(solution: SolutionBase):
+    fn = type(solution).pid  # type: ignore[attr-defined]
+
+    first = parallel_map(solution, fn, range(8), workers=2)
+    pool = parallel._pool  # pyright: ignore[reportPrivateUsage]
+    second = parallel_map(solution, fn, range(8), workers=2)
+
+    assert parallel._pool is pool  # pyright: ignore[reportPrivateUsage]
+    assert set(second) <= set(first)
+
+    # Another pool size starts fresh workers
+    third = parallel_map(solution, fn, range(8), workers=3)
+    assert parallel._pool is not pool  # pyright: ignore[reportPrivateUsage]
+    assert not set(third) & set(first)
+
+
+@pytest.mark.parametrize(
+    ("ranges", "pieces", "expected"),
+    [
+        ([], 4, []),
+        ([(5, 4)], 4, []),
+        ([(7, 7)], 4, [[(7, 7)]]),
+        ([(1, 3)], 10, [[(1, 1)], [(2, 2)], [(3, 3)]]),
+        ([(1, 10), (20, 21)], 3, [[(1, 4)], [(5, 8)], [(9, 10), (20, 21)]]),
+    ],
+)
+def test_split_ranges(
+    ranges: list[tuple[int, int]], pieces: int, expected: list[list[tuple[int, int]]]
+):
+    assert split_ranges(ranges, pieces) == expected
+
+
+def test_split_ranges_balances_uneven_ranges():
+    ranges = [(1, 1), (100, 1099), (5000, 5002)]
+
+    pieces = split_ranges(ranges, 4)
+
+    sizes = [sum(end - start + 1 for start, end in piece) for piece in pieces]
+    assert len(pieces) == 4
+    assert max(sizes) - min(sizes) <= 2
+    # Concatenated, the pieces are the original ranges, cut where needed
+    assert [r for piece in pieces for r in piece] == [
+        (1, 1),
+        (100, 349),
+        (350, 600),
+        (601, 851),
+        (852, 1099),
+        (5000, 5002),
+    ]
+
+
+def test_batched():
+    assert batched([], 4) == []
+    assert batched([1, 2, 3], 10) == [[1], [2], [3]]
+    assert batched(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
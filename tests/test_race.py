@@ -0,0 +1,106 @@
+"""Tests for the unlock-to-submit pipeline, run against a local stand-in server."""
+
+from pathlib import Path
+
+from conftest import FakeClock, StandInServer
+
+from aoc2025.models import SolutionBase
+from aoc2025.race import CONNECT_LEAD, Stage, race
+from aoc2025.submissions import SubmissionQueue
+from aoc2025.unlock import FINE_SLICE, MAX_SLEEP, sleep_until
+
+
+class Solution(SolutionBase):
+    day = 1
+
+    def part_1(self) -> int | str:
+        return sum(int(line) for line in self.input_lines)
+
+    def part_2(self) -> int | str:
+        return 0
+
+
+def test_sleep_until_lands_on_the_deadline(clock: FakeClock):
+    deadline = clock.now + 125.5
+
+    assert sleep_until(deadline, clock, clock.sleep) == 0.0
+    assert clock.now == deadline
+    assert max(clock.sleeps) <= MAX_SLEEP
+    # The last stretch is slept in short slices instead of one long sleep
+    assert clock.sleeps[-1] <= FINE_SLICE
+
+
+def test_sleep_until_reports_a_missed_deadline(clock: FakeClock):
+    assert sleep_until(clock.now - 2.0, clock, clock.sleep) == 2.0
+    assert clock.sleeps == []
+
+
+def test_race_runs_stages_in_order(clock: FakeClock, aoc_server: StandInServer):
+    aoc_server.inputs[1] = "1\n2\n3\n"
+    unlock_at = clock.now + 3600
+    seen: list[Stage] = []
+
+    report = race(
+        aoc_server.client(clock=clock, sleep=clock.sleep),
+        1,
+        Solution,
+        unlock_at,
+        on_stage=seen.append,
+    )
+
+    assert [s.name for s in report.stages] == ["connect", "wait", "download", "solve"]
+    assert seen == report.stages
+    assert (report.input_text, report.answer, report.submission) == (
+        "1\n2\n3\n",
+        "6",
+        None,
+    )
+    # The connection is opened ahead, then the download starts at the unlock
+    connect, wait, download, _ = report.stages
+    assert connect.started == -CONNECT_LEAD
+    assert (wait.started, wait.finished) == (-CONNECT_LEAD, 0.0)
+    assert download.started == 0.0
+    assert clock.now == unlock_at
+    assert aoc_server.posts() == []
+
+
+def test_race_connects_at_once_when_started_late(
+    clock: FakeClock, aoc_server: StandInServer
+):
+    aoc_server.inputs[1] = "1\n"
+    unlock_at = clock.now + 2
+
+    report = race(
+        aoc_server.client(clock=clock, sleep=clock.sleep), 1, Solution, unlock_at
+    )
+
+    assert report.stages[0] == Stage("connect", -2.0, 0.0)
+    assert clock.now == unlock_at
+
+
+def test_race_submits_part_1_on_the_same_connection(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    aoc_server.inputs[1] = "4\n5\n"
+    queue = SubmissionQueue(tmp_path / "queue.json", clock=clock)
+
+    report = race(
+        aoc_server.client(clock=clock, sleep=clock.sleep),
+        1,
+        Solution,
+        clock.now + 60,
+        submit=True,
+        queue=queue,
+    )
+
+    assert report.stages[-1].name == "submit"
+    assert report.submission is not None
+    assert (report.submission.part, report.submission.status) == (1, "correct")
+    assert [(r.method, r.path) for r in aoc_server.requests] == [
+        ("HEAD", "/2025/day/1"),
+        ("GET", "/2025/day/1/input"),
+        ("POST", "/2025/day/1/answer"),
+    ]
+    assert [p.body for p in aoc_server.posts()] == ["level=1&answer=9"]
+    assert {r.connection for r in aoc_server.requests} == {1}
+    assert aoc_server.connections == 1
@@ -0,0 +1,144 @@
+"""Tests for puzzle input in shared memory, attached from spawned workers."""
+
+import gc
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from aoc2025.models import SolutionBase
+from aoc2025.shared import SharedInput, SharedInputHandle
+
+DATA = b"12 -3\n45\n"
+
+
+class Solution(SolutionBase):
+    day = 1
+
+    def part_1(self) -> int | str:
+        return 0
+
+    def part_2(self) -> int | str:
+        return 0
+
+
+def read_in_worker(handle: SharedInputHandle) -> tuple[bytes, str, list[int]]:
+    """Attach like a pool worker does and read everything back."""
+    solution = Solution.from_shared(SharedInput.attach(handle))
+    return (
+        bytes(solution.raw_bytes),
+        solution.raw_input,
+        list(solution.share_input().array("ints")),
+    )
+
+
+def spawn_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn"))
+
+
+def exists(name: str) -> bool:
+    try:
+        SharedInput.attach(SharedInputHandle(name, 0, ())).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def test_spawned_worker_reads_the_owners_blocks():
+    owner = SharedInput.from_bytes(DATA)
+    owner.add_array("ints", array("q", [12, -3, 45]))
+
+    with spawn_pool() as pool:
+        result = pool.submit(read_in_worker, owner.handle()).result()
+
+    assert result == (DATA, DATA.decode(), [12, -3, 45])
+    owner.close()
+
+
+def test_solution_from_shared_input_is_a_complete_model():
+    owner = SharedInput.from_bytes(DATA)
+
+    solution = Solution.from_shared(owner)
+
+    assert solution.model_dump() == {
+        "raw_input": DATA.decode(),
+        "input_lines": ["12 -3", "45"],
+    }
+    assert solution.model_copy().input_lines == ["12 -3", "45"]
+    assert bytes(solution.raw_bytes) == DATA
+    owner.close()
+
+
+def test_owners_blocks_survive_workers_exiting():
+    owner = SharedInput.from_bytes(DATA)
+    owner.add_array("ints", array("q", [1]))
+    handle = owner.handle()
+
+    # Each pool's worker attaches, then exits when the pool shuts down
+    for _ in range(2):
+        with spawn_pool() as pool:
+            assert pool.submit(read_in_worker, handle).result()[0] == DATA
+
+    assert exists(handle.raw_name) and exists(handle.arrays[0][1])
+    assert bytes(owner.raw) == DATA
+    owner.close()
+    assert not exists(handle.raw_name) and not exists(handle.arrays[0][1])
+
+
+def test_close_releases_live_views_and_removes_the_blocks():
+    owner = SharedInput.from_bytes(DATA)
+    raw = owner.raw
+    ints = owner.add_array("ints", array("q", [7, 8]))
+    name = owner.handle().raw_name
+
+    owner.close()
+    owner.close()  # Closing again is a no-op
+
+    assert not exists(name)
+    with pytest.raises(ValueError):
+        bytes(raw)
+    with pytest.raises(ValueError):
+        ints[0]
+
+
+def test_close_tolerates_views_derived_from_handed_out_ones():
+    owner = SharedInput.from_bytes(DATA)
+    piece = owner.raw[:2]
+    name = owner.handle().raw_name
+
+    owner.close()
+
+    # The block is removed, but its mapping stays until the slice is gone
+    assert not exists(name)
+    assert bytes(piece) == DATA[:2]
+    # Let go of the slice before the block, which closes it for good then
+    del piece
+    del owner
+
+
+def test_garbage_collection_runs_the_cleanup():
+    owner = SharedInput.from_bytes(DATA)
+    raw = owner.raw
+    name = owner.handle().raw_name
+    finalizer = owner._finalizer  # pyright: ignore[reportPrivateUsage]
+
+    del owner
+    gc.collect()
+
+    assert not finalizer.alive
+    assert not exists(name)
+    with pytest.raises(ValueError):
+        bytes(raw)
+
+
+def test_attached_inputs_cannot_add_arrays_or_remove_blocks():
+    owner = SharedInput.from_bytes(DATA)
+    attached = SharedInput.attach(owner.handle())
+
+    with pytest.raises(PermissionError):
+        attached.add_array("ints", array("q"))
+    attached.close()
+
+    assert exists(owner.handle().raw_name)
+    owner.close()
@@ -0,0 +1,63 @@
+"""Tests for JSON stores shared between processes."""
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from aoc2025.store import JsonStore
+
+WORKERS = 4
+INCREMENTS = 50
+
+
+class Counter(BaseModel):
+    value: int = 0
+    writers: list[int] = []
+
+
+def increment(path: Path, worker: int) -> None:
+    store = JsonStore(path, Counter)
+    for _ in range(INCREMENTS):
+        with store.update() as counter:
+            counter.value += 1
+            counter.writers.append(worker)
+
+
+def test_missing_file_reads_as_defaults(tmp_path: Path):
+    store = JsonStore(tmp_path / "missing.json", Counter)
+    assert store.read() == Counter()
+
+
+def test_update_saves_unless_the_block_raises(tmp_path: Path):
+    store = JsonStore(tmp_path / "counter.json", Counter)
+    with store.update() as counter:
+        counter.value = 3
+
+    with pytest.raises(RuntimeError), store.update() as counter:
+        counter.value = 4
+        raise RuntimeError
+
+    assert store.read().value == 3
+    assert not (tmp_path / "counter.tmp").exists()
+
+
+def test_concurrent_updates_lose_nothing(tmp_path: Path):
+    path = tmp_path / "counter.json"
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=increment, args=(path, worker))
+        for worker in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    counter = JsonStore(path, Counter).read()
+    assert counter.value == WORKERS * INCREMENTS
+    assert sorted(counter.writers) == sorted(
+        worker for worker in range(WORKERS) for _ in range(INCREMENTS)
+    )
@@ -0,0 +1,146 @@
+"""Tests for the submission queue, driven against a local stand-in server."""
+
+from pathlib import Path
+
+import pytest
+from conftest import TOO_RECENT, WRONG_ANSWER, FakeClock, StandInServer
+
+from aoc2025.store import lock_file, unlock_file
+from aoc2025.submissions import (
+    DEFAULT_COOLDOWN,
+    MIN_INTERVAL,
+    AlreadyDrainingError,
+    SubmissionQueue,
+)
+
+
+def make_queue(tmp_path: Path, clock: FakeClock) -> SubmissionQueue:
+    return SubmissionQueue(tmp_path / "queue.json", clock=clock)
+
+
+def test_drain_submits_pending_answers_in_order(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    queue = make_queue(tmp_path, clock)
+    queue.enqueue(1, 1, 10)
+    queue.enqueue(1, 2, " 20 ")
+    waits: list[float] = []
+
+    finished = queue.drain(
+        aoc_server.client(clock=clock, sleep=clock.sleep),
+        on_wait=lambda entry, delay: waits.append(delay),
+    )
+
+    assert [(e.part, e.answer, e.status) for e in finished] == [
+        (1, "10", "correct"),
+        (2, "20", "correct"),
+    ]
+    assert [p.body for p in aoc_server.posts()] == [
+        "level=1&answer=10",
+        "level=2&answer=20",
+    ]
+    # Even right answers are spaced out
+    assert waits == clock.sleeps == [MIN_INTERVAL]
+    assert queue.drain(aoc_server.client(clock=clock, sleep=clock.sleep)) == []
+
+
+def test_enqueue_skips_answers_already_judged(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    queue = make_queue(tmp_path, clock)
+    client = aoc_server.client(clock=clock, sleep=clock.sleep)
+    aoc_server.verdicts = [WRONG_ANSWER.format("low")]
+
+    first = queue.enqueue(3, 1, 100)
+    assert queue.enqueue(3, 1, "100") == first
+    assert len(queue.state().submissions) == 1
+
+    queue.drain(client)
+    assert queue.enqueue(3, 1, 100).status == "wrong"
+
+    queue.enqueue(3, 1, 150)
+    queue.drain(client)
+    solved = queue.enqueue(3, 1, 200)
+    assert (solved.answer, solved.status) == ("150", "correct")
+
+    assert [p.body for p in aoc_server.posts()] == [
+        "level=1&answer=100",
+        "level=1&answer=150",
+    ]
+
+
+def test_wrong_answer_starts_a_cooldown(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    queue = make_queue(tmp_path, clock)
+    aoc_server.verdicts = [WRONG_ANSWER.format("high")]
+    queue.enqueue(5, 1, 999)
+    queue.enqueue(5, 1, 998)
+
+    finished = queue.drain(aoc_server.client(clock=clock, sleep=clock.sleep))
+
+    assert [e.status for e in finished] == ["wrong", "correct"]
+    assert clock.sleeps == [DEFAULT_COOLDOWN]
+
+
+def test_answering_too_soon_backs_off_and_retries(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    queue = make_queue(tmp_path, clock)
+    aoc_server.verdicts = [TOO_RECENT]
+    queue.enqueue(2, 2, 42)
+    start = clock.now
+
+    [entry] = queue.drain(aoc_server.client(clock=clock, sleep=clock.sleep))
+
+    assert (entry.status, entry.attempts) == ("correct", 2)
+    assert clock.sleeps == [30.0]
+    assert entry.submitted_at == start + 30.0
+    assert len(aoc_server.posts()) == 2
+    assert queue.state().not_before == start + 30.0 + MIN_INTERVAL
+
+
+def test_right_answer_rejects_other_guesses(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    queue = make_queue(tmp_path, clock)
+    queue.enqueue(4, 1, 7)
+    queue.enqueue(4, 1, 8)
+    queue.enqueue(4, 2, 9)
+
+    queue.drain(aoc_server.client(clock=clock, sleep=clock.sleep))
+
+    assert [(e.answer, e.status) for e in queue.state().submissions] == [
+        ("7", "correct"),
+        ("8", "rejected"),
+        ("9", "correct"),
+    ]
+    assert len(aoc_server.posts()) == 2
+
+
+def test_remove_drops_only_pending_answers(tmp_path: Path, clock: FakeClock):
+    queue = make_queue(tmp_path, clock)
+    queue.enqueue(6, 1, 1)
+    queue.enqueue(6, 2, 2)
+    queue.enqueue(7, 1, 3)
+
+    assert queue.remove(6, part=2) == 1
+    assert queue.remove(6) == 1
+    assert [e.day for e in queue.state().submissions] == [7]
+
+
+def test_only_one_process_drains(
+    tmp_path: Path, clock: FakeClock, aoc_server: StandInServer
+):
+    queue = make_queue(tmp_path, clock)
+    queue.enqueue(1, 1, 10)
+
+    with (tmp_path / "queue.drain.lock").open("a+") as lock:
+        lock_file(lock)
+        try:
+            with pytest.raises(AlreadyDrainingError):
+                queue.drain(aoc_server.client(clock=clock, sleep=clock.sleep))
+        finally:
+            unlock_file(lock)
+
+    assert aoc_server.posts() == []